@@ -0,0 +1,75 @@
+"""
+Benchmark du solveur double mort (simulation.double_dummy)
+
+Résout des donnes complètes aléatoires de 32 cartes et affiche, pour
+chacune, le temps, le nombre de nœuds et le taux de succès de la table
+de transposition. Chaque résolution est plafonnée à --max-nodes nœuds ;
+les donnes qui l'atteignent (en général celles où un camp tient presque
+tous les atouts) sont marquées inexactes avec l'intervalle de leur valeur.
+
+Sort en erreur si une donne dépasse --budget, ou si plus de --max-inexact
+des donnes sont inexactes.
+
+Usage : python benchmarks/bench_double_dummy.py [--deals N] [--seed N] [--budget MS] [--max-nodes N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models.deck import Deck  # noqa: E402
+from simulation.double_dummy import DoubleDummySolver, DEFAULT_MAX_NODES, DEFAULT_TT_BITS  # noqa: E402
+
+DEFAULT_BUDGET_MS = 1000.0
+# Proportion maximale de donnes arrêtées par --max-nodes
+DEFAULT_MAX_INEXACT = 0.25
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deals", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tt-bits", type=int, default=DEFAULT_TT_BITS)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help="temps maximal par donne, en ms")
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES,
+                        help="nœuds au plus par donne (0 : pas de limite)")
+    parser.add_argument("--max-inexact", type=float, default=DEFAULT_MAX_INEXACT,
+                        help="proportion maximale de donnes inexactes")
+    args = parser.parse_args()
+
+    deals = Deck.hand_masks(Deck.split_hands(Deck.deal_batch(args.deals, args.seed)))
+    solver = DoubleDummySolver(args.tt_bits, args.max_nodes or None)
+    timings = []
+    inexact = 0
+    for number, deal in enumerate(deals, 1):
+        hands = [int(mask) for mask in deal]
+        trump = number % 4
+        start = time.perf_counter()
+        result = solver.solve(hands, trump, 0)
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        inexact += not result.exact
+        bounds = "" if result.exact else f"  inexacte, équipe 0 entre {result.bounds[0]} et {result.bounds[1]}"
+        print(f"donne {number:3d} : {elapsed * 1000:8.1f} ms  {result.nodes:9d} nœuds  "
+              f"table {result.hit_rate:5.1%}  points {result.points}{bounds}")
+    worst = max(timings) * 1000
+    p95 = statistics.quantiles(timings, n=20)[-1] * 1000 if len(timings) > 1 else worst
+    print(f"\nmédiane {statistics.median(timings) * 1000:.1f} ms, p95 {p95:.1f} ms, max {worst:.1f} ms ; "
+          f"{inexact} donne(s) inexacte(s) sur {len(timings)}")
+    failures = []
+    if worst > args.budget:
+        failures.append(f"donne la plus lente : {worst:.1f} ms, au-delà du budget de {args.budget:.0f} ms")
+    if inexact > args.max_inexact * len(timings):
+        failures.append(f"{inexact} donne(s) inexacte(s) sur {len(timings)}, "
+                        f"plus de {args.max_inexact:.0%} (--max-nodes {args.max_nodes})")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
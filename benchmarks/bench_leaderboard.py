@@ -0,0 +1,255 @@
+"""
+Benchmark du classement en direct (controllers.leaderboard)
+
+Sur un tournoi synthétique, valide --results résultats un par un et mesure
+par résultat :
+- la comparaison complète qu'effectuait la vue du classement (relecture de
+  toutes les équipes et comparaison ligne à ligne) ;
+- la publication des changements par le flux, puis leur relève et leur
+  application par --subscribers abonnés ;
+- le rafraîchissement d'une vue du classement (modèle, délégué et
+  table affichée), si PySide6 est disponible.
+Les mêmes mesures sont faites sur un tournoi --scale fois plus petit : le
+coût par résultat de la publication ne doit guère dépendre du nombre
+d'équipes (O(changements · log N)).
+
+Puis démarre server.score_server avec des écrans abonnés en WebSocket
+(/leaderboard/ws) pendant que des capitaines saisissent leurs scores, et
+vérifie que chaque écran reconstitue exactement le classement.
+
+Sort en erreur si un abonné diverge du classement, si le coût moyen par
+résultat du flux et des abonnés dépasse --budget, ou si le coût médian de
+la publication sur le grand tournoi dépasse --max-ratio fois celui du petit.
+
+Usage : QT_QPA_PLATFORM=offscreen python benchmarks/bench_leaderboard.py [--teams 4096] [--results 200]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from controllers.tournament_controller import TournamentController  # noqa: E402
+from server.score_client import WebSocketClient, simulate  # noqa: E402
+from server.score_server import ScoreServer, apply_to, tables_of  # noqa: E402
+
+DEFAULT_BUDGET_MS = 2.0
+# Rapport maximal des coûts médians de publication entre le grand et le
+# petit tournoi : log N n'y ajoute qu'un facteur 1,3 pour --scale 8
+DEFAULT_MAX_RATIO = 2.0
+
+
+def scheduled(num_teams: int) -> TournamentController:
+    controller = TournamentController()
+    controller.import_teams((line, [f"Équipe {line}", f"J{line}A", f"J{line}B"])
+                            for line in range(1, num_teams + 1))
+    controller.start_tournament()
+    return controller
+
+
+def replay(ranking: List[str], update: dict):
+    """Applique une mise à jour décodée du JSON (voir controllers.leaderboard)"""
+    if update["full"]:
+        ranking.clear()
+    for change in sorted(update["changes"], key=lambda change: change["previous"], reverse=True):
+        if change["previous"]:
+            del ranking[change["previous"] - 1]
+    for change in update["changes"]:
+        if change["rank"]:
+            ranking.insert(change["rank"] - 1, change["name"])
+
+
+# =====================
+# Coût par résultat
+# =====================
+def bench_refresh(num_teams: int, num_results: int, num_subscribers: int, seed: int, app) -> dict:
+    """
+    Durées moyennes par résultat (en secondes), durée médiane de la
+    publication seule et nombre moyen de changements
+    """
+    rng = random.Random(seed)
+    controller = scheduled(num_teams)
+    games = rng.sample(list(controller.games), min(num_results, len(controller.games)))
+    feed = controller.leaderboard
+    subscriptions = [feed.subscribe() for _ in range(num_subscribers)]
+    rankings: List[List[str]] = [[] for _ in subscriptions]
+    for subscription, ranking in zip(subscriptions, rankings):
+        for update in subscription.take():
+            replay(ranking, update.to_json())
+
+    view = model = None
+    if app is not None:
+        from views.tournament_views.standings_model import StandingsModel, create_standings_table
+        model = StandingsModel()
+        view = create_standings_table(model)
+        view.resize(1000, 800)
+        view.show()
+        model.follow(feed)
+        app.processEvents()
+
+    # Publication chronométrée à part de la validation
+    feed.close()
+    full = publish = display = 0.0
+    changes = 0
+    publications: List[float] = []
+    displayed = [(standing.name, standing.points) for standing in controller.standings]
+    for game in games:
+        controller.validate_match(game.id, (rng.randint(0, 162), rng.randint(0, 162)))
+        start = time.perf_counter()
+        feed.publish()
+        publications.append(time.perf_counter() - start)
+        for subscription, ranking in zip(subscriptions, rankings):
+            for update in subscription.take():
+                replay(ranking, update.to_json())
+                changes += len(update.changes) if subscription is subscriptions[0] else 0
+        publish += time.perf_counter() - start
+        # Ancienne vue : tout le classement relu et comparé
+        start = time.perf_counter()
+        rows = [(standing.name, standing.points) for standing in controller.standings]
+        [rank for rank in range(len(rows)) if rows[rank] != displayed[rank]]
+        displayed = rows
+        full += time.perf_counter() - start
+        if app is not None:
+            start = time.perf_counter()
+            app.processEvents()
+            display += time.perf_counter() - start
+
+    truth = [standing.name for standing in controller.standings]
+    diverged = sum(ranking != truth for ranking in rankings)
+    if model is not None:
+        diverged += [model.index(row).data() for row in range(model.rowCount())] != truth
+        model.unfollow()
+        view.deleteLater()
+    return {"full": full / len(games), "publish": publish / len(games), "display": display / len(games),
+            "feed": statistics.median(publications), "changes": changes / len(games), "diverged": diverged}
+
+
+def bench_backpressure(num_teams: int, seed: int) -> Optional[str]:
+    """Un abonné qui ne relève pas sa file reçoit le classement complet, pas des milliers de mises à jour"""
+    rng = random.Random(seed)
+    controller = scheduled(num_teams)
+    subscription = controller.leaderboard.subscribe(max_pending=8)
+    subscription.take()
+    for game in list(controller.games)[:200]:
+        controller.validate_match(game.id, (rng.randint(0, 162), rng.randint(0, 162)))
+    updates = subscription.take()
+    if len(updates) != 1 or not updates[0].full:
+        return f"abonné en retard : {len(updates)} mise(s) à jour au lieu du classement complet"
+    ranking: List[str] = []
+    replay(ranking, updates[0].to_json())
+    if ranking != [standing.name for standing in controller.standings]:
+        return "abonné en retard : classement complet erroné"
+    return None
+
+
+# =====================
+# Écrans en WebSocket
+# =====================
+async def bench_websocket(num_teams: int, captains: int, screens: int, seed: int) -> List[str]:
+    controller = scheduled(num_teams)
+    feed = controller.leaderboard
+    server = ScoreServer(apply_to(controller), "127.0.0.1", 0, leaderboard=feed)
+    server.set_tables(tables_of(controller.games))
+    await server.start()
+    host, port = server.address
+    clients = [await WebSocketClient.connect(host, port, "/leaderboard/ws") for _ in range(screens)]
+    rankings: List[List[str]] = [[] for _ in clients]
+    versions = [0] * screens
+    messages = [0] * screens
+
+    async def watch(index: int):
+        while versions[index] < feed.version:
+            updates = await clients[index].receive()
+            if updates is None:
+                return
+            messages[index] += 1
+            for update in updates:
+                replay(rankings[index], update)
+                versions[index] = update["version"]
+
+    failures = []
+    try:
+        await asyncio.gather(*(watch(index) for index in range(screens)))
+        report = await simulate(host, port, server.code, captains, 0.5, seed)
+        await asyncio.wait_for(asyncio.gather(*(watch(index) for index in range(screens))), 10)
+    except asyncio.TimeoutError:
+        failures.append("écrans WebSocket : mises à jour manquantes après 10 s")
+        report = None
+    finally:
+        for client in clients:
+            await client.close()
+        await server.close()
+
+    truth = [standing.name for standing in controller.standings]
+    diverged = sum(ranking != truth for ranking in rankings)
+    if report is not None:
+        print(f"{screens} écran(s) WebSocket, {captains} capitaines : {report.summary()}")
+        print(f"  {feed.version} version(s) publiée(s), {max(messages)} message(s) au plus par écran")
+        failures += report.errors[:10]
+    if diverged:
+        failures.append(f"{diverged} écran(s) WebSocket divergent du classement")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=4096)
+    parser.add_argument("--results", type=int, default=200, help="résultats validés un par un")
+    parser.add_argument("--subscribers", type=int, default=20, help="abonnés en mémoire")
+    parser.add_argument("--scale", type=int, default=8, help="rapport de taille du petit tournoi")
+    parser.add_argument("--screens", type=int, default=20, help="écrans abonnés en WebSocket")
+    parser.add_argument("--captains", type=int, default=300, help="saisies simultanées")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help="coût moyen maximal du flux par résultat, en ms")
+    parser.add_argument("--max-ratio", type=float, default=DEFAULT_MAX_RATIO,
+                        help="rapport maximal du coût de publication entre le grand et le petit tournoi")
+    parser.add_argument("--no-gui", action="store_true", help="sans la vue Qt")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = None
+    if not args.no_gui:
+        try:
+            from PySide6.QtWidgets import QApplication
+            app = QApplication.instance() or QApplication(sys.argv)
+        except ImportError:
+            print("PySide6 absent : vue du classement ignorée", file=sys.stderr)
+
+    failures = []
+    publications = []
+    for num_teams in (max(2, args.teams // args.scale), args.teams):
+        result = bench_refresh(num_teams, args.results, args.subscribers, args.seed, app)
+        publications.append(result["feed"])
+        display = f", vue {result['display'] * 1000:.2f} ms" if app is not None else ""
+        print(f"{num_teams:6d} équipes : comparaison complète {result['full'] * 1000:.2f} ms, "
+              f"flux et {args.subscribers} abonnés {result['publish'] * 1000:.2f} ms{display} "
+              f"par résultat ({result['changes']:.1f} changements en moyenne), "
+              f"publication seule {result['feed'] * 1e6:.0f} µs (médiane)")
+        if result["diverged"]:
+            failures.append(f"{result['diverged']} abonné(s) divergent du classement ({num_teams} équipes)")
+        if num_teams == args.teams and result["publish"] * 1000 > args.budget:
+            failures.append(f"flux : {result['publish'] * 1000:.2f} ms par résultat, "
+                            f"au-delà du budget de {args.budget:.1f} ms")
+    ratio = publications[1] / publications[0]
+    print(f"publication : {ratio:.2f} fois plus coûteuse sur {args.scale} fois plus d'équipes")
+    if ratio > args.max_ratio:
+        failures.append(f"publication : coût multiplié par {ratio:.2f} avec {args.scale} fois plus "
+                        f"d'équipes (au plus {args.max_ratio:.1f})")
+
+    failure = bench_backpressure(max(2, args.teams // args.scale), args.seed)
+    if failure:
+        failures.append(failure)
+    failures += asyncio.run(bench_websocket(args.teams, args.captains, args.screens, args.seed))
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark du moteur de règles (models.rules)
+
+Mesure le coût par appel de legal_moves() sur des positions réelles
+tirées de donnes aléatoires, ainsi que le coût d'une donne complète.
+
+Usage : python benchmarks/bench_rules.py [--positions N] [--rounds N]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models.card import mask_to_indices  # noqa: E402
+from models.deck import Deck, IndexDeck  # noqa: E402
+from models.rules import BeloteRound, NUM_PLAYERS, legal_moves  # noqa: E402
+
+
+def random_round(deck: IndexDeck, rng: random.Random) -> BeloteRound:
+    """Distribue une donne aléatoire avec un atout et un preneur au hasard"""
+    deck.shuffle()
+    hands = [int(mask) for mask in Deck.hand_masks(deck.hands)]
+    return BeloteRound(hands, rng.randrange(4), 0, rng.randrange(NUM_PLAYERS))
+
+
+def collect_positions(num_positions: int, seed: int):
+    """Joue des donnes aléatoires et enregistre les arguments de legal_moves()"""
+    rng = random.Random(seed)
+    deck = IndexDeck(seed=seed)
+    positions = []
+    while len(positions) < num_positions:
+        game = random_round(deck, rng)
+        while not game.is_over:
+            positions.append((
+                game.hands[game.current], game.lead_suit, game.trump, game.winning_card,
+                bool(game.trick) and (game.winning_seat ^ game.current) == 2,
+            ))
+            game.play(rng.choice(mask_to_indices(game.legal_moves())))
+    return positions[:num_positions]
+
+
+def play_rounds(num_rounds: int, seed: int):
+    """Joue num_rounds donnes complètes en choisissant la première carte légale"""
+    rng = random.Random(seed)
+    deck = IndexDeck(seed=seed)
+    for _ in range(num_rounds):
+        game = random_round(deck, rng)
+        while not game.is_over:
+            moves = game.legal_moves()
+            game.play((moves & -moves).bit_length() - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    positions = collect_positions(args.positions, args.seed)
+    elapsed = min(timeit.repeat(
+        lambda: [legal_moves(*p) for p in positions], number=1, repeat=5,
+    ))
+    print(f"legal_moves : {elapsed / len(positions) * 1e9:8.0f} ns/appel "
+          f"({len(positions)} positions)")
+
+    elapsed = min(timeit.repeat(lambda: play_rounds(args.rounds, args.seed), number=1, repeat=3))
+    print(f"donne complète : {elapsed / args.rounds * 1e6:8.1f} µs/donne "
+          f"({args.rounds} donnes, 32 cartes)")
+
+
+if __name__ == "__main__":
+    main()
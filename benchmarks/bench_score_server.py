@@ -0,0 +1,82 @@
+"""
+Benchmark du serveur de saisie des scores à distance
+
+Démarre server.score_server sur un tournoi synthétique en mémoire, puis le
+client de substitution (server.score_client) fait saisir en même temps le
+score de --captains tables, moitié en HTTP, moitié par WebSocket. Vérifie
+que chaque saisie acceptée est bien validée dans le contrôleur et que les
+saisies ont été regroupées en lots ; sort en erreur si une saisie échoue
+ou si le 99e centile de latence dépasse --budget.
+
+Usage : python benchmarks/bench_score_server.py [--teams 1024] [--captains 500] [--budget 500]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from controllers.tournament_controller import TournamentController  # noqa: E402
+from server.score_client import simulate  # noqa: E402
+from server.score_server import BATCH_WINDOW, ScoreServer, apply_to, tables_of  # noqa: E402
+
+DEFAULT_BUDGET_MS = 500
+
+
+async def run(args) -> int:
+    controller = TournamentController()
+    controller.import_teams((line, [f"Équipe {line}", f"J{line}A", f"J{line}B"])
+                            for line in range(1, args.teams + 1))
+    controller.start_tournament()
+    tables = tables_of(controller.games)
+
+    batches = []
+    apply_batch = apply_to(controller)
+
+    async def counting_apply(results):
+        batches.append(len(results))
+        return await apply_batch(results)
+
+    server = ScoreServer(counting_apply, "127.0.0.1", 0, args.window / 1000)
+    server.set_tables(tables)
+    await server.start()
+    try:
+        report = await simulate("127.0.0.1", server.address[1], server.code, args.captains, args.websocket,
+                                args.seed)
+    finally:
+        await server.close()
+
+    print(f"{args.teams} équipes, {len(tables)} tables, {args.captains} capitaines simultanés, "
+          f"fenêtre de regroupement {args.window:.0f} ms")
+    print(report.summary())
+    print(f"{len(batches)} lot(s) appliqué(s), {max(batches, default=0)} saisie(s) au plus par lot")
+
+    failures = list(report.errors[:10])
+    games = {game.id: game for game in controller.games}
+    missing = sum(not games[tables[key].game_id].is_played for key in report.tables) if not report.errors else 0
+    if missing:
+        failures.append(f"{missing} saisie(s) acceptée(s) mais absente(s) du contrôleur")
+    p99 = report.percentile(0.99) * 1000
+    if p99 > args.budget:
+        failures.append(f"latence p99 de {p99:.1f} ms au-delà du budget de {args.budget:.0f} ms")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=1024)
+    parser.add_argument("--captains", type=int, default=500, help="saisies simultanées")
+    parser.add_argument("--websocket", type=float, default=0.5, help="part des saisies par WebSocket")
+    parser.add_argument("--window", type=float, default=BATCH_WINDOW * 1000,
+                        help="fenêtre de regroupement des saisies, en ms")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS, help="latence p99 maximale, en ms")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Budget de démarrage de l'application graphique
+
+Lance l'application dans des processus neufs (démarrage à froid de
+l'interpréteur, plateforme Qt « offscreen », base vide) et mesure, depuis le
+lancement du processus :
+- le premier affichage de la fenêtre principale ;
+- la fin du démarrage (contrôleur chargé, MainWindow.ready).
+
+La même mesure sur une fenêtre Qt vide donne le coût incompressible de
+l'interpréteur et de PySide6 : le budget (--budget) porte sur le surcoût
+de l'application au premier affichage, ce qui le rend peu dépendant de la
+machine. Le script vérifie aussi qu'aucun module chargé après coup
+(DEFERRED_MODULES) n'est importé avant le premier affichage, et sort en
+erreur si l'une des deux conditions n'est pas tenue.
+
+Usage : python benchmarks/bench_startup.py [--repeat 5] [--budget 40]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Surcoût maximal de l'application au premier affichage, en millisecondes
+DEFAULT_BUDGET_MS = 40
+# Préfixes des modules qui ne doivent être importés qu'après le premier affichage
+DEFERRED_MODULES = (
+    "controllers.",
+    "storage.",
+    "views.tournament_views.",
+    "views.diagnostics_view",
+    "views.view_manager",
+)
+# Arrêt d'un processus mesuré qui ne termine pas son démarrage
+CHILD_TIMEOUT = 60
+
+
+# =====================
+# Processus mesuré
+# =====================
+def run_child(bare: bool):
+    """
+    Démarre l'application (ou une fenêtre vide) et écrit les instants mesurés
+    sur la sortie standard, en JSON
+    """
+    sys.path.insert(0, SRC)
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication, QLabel, QMainWindow
+
+    marks = {}
+    paint = QEvent.Paint
+
+    if bare:
+        app = QApplication(sys.argv[:1])
+        window = QMainWindow()
+        window.setCentralWidget(QLabel("Bélote"))
+        window.showMaximized()
+    else:
+        from main import launch
+        app, window = launch(sys.argv[:1])
+
+    def done():
+        marks["ready"] = time.time()
+        # Laisse s'exécuter ce que le démarrage a mis en file, puis quitte
+        QTimer.singleShot(0, app.quit)
+
+    class FirstPaint(QObject):
+        def eventFilter(self, watched, event):
+            if "first_paint" not in marks and event.type() == paint:
+                marks["first_paint"] = time.time()
+                marks["modules"] = sorted(name for name in sys.modules if name.startswith(DEFERRED_MODULES))
+                if bare:
+                    QTimer.singleShot(0, done)
+            return False
+
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+    if not bare:
+        window.ready.connect(done)
+    app.exec()
+    print(json.dumps(marks))
+
+
+# =====================
+# Mesure
+# =====================
+def measure(bare: bool, database: str) -> dict:
+    """Un démarrage à froid ; durées en secondes depuis le lancement du processus"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", BELOTE_DB=database)
+    env.pop("BELOTE_INSTRUMENT", None)
+    command = [sys.executable, os.path.abspath(__file__), "--child"] + (["--bare"] if bare else [])
+    start = time.time()
+    completed = subprocess.run(command, env=env, capture_output=True, text=True,
+                               timeout=CHILD_TIMEOUT, check=True)
+    marks = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {
+        "first_paint": marks["first_paint"] - start,
+        "ready": marks["ready"] - start,
+        "modules": marks["modules"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help="surcoût maximal de l'application au premier affichage, en ms")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--bare", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.bare)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "startup.db")
+        # Une exécution à blanc remplit le cache disque et crée la base
+        measure(False, database)
+        bare, app = [], []
+        # Mesures alternées : une variation de charge touche les deux séries
+        for _ in range(args.repeat):
+            bare.append(measure(True, database))
+            app.append(measure(False, database))
+
+    floor = min(run["first_paint"] for run in bare)
+    first_paint = min(run["first_paint"] for run in app)
+    ready = min(run["ready"] for run in app)
+    overhead = (first_paint - floor) * 1000
+    print(f"{'fenêtre Qt vide':32s} {floor * 1000:8.1f} ms")
+    print(f"{'premier affichage':32s} {first_paint * 1000:8.1f} ms")
+    print(f"{'démarrage terminé':32s} {ready * 1000:8.1f} ms")
+    print(f"{'surcoût au premier affichage':32s} {overhead:8.1f} ms  (budget {args.budget:.0f} ms)")
+
+    failures = []
+    if overhead > args.budget:
+        failures.append(f"surcoût de {overhead:.1f} ms au-delà du budget de {args.budget:.0f} ms")
+    early = sorted({name for run in app for name in run["modules"]})
+    if early:
+        failures.append("modules importés avant le premier affichage : " + ", ".join(early))
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
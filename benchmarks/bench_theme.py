@@ -0,0 +1,251 @@
+"""
+Benchmark de la feuille de style partagée (views.theme)
+
+Compare, pour des cartes de match et de classement identiques :
+- avant : chaque widget reçoit sa propre chaîne CSS, reformatée et
+  réanalysée par Qt à chaque création et à chaque changement d'état ;
+- après : une seule feuille posée sur l'application, l'état étant une
+  propriété dynamique, le widget étant repoli (voir _set_state).
+
+Mesure la construction du classement et la validation d'une période
+(passage de toutes les cartes d'une période à l'état « validé »), puis la
+validation d'une période et la construction du classement dans les vues
+actuelles (modèle + délégué).
+
+Usage : QT_QPA_PLATFORM=offscreen python benchmarks/bench_theme.py [--teams N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from PySide6.QtCore import QCoreApplication, QEvent  # noqa: E402
+from PySide6.QtWidgets import (  # noqa: E402
+    QApplication, QFrame, QHBoxLayout, QLabel, QPushButton, QSpinBox, QVBoxLayout, QWidget
+)
+
+from controllers.tournament_controller import TournamentController  # noqa: E402
+from views.theme import STYLESHEET  # noqa: E402
+
+# Règles des cartes du benchmark, pour la variante « après » ; l'application
+# dessine désormais ces cartes avec un délégué (voir bench_matches_view)
+CARD_RULES = """
+QFrame#matchCard { background-color: #2a2a40; border-radius: 10px; border: 1px solid #3a3a5a; padding: 12px; }
+QFrame#matchCard[played="true"] { background-color: #2a4a2f; border: 1px solid #4a7a4a; }
+QPushButton#matchButton { background-color: #66cc66; color: white; border-radius: 8px; font-weight: bold; }
+QPushButton#matchButton[played="true"] { background-color: #cc6666; }
+QFrame#standingsCard { background-color: #2a2a40; border-radius: 10px; border: 2px solid #3a3a5a; padding: 12px; }
+QFrame#standingsCard[podium="1"] { background-color: #3a5a2a; border-color: #5a7a4a; }
+QFrame#standingsCard[podium="2"] { background-color: #3a4a5a; border-color: #5a6a7a; }
+QFrame#standingsCard[podium="3"] { background-color: #5a3a2a; border-color: #7a5a4a; }
+QFrame#standingsCard QLabel { background-color: transparent; font-weight: bold; }
+QLabel#rankLabel { font-size: 18px; color: #66ccff; }
+QLabel#teamNameLabel { font-size: 15px; color: white; }
+QLabel#scoreLabel { font-size: 16px; color: #ffcc66; }
+"""
+
+LEGACY_CARD_CSS = """
+#matchCard {{ background-color: {background}; border-radius: 10px; border: 1px solid {border}; padding: 12px; }}
+"""
+LEGACY_BUTTON_CSS = """
+QPushButton {{ background-color: {color}; color: white; border-radius: 8px; font-weight: bold; }}
+QPushButton:hover {{ background-color: {hover}; }}
+"""
+LEGACY_STANDINGS_CSS = """
+#standingsCard {{ background-color: {background}; border-radius: 10px; border: 2px solid {border}; padding: 12px; }}
+"""
+_PODIUM = {1: ("#3a5a2a", "#5a7a4a"), 2: ("#3a4a5a", "#5a6a7a"), 3: ("#5a3a2a", "#7a5a4a")}
+
+
+def _set_state(widget: QWidget, name: str, value):
+    """
+    Change une propriété dynamique lue par la feuille de style
+
+    Le widget n'est repoli que si la valeur change : aucune feuille n'est
+    analysée, seules les règles déjà compilées sont réévaluées.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class _MatchCard(QFrame):
+    """Carte de match réduite à ses widgets stylés"""
+
+    def __init__(self, legacy: bool):
+        super().__init__()
+        self.setObjectName("matchCard")
+        layout = QHBoxLayout(self)
+        self.labels = [QLabel("Table"), QLabel("Équipe 1"), QLabel("vs"), QLabel("Équipe 2")]
+        self.spinboxes = [QSpinBox(), QSpinBox()]
+        self.button = QPushButton("✓ Valider")
+        self.button.setObjectName("matchButton")
+        for widget in (*self.labels, *self.spinboxes, self.button):
+            layout.addWidget(widget)
+        if legacy:
+            self.setStyleSheet(LEGACY_CARD_CSS.format(background="#2a2a40", border="#3a3a5a"))
+            for label in self.labels:
+                label.setStyleSheet("font-weight:bold; color:#bbbbff;")
+            self.button.setStyleSheet(LEGACY_BUTTON_CSS.format(color="#66cc66", hover="#55bb55"))
+
+    def set_played_legacy(self):
+        self.setStyleSheet(LEGACY_CARD_CSS.format(background="#2a4a2f", border="#4a7a4a"))
+        self.button.setStyleSheet(LEGACY_BUTTON_CSS.format(color="#cc6666", hover="#bb5555"))
+        self.button.setText("✗ Annuler")
+
+    def set_played_themed(self):
+        _set_state(self, "played", True)
+        _set_state(self.button, "played", True)
+        self.button.setText("✗ Annuler")
+
+
+def _standings_card(rank: int, legacy: bool) -> QFrame:
+    card = QFrame()
+    card.setObjectName("standingsCard")
+    layout = QHBoxLayout(card)
+    labels = ((f"#{rank}", "rankLabel", "font-weight:bold; font-size: 18px; color:#66ccff;"),
+              (f"Team {rank}", "teamNameLabel", "font-weight:bold; font-size: 15px; color: white;"),
+              ("0 pts", "scoreLabel", "font-weight:bold; font-size: 16px; color:#ffcc66;"))
+    if legacy:
+        background, border = _PODIUM.get(rank, ("#2a2a40", "#3a3a5a"))
+        card.setStyleSheet(LEGACY_STANDINGS_CSS.format(background=background, border=border))
+    else:
+        card.setProperty("podium", rank if rank <= len(_PODIUM) else 0)
+    for text, name, css in labels:
+        label = QLabel(text)
+        if legacy:
+            label.setStyleSheet(css)
+        else:
+            label.setObjectName(name)
+        layout.addWidget(label)
+    return card
+
+
+def _discard(app: QApplication, widgets):
+    """Détruit les widgets tout de suite, pour que chaque mesure parte d'une fenêtre vide"""
+    for widget in widgets:
+        widget.setParent(None)
+        widget.deleteLater()
+    # processEvents() ne traite pas les destructions différées
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+
+
+def _timed(app: QApplication, build) -> float:
+    """Exécute build puis laisse Qt polir et dessiner ; retourne la durée en secondes"""
+    start = time.perf_counter()
+    build()
+    app.processEvents()
+    return time.perf_counter() - start
+
+
+def bench_period_validation(app: QApplication, container: QWidget, num_cards: int, legacy: bool) -> float:
+    layout = container.layout()
+    cards = [_MatchCard(legacy) for _ in range(num_cards)]
+    for card in cards:
+        layout.addWidget(card)
+    app.processEvents()
+    if legacy:
+        elapsed = _timed(app, lambda: [card.set_played_legacy() for card in cards])
+    else:
+        elapsed = _timed(app, lambda: [card.set_played_themed() for card in cards])
+    _discard(app, cards)
+    return elapsed
+
+
+def bench_standings_build(app: QApplication, container: QWidget, num_teams: int, legacy: bool) -> float:
+    layout = container.layout()
+    cards = []
+
+    def build():
+        for rank in range(1, num_teams + 1):
+            card = _standings_card(rank, legacy)
+            layout.addWidget(card)
+            cards.append(card)
+
+    elapsed = _timed(app, build)
+    _discard(app, cards)
+    return elapsed
+
+
+def bench_matches_view(app: QApplication, num_teams: int) -> float:
+    """Validation d'une période dans la vue actuelle (modèle + délégué)"""
+    from views.tournament_views.matches_model import MatchDelegate, MatchesTableModel
+    from PySide6.QtWidgets import QTableView
+
+    controller = TournamentController()
+    controller.import_teams((i, [f"Team {i}", f"P{i}A", f"P{i}B"]) for i in range(num_teams))
+    controller.start_tournament(1)
+    model = MatchesTableModel(controller)
+    controller.add_listener(lambda change: model.results_changed(change.game_ids))
+    table = QTableView()
+    table.setModel(model)
+    table.setItemDelegate(MatchDelegate(table))
+    table.resize(1000, 800)
+    table.show()
+    app.processEvents()
+    elapsed = _timed(app, model.validate_all)
+    _discard(app, [table])
+    return elapsed
+
+
+def bench_standings_view(app: QApplication, num_teams: int) -> float:
+    """Construction du classement dans la vue actuelle (modèle + délégué)"""
+    from views.tournament_views.standings_model import StandingsModel, create_standings_table
+
+    controller = TournamentController()
+    controller.import_teams((i, [f"Team {i}", f"P{i}A", f"P{i}B"]) for i in range(num_teams))
+    model = StandingsModel()
+    view = create_standings_table(model)
+    view.resize(1000, 800)
+    view.show()
+    app.processEvents()
+    elapsed = _timed(app, lambda: model.follow(controller.leaderboard))
+    _discard(app, [view])
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    container = QWidget()
+    QVBoxLayout(container)
+    container.resize(1000, 800)
+    container.show()
+
+    num_cards = args.teams // 2
+    results = {}
+    for legacy in (True, False):
+        if legacy:
+            app.setStyleSheet("")
+        else:
+            # Les cartes n'existent plus dans l'application : leurs règles sont
+            # ajoutées à la feuille partagée, toujours analysée une seule fois
+            app.setStyleSheet(STYLESHEET + CARD_RULES)
+        results[legacy] = (
+            min(bench_period_validation(app, container, num_cards, legacy) for _ in range(args.repeat)),
+            min(bench_standings_build(app, container, args.teams, legacy) for _ in range(args.repeat)),
+        )
+
+    for label, index in (("validation d'une période", 0), ("construction du classement", 1)):
+        before, after = results[True][index], results[False][index]
+        print(f"{label:28s} : avant {before * 1000:8.1f} ms   après {after * 1000:8.1f} ms   "
+              f"(× {before / after:.1f})  [{args.teams} équipes]")
+
+    elapsed = min(bench_matches_view(app, args.teams) for _ in range(args.repeat))
+    print(f"{'vue des matchs (modèle)':28s} : {elapsed * 1000:8.1f} ms pour {num_cards} matchs")
+    elapsed = min(bench_standings_view(app, args.teams) for _ in range(args.repeat))
+    print(f"{'vue du classement (modèle)':28s} : {elapsed * 1000:8.1f} ms pour {args.teams} équipes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+"""
+Suite de benchmarks des modèles, du contrôleur et des vues
+
+Mesure les chemins critiques à plusieurs tailles de tournoi :
+- models : Card.get_points_at_suit, construction, mélange et distribution d'un Deck ;
+- contrôleur : add_team, start_tournament et validate_match ;
+- vues : construction et premier affichage de MatchesView et StandingsView
+  avec la plateforme Qt « offscreen » (ignorées si PySide6 est absent).
+
+Chaque mesure est la meilleure de --repeat séries ; une série répète
+l'opération autant de fois qu'il faut pour durer au moins MIN_SAMPLE_TIME,
+si bien que les opérations de quelques microsecondes ne sont pas noyées
+dans la résolution de l'horloge et les interruptions du système.
+
+Les résultats sont écrits en JSON (--output). Avec --baseline, chaque mesure
+est comparée à celle d'une exécution précédente : le script sort en erreur
+si l'une d'elles est plus lente que la tolérance, ce qui permet de bloquer
+une régression (d'échelle notamment) avant un déploiement.
+
+La vitesse d'une machine partagée varie d'une minute à l'autre : juste
+avant chaque groupe de benchmarks, une boucle de calibration est mesurée
+de la même façon (séries d'au moins MIN_SAMPLE_TIME), qui donne un second
+rapport à la référence, corrigé de la vitesse de la machine. La boucle ne
+suit qu'à peu près les variations de vitesse du reste du code : un
+benchmark n'est trop lent que si ses deux rapports, brut et corrigé,
+dépassent la tolérance. Un benchmark trouvé trop lent est remesuré, avec
+son groupe, dans un nouveau processus (--retries fois au plus, en gardant
+la meilleure mesure) : seul un ralentissement qui persiste d'un processus
+à l'autre est une régression.
+
+La correction ne rend pas deux machines différentes comparables : la
+référence du dépôt (benchmarks/baseline.json) est à réenregistrer avec
+--output sur le poste qui sert de point de contrôle.
+
+Usage :
+    python benchmarks/run_benchmarks.py --output benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json [--tolerance 0.2]
+"""
+import argparse
+import datetime
+import gc
+import json
+import math
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+# Les vues sont construites sans écran
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from controllers.tournament_controller import TournamentController  # noqa: E402
+from models.card import SUITS, Card  # noqa: E402
+from models.deck import Deck  # noqa: E402
+
+DEFAULT_SIZES = (8, 128, 1024, 8192)
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_RETRIES = 2
+# Nombre d'appels par mesure des micro-benchmarks de models
+MODEL_LOOPS = 10_000
+# Durée minimale d'une série de mesures, en secondes
+MIN_SAMPLE_TIME = 0.05
+# Format du fichier de résultats, à incrémenter si sa structure change
+FORMAT_VERSION = 2
+# Champs de environment() qui doivent être égaux pour comparer deux exécutions
+_SAME_MACHINE = ("python", "platform", "machine")
+
+
+@dataclass
+class Result:
+    """Mesure d'un benchmark à une taille donnée (None si elle n'en dépend pas)"""
+    name: str
+    size: Optional[int]
+    # Nombre d'opérations mesurées par appel, pour le coût unitaire
+    items: int
+    # Appels par série (voir measure)
+    loops: int
+    # Durées d'un appel, meilleure et médiane des séries
+    best: float
+    median: float
+    # Durée de la boucle de calibration mesurée avant le groupe (voir bench_calibration)
+    calibration: float = 0.0
+
+    @classmethod
+    def of(cls, name: str, size: Optional[int], items: int, measured: Tuple[int, List[float]]) -> "Result":
+        loops, timings = measured
+        return cls(name, size, items, loops, min(timings), statistics.median(timings))
+
+    @property
+    def key(self) -> str:
+        return self.name if self.size is None else f"{self.name}[{self.size}]"
+
+    @property
+    def per_item(self) -> float:
+        return self.best / self.items
+
+    @property
+    def relative(self) -> float:
+        """Durée en nombre de boucles de calibration, indépendante de la vitesse de la machine"""
+        return self.best / self.calibration
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+def measure(run: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None,
+            repeat: int = 3, teardown: Callable[[Any], None] = lambda _: None) -> Tuple[int, List[float]]:
+    """
+    Mesure run(setup()) en repeat séries ; setup et teardown(résultat de
+    run) ne sont pas chronométrés
+
+    Un premier appel, non compté, absorbe les coûts uniques (imports,
+    caches, premier polissage Qt). Le nombre d'appels par série est ensuite
+    doublé (ou extrapolé) jusqu'à ce qu'une série dure au moins
+    MIN_SAMPLE_TIME ; la série qui l'atteint compte parmi les repeat.
+
+    Returns:
+        Le nombre d'appels par série et la durée moyenne d'un appel de
+        chaque série, en secondes
+    """
+    _sample(run, setup, teardown, 1)
+    loops = 1
+    elapsed = _sample(run, setup, teardown, loops)
+    while elapsed < MIN_SAMPLE_TIME:
+        loops = max(2 * loops, math.ceil(loops * MIN_SAMPLE_TIME / elapsed)) if elapsed > 0 else 10 * loops
+        elapsed = _sample(run, setup, teardown, loops)
+    timings = [elapsed / loops]
+    for _ in range(repeat - 1):
+        timings.append(_sample(run, setup, teardown, loops) / loops)
+    return loops, timings
+
+
+def _sample(run: Callable[[Any], Any], setup: Callable[[], Any], teardown: Callable[[Any], None],
+            loops: int) -> float:
+    """Durée cumulée de loops appels de run, en secondes"""
+    elapsed = 0.0
+    for _ in range(loops):
+        state = setup()
+        # Comme timeit : le ramasse-miettes ne se déclenche pas au milieu d'une mesure
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = run(state)
+            elapsed += time.perf_counter() - start
+        finally:
+            gc.enable()
+        teardown(result)
+    return elapsed
+
+
+# =====================
+# Tournois synthétiques
+# =====================
+def team_rows(num_teams: int):
+    return [(line, [f"Team {line}", f"P{line}A", f"P{line}B"]) for line in range(1, num_teams + 1)]
+
+
+def registered(num_teams: int) -> TournamentController:
+    controller = TournamentController()
+    controller.import_teams(team_rows(num_teams))
+    return controller
+
+
+def scheduled(num_teams: int) -> TournamentController:
+    controller = registered(num_teams)
+    controller.start_tournament()
+    return controller
+
+
+def half_played(num_teams: int) -> TournamentController:
+    """Tournoi dont la moitié des matchs a un score, comme en cours d'événement"""
+    controller = scheduled(num_teams)
+    games = controller.games
+    controller.validate_matches((game.id, (index % 163, 162 - index % 163))
+                                for index, game in enumerate(games[:len(games) // 2]))
+    return controller
+
+
+def validate_all(controller: TournamentController):
+    for index, game in enumerate(list(controller.games)):
+        controller.validate_match(game.id, (index % 163, 162 - index % 163))
+
+
+# =====================
+# Benchmarks
+# =====================
+def bench_calibration(repeat: int) -> float:
+    """
+    Boucle Python fixe, indépendante du code de l'application
+
+    Returns:
+        La meilleure durée d'une boucle, en secondes
+    """
+    def loop(_):
+        total = 0
+        for value in range(100_000):
+            total += value
+        return total
+
+    _, timings = measure(loop, repeat=repeat)
+    return min(timings)
+
+
+def run_group(kind: str, size: Optional[int], repeat: int) -> List[Result]:
+    """
+    Mesure un groupe de benchmarks juste après la boucle de calibration
+
+    Args:
+        kind: "models", "controller" ou "views"
+        size: Le nombre d'équipes (None pour models)
+    """
+    calibration = bench_calibration(repeat)
+    if kind == "models":
+        results = bench_models(repeat)
+    elif kind == "controller":
+        results = bench_controller(size, repeat)
+    else:
+        results = bench_views([size], repeat)
+    for result in results:
+        result.calibration = calibration
+    return results
+
+
+def bench_models(repeat: int) -> List[Result]:
+    cards = [Card.from_index(index) for index in range(32)]
+    pairs = [(card, trump) for card in cards for trump in SUITS] * (MODEL_LOOPS // 128)
+
+    def points(_):
+        for card, trump in pairs:
+            card.get_points_at_suit(trump)
+
+    def construct(_):
+        for _ in range(MODEL_LOOPS // 10):
+            Deck(shuffled=False)
+
+    deck = Deck()
+
+    def shuffle(_):
+        for _ in range(MODEL_LOOPS // 10):
+            deck.shuffle()
+
+    full = list(Deck(shuffled=False).cards)
+
+    def deal(_):
+        for _ in range(MODEL_LOOPS // 10):
+            deck.cards = list(full)
+            for _ in range(4):
+                deck.deal(8)
+
+    return [
+        Result.of("card.get_points_at_suit", None, len(pairs), measure(points, repeat=repeat)),
+        Result.of("deck.construct", None, MODEL_LOOPS // 10, measure(construct, repeat=repeat)),
+        Result.of("deck.shuffle", None, MODEL_LOOPS // 10, measure(shuffle, repeat=repeat)),
+        Result.of("deck.deal", None, MODEL_LOOPS // 10, measure(deal, repeat=repeat)),
+    ]
+
+
+def bench_controller(size: int, repeat: int) -> List[Result]:
+    def add_teams(controller: TournamentController):
+        for _, (name, player1, player2) in team_rows(size):
+            controller.add_team(name, player1, player2)
+
+    num_games = len(scheduled(size).games)
+    return [
+        Result.of("controller.add_team", size, size,
+                  measure(add_teams, TournamentController, repeat)),
+        Result.of("controller.start_tournament", size, num_games,
+                  measure(lambda controller: controller.start_tournament(), lambda: registered(size), repeat)),
+        Result.of("controller.validate_match", size, num_games,
+                  measure(validate_all, lambda: scheduled(size), repeat)),
+    ]
+
+
+def bench_views(sizes: List[int], repeat: int) -> List[Result]:
+    """Construction et premier affichage des vues (nécessite PySide6)"""
+    try:
+        from PySide6.QtCore import QCoreApplication, QEvent
+        from PySide6.QtWidgets import QApplication, QWidget
+    except ImportError:
+        print("PySide6 absent : benchmarks des vues ignorés", file=sys.stderr)
+        return []
+    from views.theme import apply_theme
+    from views.tournament_views.matches_view import MatchesView
+    from views.tournament_views.standings_view import StandingsView
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    apply_theme(app)
+
+    class Host(QWidget):
+        """Remplace la fenêtre principale : les vues n'en lisent que le contrôleur"""
+
+        def __init__(self, controller: TournamentController):
+            super().__init__()
+            self.tournament_controller = controller
+            self.resize(1200, 800)
+
+    def build(view_class):
+        def run(host: Host) -> QWidget:
+            view = view_class(host)
+            view.resize(host.size())
+            view.show()
+            app.processEvents()
+            return view
+        return run
+
+    def discard(view: QWidget):
+        """Détruit la vue tout de suite, pour que chaque mesure parte d'un état vide"""
+        view.setParent(None)
+        view.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    results = []
+    for size in sizes:
+        controller = half_played(size)
+        host = Host(controller)
+        for name, view_class in (("views.matches_view", MatchesView), ("views.standings_view", StandingsView)):
+            results.append(Result.of(name, size, 1, measure(build(view_class), lambda: host, repeat, discard)))
+        host.deleteLater()
+    return results
+
+
+# =====================
+# Rapport et comparaison
+# =====================
+def _format_duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:9.2f} µs"
+    return f"{seconds * 1e3:9.2f} ms"
+
+
+def report(results: List[Result]):
+    print(f"{'benchmark':40s} {'appels':>7s} {'meilleur':>12s} {'médiane':>12s} {'par opération':>14s}")
+    for result in results:
+        print(f"{result.key:40s} {result.loops:7d} {_format_duration(result.best)} "
+              f"{_format_duration(result.median)}  {_format_duration(result.per_item)}")
+
+
+def reference_of(baseline: dict) -> Dict[str, Result]:
+    """Mesures de la référence, par clé de benchmark"""
+    reference = (Result(**entry) for entry in baseline["results"])
+    return {result.key: result for result in reference}
+
+
+def slower(results: List[Result], reference: Dict[str, Result], tolerance: float) -> List[str]:
+    """Clés des benchmarks plus lents que la référence au-delà de la tolérance (rapports brut et corrigé)"""
+    limit = 1 + tolerance
+    return [result.key for result in results if result.key in reference
+            and result.best > reference[result.key].best * limit
+            and result.relative > reference[result.key].relative * limit]
+
+
+def compare(results: List[Result], reference: Dict[str, Result], tolerance: float) -> List[str]:
+    """
+    Affiche les meilleures durées face à celles de la référence, avec les
+    rapports brut et corrigé de la vitesse de la machine
+
+    Returns:
+        Les clés des benchmarks plus lents que la référence au-delà de la tolérance
+    """
+    regressions = slower(results, reference, tolerance)
+    print(f"\n{'benchmark':40s} {'référence':>12s} {'actuel':>12s} {'brut':>8s} {'corrigé':>8s}")
+    for result in results:
+        before = reference.get(result.key)
+        if before is None:
+            print(f"{result.key:40s} {'—':>12s} {_format_duration(result.best)}")
+            continue
+        flag = "  RÉGRESSION" if result.key in regressions else ""
+        print(f"{result.key:40s} {_format_duration(before.best)} {_format_duration(result.best)} "
+              f"{result.best / before.best:7.2f}× {result.relative / before.relative:7.2f}×{flag}")
+    return regressions
+
+
+def environment() -> dict:
+    info = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+    try:
+        import PySide6
+        info["pyside6"] = PySide6.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="nombres d'équipes mesurés")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="bench_results.json", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", help="résultats de référence à comparer (fichier JSON)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="ralentissement toléré par rapport à la référence (0.2 = 20 %%)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="nouvelles mesures d'un benchmark trouvé trop lent")
+    parser.add_argument("--no-views", action="store_true", help="ne mesure pas les vues Qt")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("format") != FORMAT_VERSION:
+            print(f"{args.baseline} : format {baseline.get('format')} au lieu de {FORMAT_VERSION}, "
+                  f"référence à réenregistrer avec --output", file=sys.stderr)
+            sys.exit(1)
+        current = environment()
+        different = [field for field in _SAME_MACHINE if baseline["environment"].get(field) != current[field]]
+        if different:
+            print(f"attention : référence enregistrée avec un autre environnement ({', '.join(different)}) ; "
+                  f"les rapports ne mesurent pas que le code", file=sys.stderr)
+
+    # Groupes de benchmarks (voir run_group), remesurables séparément
+    groups: List[Tuple[str, Optional[int]]] = [("models", None)]
+    groups += [("controller", size) for size in args.sizes]
+    if not args.no_views:
+        groups += [("views", size) for size in args.sizes]
+    measured = [run_group(kind, size, args.repeat) for kind, size in groups]
+    results = [result for group_results in measured for result in group_results]
+
+    regressions = []
+    if baseline is not None:
+        reference = reference_of(baseline)
+        regressions = slower(results, reference, args.tolerance)
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            print(f"{len(regressions)} benchmark(s) trop lent(s), nouvelle mesure : {', '.join(regressions)}",
+                  file=sys.stderr)
+            # Nouveau processus : ni la disposition de la mémoire ni l'état des caches du précédent
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                for index, (kind, size) in enumerate(groups):
+                    if any(result.key in regressions for result in measured[index]):
+                        retried = {result.key: result for result in pool.submit(run_group, kind, size,
+                                                                                args.repeat).result()}
+                        measured[index] = [min(result, retried.get(result.key, result), key=lambda r: r.relative)
+                                           for result in measured[index]]
+            results = [result for group_results in measured for result in group_results]
+            regressions = slower(results, reference, args.tolerance)
+    report(results)
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"format": FORMAT_VERSION, "environment": environment(),
+                   "results": [result.to_json() for result in results]}, file, indent=2)
+    print(f"\nRésultats écrits dans {args.output}")
+
+    if baseline is not None:
+        compare(results, reference, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} régression(s) au-delà de {args.tolerance:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Gestion d'un tournoi de Bélote en ligne de commande, sans interface graphique
+
+N'importe jamais Qt : le démarrage ne coûte que le chargement du contrôleur,
+ce qui permet de l'utiliser dans des scripts, sur une machine sans écran,
+ou pour mesurer le contrôleur sous charge (commande load-test).
+
+Le tournoi est enregistré dans la même base que l'application ($BELOTE_DB
+ou ~/.belote/tournament.db, voir --db) : l'application peut le reprendre.
+
+Usage :
+    python cli.py new équipes.csv [--periods 4 | --swiss]
+    python cli.py schedule [-o calendrier.csv]
+    python cli.py results résultats.csv
+    python cli.py swiss
+    python cli.py standings [--top 10] [-o classement.csv]
+    python cli.py serve [--host 0.0.0.0] [--port 8765] [--code CODE]
+    python cli.py [--db mesure.db] load-test --teams 8192 [--batch]
+"""
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List, Optional
+
+from controllers.result_import import (
+    SCHEDULE_HEADER, STANDINGS_HEADER, schedule_rows, standings_rows, write_csv
+)
+from controllers.tournament_controller import TournamentController
+from diagnostics import instrumentation
+from storage.sqlite_store import SqliteStore, default_database_path
+
+# Codes de sortie
+EXIT_OK = 0
+EXIT_ERROR = 1
+
+MAX_RANDOM_SCORE = 162
+
+
+def _fail(messages: List[str]) -> int:
+    for message in messages:
+        print(message, file=sys.stderr)
+    return EXIT_ERROR
+
+
+def _print_rows(header, rows):
+    """Affiche des lignes en colonnes séparées par des tabulations"""
+    print("\t".join(header))
+    for row in rows:
+        print("\t".join(str(cell) for cell in row))
+
+
+# =====================
+# Commandes sur le tournoi enregistré
+# =====================
+def cmd_new(controller: TournamentController, args) -> int:
+    """Remplace le tournoi enregistré par un nouveau, calendrier compris"""
+    # Le nouveau tournoi est construit à part : la base n'est effacée que s'il est valide
+    prepared = TournamentController()
+    report = prepared.import_teams_from_file(args.teams)
+    if not report.ok:
+        return _fail(report.errors)
+    if len(prepared.teams) < 2:
+        return _fail(["Il faut au moins deux équipes."])
+    if args.swiss:
+        prepared.start_swiss_round()
+    else:
+        prepared.start_tournament(args.periods)
+    controller.adopt(prepared, rewrite_store=True)
+    num_periods = len({game.period for game in controller.games})
+    print(f"{len(controller.teams)} équipes, {len(controller.games)} matchs en {num_periods} période(s).")
+    return EXIT_OK
+
+
+def cmd_schedule(controller: TournamentController, args) -> int:
+    """Affiche ou exporte le calendrier (modèle de feuille de résultats)"""
+    if args.output:
+        write_csv(args.output, SCHEDULE_HEADER, schedule_rows(controller.games))
+    else:
+        _print_rows(SCHEDULE_HEADER, schedule_rows(controller.games))
+    return EXIT_OK
+
+
+def cmd_results(controller: TournamentController, args) -> int:
+    """Valide les scores d'une feuille de résultats"""
+    report = controller.import_results_from_file(args.results)
+    if not report.ok:
+        return _fail(report.errors)
+    print(f"{len(report.results)} résultat(s) validé(s), {report.skipped} ligne(s) sans score.")
+    return EXIT_OK
+
+
+def cmd_swiss(controller: TournamentController, args) -> int:
+    """Ajoute la ronde suisse suivante"""
+    try:
+        games = controller.start_swiss_round()
+    except ValueError as error:
+        return _fail([str(error)])
+    print(f"Ronde de {len(games)} match(s) ajoutée.")
+    return EXIT_OK
+
+
+def cmd_standings(controller: TournamentController, args) -> int:
+    """Affiche ou exporte le classement"""
+    standings = controller.standings
+    ranked = standings.top(args.top) if args.top else standings
+    if args.output:
+        write_csv(args.output, STANDINGS_HEADER, standings_rows(ranked))
+    else:
+        _print_rows(STANDINGS_HEADER, standings_rows(ranked))
+    return EXIT_OK
+
+
+def cmd_serve(controller: TournamentController, args) -> int:
+    """Reçoit les scores des capitaines de table jusqu'à Ctrl+C (voir server.score_server)"""
+    # Chargés seulement pour cette commande : le serveur n'alourdit pas les autres
+    import asyncio
+    import signal
+    from server.score_server import ScoreServer, apply_to, lan_address, tables_of
+
+    if not controller.games:
+        return _fail(["Aucun match : créer d'abord le tournoi (commande new)."])
+    played = sum(game.is_played for game in controller.games)
+    server = ScoreServer(apply_to(controller), args.host, args.port, leaderboard=controller.leaderboard,
+                         code=args.code)
+    server.set_tables(tables_of(controller.games))
+
+    async def serve():
+        try:
+            await server.start()
+        except OSError as error:
+            return _fail([f"Impossible de démarrer le serveur : {error}"])
+        url = f"http://{lan_address()}:{server.address[1]}"
+        print(f"Saisie des scores sur {url}/ avec le code {server.code}, "
+              f"classement en direct sur {url}/leaderboard (Ctrl+C pour arrêter)")
+        # Arrêt propre sur Ctrl+C ou SIGTERM (service système) : les résultats reçus sont enregistrés
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, stop.set)
+            except NotImplementedError:
+                # Windows : Ctrl+C lève KeyboardInterrupt
+                pass
+        try:
+            await stop.wait()
+        finally:
+            await server.close()
+
+    try:
+        status = asyncio.run(serve())
+    except KeyboardInterrupt:
+        status = None
+    if status is not None:
+        return status
+    print(f"{sum(game.is_played for game in controller.games) - played} match(s) saisi(s) à distance.")
+    return EXIT_OK
+
+
+# =====================
+# Mesure du contrôleur sous charge
+# =====================
+def cmd_load_test(args) -> int:
+    """
+    Déroule un tournoi synthétique en mémoire et affiche la durée de chaque étape
+
+    Avec --db, les écritures SQLite sont incluses dans la mesure.
+    """
+    rng = random.Random(args.seed)
+    controller = TournamentController()
+    store = SqliteStore(args.db) if args.db else None
+    if store:
+        store.clear()
+        controller.attach_store(store)
+
+    def timed(label: str, count: int, step: Callable[[], object]):
+        start = time.perf_counter()
+        step()
+        elapsed = time.perf_counter() - start
+        per_item = f"{elapsed / count * 1e6:10.1f} µs/unité" if count else ""
+        print(f"{label:28s} {elapsed * 1000:10.1f} ms  {per_item}")
+
+    def validate():
+        results = [(game.id, (rng.randint(0, MAX_RANDOM_SCORE), rng.randint(0, MAX_RANDOM_SCORE)))
+                   for game in controller.games]
+        if args.batch:
+            controller.validate_matches(results)
+        else:
+            for game_id, scores in results:
+                controller.validate_match(game_id, scores)
+
+    rows = [(line, [f"Équipe {line}", f"Joueur {line}A", f"Joueur {line}B"])
+            for line in range(1, args.teams + 1)]
+    print(f"{args.teams} équipes, {args.periods} périodes, validation "
+          f"{'par lot' if args.batch else 'match par match'}")
+    timed("inscription des équipes", args.teams, lambda: controller.import_teams(rows))
+    timed("calendrier", 0, lambda: controller.start_tournament(args.periods))
+    timed("validation des résultats", len(controller.games), validate)
+    timed("lecture du classement", args.teams, lambda: list(controller.standings))
+    if store:
+        timed("écriture SQLite", 0, store.close)
+    return EXIT_OK
+
+
+COMMANDS = {
+    "new": cmd_new,
+    "schedule": cmd_schedule,
+    "results": cmd_results,
+    "swiss": cmd_swiss,
+    "standings": cmd_standings,
+    "serve": cmd_serve,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=None,
+                        help="base du tournoi (défaut : $BELOTE_DB ou ~/.belote/tournament.db)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    new = commands.add_parser("new", help="crée un tournoi à partir d'un fichier d'équipes")
+    new.add_argument("teams", help="fichier CSV ou XLSX : équipe, joueur 1, joueur 2")
+    mode = new.add_mutually_exclusive_group()
+    mode.add_argument("--periods", type=int, default=4, help="nombre de périodes du Round-Robin")
+    mode.add_argument("--swiss", action="store_true", help="système suisse : première ronde seulement")
+
+    schedule = commands.add_parser("schedule", help="affiche ou exporte le calendrier")
+    schedule.add_argument("-o", "--output", help="fichier CSV à écrire")
+
+    results = commands.add_parser("results", help="valide les scores d'une feuille de résultats")
+    results.add_argument("results", help="fichier CSV ou XLSX : période, table, [équipes,] scores")
+
+    commands.add_parser("swiss", help="ajoute la ronde suisse suivante")
+
+    standings = commands.add_parser("standings", help="affiche ou exporte le classement")
+    standings.add_argument("--top", type=int, default=0, help="seulement les N premières équipes")
+    standings.add_argument("-o", "--output", help="fichier CSV à écrire")
+
+    serve = commands.add_parser("serve", help="reçoit les scores des tables en HTTP et WebSocket")
+    serve.add_argument("--host", default="0.0.0.0", help="adresse d'écoute (défaut : toutes)")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--code", help="code de l'événement exigé des capitaines (défaut : tiré au hasard)")
+
+    load_test = commands.add_parser("load-test", help="mesure le contrôleur sur un tournoi synthétique")
+    load_test.add_argument("--teams", type=int, default=1024)
+    load_test.add_argument("--periods", type=int, default=4)
+    load_test.add_argument("--seed", type=int, default=0)
+    load_test.add_argument("--batch", action="store_true", help="valide tous les résultats en un appel")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    # Durées, profil et mémoire écrits en fin d'exécution si BELOTE_INSTRUMENT est défini
+    instrumentation.start()
+    if args.command == "load-test":
+        return cmd_load_test(args)
+
+    store = SqliteStore(args.db or default_database_path())
+    try:
+        controller = TournamentController()
+        if args.command == "new":
+            # Le tournoi enregistré va être remplacé : inutile de le relire
+            controller.attach_store(store)
+        else:
+            controller.load_from(store)
+        status = COMMANDS[args.command](controller, args)
+        store.flush()
+    finally:
+        store.close()
+    return status
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # Sortie fermée par le lecteur (par exemple « | head ») : pas de trace d'erreur
+        sys.stdout = None
+        sys.exit(EXIT_OK)
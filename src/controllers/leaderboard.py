@@ -0,0 +1,343 @@
+"""
+Flux du classement en direct
+
+Le flux suit le contrôleur (voir TournamentController.leaderboard) et, après
+chaque modification du classement, publie seulement les équipes dont le
+rang ou la situation a changé, à un nombre quelconque d'abonnés : vues et
+écrans d'affichage de l'application, clients WebSocket du serveur
+(``/leaderboard/ws``, voir server.score_server).
+
+Une mise à jour (LeaderboardUpdate) s'applique ainsi à la liste des
+équipes par rang :
+    1. si elle est complète (full), vider la liste ;
+    2. retirer les équipes qui avaient un rang (previous), de la plus mal
+       classée à la mieux classée ;
+    3. insérer les équipes qui ont un rang (rank), de la mieux classée à la
+       plus mal classée.
+Les équipes absentes de la mise à jour gardent leur ordre relatif : le coût
+ne dépend que du nombre de changements, pas du nombre d'équipes.
+
+Chaque abonné a sa file (Subscription) : il est réveillé une fois quand
+elle cesse d'être vide et relève d'un coup toutes les mises à jour
+arrivées entre-temps, ce qui regroupe les rafales de résultats. Un abonné
+trop lent pour suivre (plus de max_pending mises à jour, ou plus de
+changements que la moitié du classement) reçoit à la place le classement
+complet, construit une seule fois à sa relève : la file ne grossit pas
+au-delà.
+
+Le flux est modifié dans le thread du contrôleur (celui de l'interface) ;
+les abonnés peuvent relever leur file depuis n'importe quel thread.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from controllers.tournament_controller import Change, RESET, STANDINGS
+from diagnostics.instrumentation import count, timed
+from models.standings import KeyIndex, Standings, TeamStanding
+
+if TYPE_CHECKING:
+    from controllers.tournament_controller import TournamentController
+
+# Mises à jour en attente au-delà desquelles un abonné reçoit le classement complet
+MAX_PENDING = 64
+
+# Situation publiée d'une équipe : (points, concédés, victoires, matchs joués, Buchholz)
+Row = Tuple[int, int, int, int, int]
+# Place publiée d'une équipe : la clé de l'arbre du classement, où la
+# confrontation directe devient un critère (0 pour la gagnante d'une paire
+# départagée ainsi, 1 sinon) placé juste après les points marqués et concédés
+OrderKey = Tuple[int, int, int, int, int, str]
+Wakeup = Callable[[], None]
+
+
+def _row(standing: TeamStanding) -> Row:
+    return standing.points, standing.conceded, standing.wins, standing.played, standing.buchholz
+
+
+def _order_key(standings: Standings, standing: TeamStanding) -> OrderKey:
+    """Clé de l'équipe : l'ordre des clés est celui du classement"""
+    pair = standings.tied_at(standing.points, standing.conceded, 2)
+    first = len(pair) == 2 and pair[1] == standing.name \
+        and standings.rank_of(pair[1]) < standings.rank_of(pair[0])
+    return (-standing.points, standing.conceded, 0 if first else 1, -standing.buchholz,
+            -standing.wins, standing.name)
+
+
+@dataclass(frozen=True)
+class RankChange:
+    """Nouvelle situation d'une équipe au classement"""
+    name: str
+    # Rang (à partir de 1) après la mise à jour ; 0 si l'équipe a quitté le classement
+    rank: int
+    # Rang avant la mise à jour ; 0 si l'équipe vient d'y entrer
+    previous: int
+    points: int = 0
+    conceded: int = 0
+    wins: int = 0
+    played: int = 0
+    buchholz: int = 0
+
+    def to_json(self) -> dict:
+        return {"name": self.name, "rank": self.rank, "previous": self.previous, "points": self.points,
+                "conceded": self.conceded, "wins": self.wins, "played": self.played,
+                "buchholz": self.buchholz}
+
+
+@dataclass(frozen=True)
+class LeaderboardUpdate:
+    """Une mise à jour du classement (voir l'ordre d'application en tête du module)"""
+    # Croît de 1 à chaque publication
+    version: int
+    # Par rang croissant (les équipes sorties du classement, de rang 0, en tête)
+    changes: Tuple[RankChange, ...]
+    # Classement complet : toutes les équipes, par rang
+    full: bool = False
+
+    def to_json(self) -> dict:
+        return {"version": self.version, "full": self.full,
+                "changes": [change.to_json() for change in self.changes]}
+
+
+class Subscription:
+    """File des mises à jour d'un abonné (voir LeaderboardFeed.subscribe)"""
+
+    def __init__(self, feed: "LeaderboardFeed", wakeup: Optional[Wakeup], max_pending: int):
+        self._feed = feed
+        self._wakeup = wakeup
+        self.max_pending = max_pending
+        self._pending: List[LeaderboardUpdate] = []
+        self._pending_changes = 0
+        # Vrai : la prochaine relève retourne le classement complet (premier
+        # take, abonné en retard ou classement remplacé)
+        self._resync = True
+        # Réveil déjà envoyé depuis la dernière relève
+        self._woken = False
+
+    def take(self) -> List[LeaderboardUpdate]:
+        """Retourne et vide les mises à jour en attente, à appliquer dans l'ordre"""
+        feed = self._feed
+        with feed._lock:
+            if self._resync:
+                pending = [feed._full_update()]
+            else:
+                pending = self._pending
+            self._pending = []
+            self._pending_changes = 0
+            self._resync = False
+            self._woken = False
+        return pending
+
+    def close(self):
+        """Se désabonne du flux"""
+        self._feed.unsubscribe(self)
+
+    def _push(self, update: LeaderboardUpdate, limit: int) -> bool:
+        """
+        Ajoute update à la file (verrou du flux tenu)
+
+        Returns:
+            Vrai si l'abonné doit être réveillé
+        """
+        if not self._resync:
+            self._pending.append(update)
+            self._pending_changes += len(update.changes)
+            if len(self._pending) > self.max_pending or self._pending_changes > limit:
+                count("leaderboard.resyncs")
+                self._resync = True
+                self._pending = []
+        return self._wake()
+
+    def _reset(self) -> bool:
+        self._resync = True
+        self._pending = []
+        return self._wake()
+
+    def _wake(self) -> bool:
+        if self._woken or self._wakeup is None:
+            return False
+        self._woken = True
+        return True
+
+
+class LeaderboardFeed:
+    """Publie les changements du classement d'un contrôleur à ses abonnés"""
+
+    def __init__(self, controller: "TournamentController"):
+        self._controller = controller
+        self._lock = threading.Lock()
+        self._subscriptions: List[Subscription] = []
+        self._version = 0
+        # Dernier classement publié : situation et clé par équipe, clés
+        # ordonnées (le rang publié d'une équipe est le nombre de clés
+        # inférieures à la sienne, plus un) et, par (points, concédés), la
+        # gagnante d'une paire départagée par la confrontation directe
+        self._rows: Dict[str, Row] = {}
+        self._keys: Dict[str, OrderKey] = {}
+        self._index = KeyIndex()
+        self._winners: Dict[Tuple[int, int], str] = {}
+        self._standings: Optional[Standings] = None
+        # Classement complet de la version courante, construit à la demande
+        self._full: Optional[LeaderboardUpdate] = None
+        if not controller.standings_stale:
+            self._reload(controller.standings)
+        controller.add_listener(self._on_change)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def subscribe(self, wakeup: Optional[Wakeup] = None, max_pending: int = MAX_PENDING) -> Subscription:
+        """
+        Abonne un lecteur ; sa première relève (Subscription.take) retourne
+        le classement complet
+
+        Args:
+            wakeup: Appelé, depuis le thread du contrôleur, quand la file de
+                    l'abonné cesse d'être vide ; il doit seulement planifier
+                    la relève (QTimer.singleShot, loop.call_soon_threadsafe)
+            max_pending: Mises à jour en attente au-delà desquelles l'abonné
+                         recevra le classement complet
+        """
+        subscription = Subscription(self, wakeup, max_pending)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def snapshot(self) -> LeaderboardUpdate:
+        """Retourne le classement complet publié"""
+        with self._lock:
+            return self._full_update()
+
+    def close(self):
+        """Cesse de suivre le contrôleur"""
+        self._controller.remove_listener(self._on_change)
+
+    # =====================
+    # Publication (thread du contrôleur)
+    # =====================
+    def _on_change(self, change: Change):
+        controller = self._controller
+        # Classement en attente de recalcul : il sera installé par adopt_standings (STANDINGS)
+        if controller.standings_stale:
+            return
+        standings = controller.standings
+        if standings is not self._standings or change.kind in (RESET, STANDINGS):
+            with self._lock:
+                self._reload(standings)
+                to_wake = [subscription for subscription in self._subscriptions if subscription._reset()]
+            for subscription in to_wake:
+                subscription._wakeup()
+        else:
+            self.publish()
+
+    @timed("leaderboard.publish")
+    def publish(self):
+        """
+        Publie les changements du classement depuis la publication
+        précédente (appelé à chaque notification du contrôleur)
+        """
+        changed = self._standings.take_changed()
+        if not changed:
+            return
+        with self._lock:
+            changes = self._diff(self._standings, changed)
+            if not changes:
+                return
+            self._version += 1
+            self._full = None
+            count("leaderboard.changes", len(changes))
+            update = LeaderboardUpdate(self._version, changes)
+            limit = max(1, len(self._rows) // 2)
+            to_wake = [subscription for subscription in self._subscriptions
+                       if subscription._push(update, limit)]
+        for subscription in to_wake:
+            subscription._wakeup()
+
+    def _reload(self, standings: Standings):
+        standings.take_changed()
+        self._standings = standings
+        self._rows, self._keys, self._index, self._winners = {}, {}, KeyIndex(), {}
+        for standing in standings:
+            self._publish_team(standing.name, _row(standing), _order_key(standings, standing))
+        self._version += 1
+        self._full = None
+
+    def _diff(self, standings: Standings, changed) -> Tuple[RankChange, ...]:
+        """
+        Changements de rang et de situation depuis la dernière publication,
+        reportés dans le classement publié ; en O(changements · log N)
+        """
+        rows, keys, index = self._rows, self._keys, self._index
+        # Égalités quittées ou rejointes : une paire peut s'y former ou s'y
+        # défaire, et la confrontation directe y changer l'ordre d'équipes
+        # dont la situation n'a pas changé
+        ties = set()
+        for name in changed:
+            old = rows.get(name)
+            if old is not None:
+                ties.add(old[:2])
+            if name in standings:
+                standing = standings.standing(name)
+                ties.add((standing.points, standing.conceded))
+        candidates = set(changed)
+        for points, conceded in ties:
+            winner = self._winners.get((points, conceded))
+            if winner is not None:
+                candidates.add(winner)
+            candidates.update(standings.tied_at(points, conceded, 2))
+
+        changes, published = [], []
+        for name in candidates:
+            old_key = keys.get(name)
+            previous = index.count_less(old_key) + 1 if old_key is not None else 0
+            if name in standings:
+                standing = standings.standing(name)
+                rank, row, key = standings.rank_of(name), _row(standing), _order_key(standings, standing)
+            else:
+                rank, row, key = 0, None, None
+            if key != old_key or row != rows.get(name):
+                published.append((name, row, key))
+            if rank == previous and row == rows.get(name):
+                continue
+            changes.append(RankChange(name, rank, previous, *(row or ())))
+
+        for name, _, _ in published:
+            self._withdraw_team(name)
+        for name, row, key in published:
+            if key is not None:
+                self._publish_team(name, row, key)
+        changes.sort(key=lambda change: change.rank)
+        return tuple(changes)
+
+    def _publish_team(self, name: str, row: Row, key: OrderKey):
+        self._rows[name] = row
+        self._keys[name] = key
+        self._index.add(key)
+        if not key[2]:
+            self._winners[row[:2]] = name
+
+    def _withdraw_team(self, name: str):
+        key = self._keys.pop(name, None)
+        if key is None:
+            return
+        row = self._rows.pop(name)
+        self._index.remove(key)
+        if not key[2]:
+            del self._winners[row[:2]]
+
+    def _full_update(self) -> LeaderboardUpdate:
+        """Classement complet de la version courante (verrou tenu)"""
+        if self._full is None:
+            rows = self._rows
+            names = (key[-1] for key in self._index)
+            self._full = LeaderboardUpdate(
+                self._version,
+                tuple(RankChange(name, rank, 0, *rows[name]) for rank, name in enumerate(names, 1)),
+                full=True)
+        return self._full
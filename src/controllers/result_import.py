@@ -0,0 +1,137 @@
+"""
+Échange du calendrier et des résultats sous forme de fichiers (CSV ou XLSX)
+
+Le calendrier est exporté une ligne par match :
+``période, table, équipe 1, équipe 2, score 1, score 2`` (période et table
+numérotées à partir de 1, comme dans la vue des matchs ; scores vides tant
+que le match n'est pas validé). Le même fichier, scores remplis, sert de
+feuille de résultats. Une feuille peut aussi omettre les équipes :
+``période, table, score 1, score 2``.
+"""
+import csv
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from controllers.team_import import Row
+from models.game import Game, MAX_SCORE
+from models.standings import TeamStanding
+
+SCHEDULE_HEADER = ("période", "table", "équipe 1", "équipe 2", "score 1", "score 2")
+STANDINGS_HEADER = ("rang", "équipe", "points", "concédés", "victoires", "matchs joués")
+
+# (période, table), numérotées à partir de 1
+TableKey = Tuple[int, int]
+
+
+@dataclass
+class ResultReport:
+    """Bilan de la lecture d'une feuille de résultats"""
+    # (identifiant du match, (score1, score2)) à valider
+    results: List[Tuple[int, Tuple[int, int]]] = field(default_factory=list)
+    # Lignes sans score, ignorées
+    skipped: int = 0
+    # Messages d'erreur, préfixés par le numéro de ligne
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def index_tables(games: Iterable[Game]) -> Dict[TableKey, Game]:
+    """Associe chaque match à sa (période, table), dans l'ordre du calendrier"""
+    tables: Dict[TableKey, Game] = {}
+    counts: Dict[int, int] = {}
+    for game in games:
+        table = counts[game.period] = counts.get(game.period, 0) + 1
+        tables[(game.period + 1, table)] = game
+    return tables
+
+
+def schedule_rows(games: Iterable[Game]) -> Iterator[list]:
+    """Lignes du calendrier (sans en-tête), voir SCHEDULE_HEADER"""
+    for (period, table), game in index_tables(games).items():
+        scores = game.scores if game.is_played else ("", "")
+        yield [period, table, game.team1.name, game.team2.name, *scores]
+
+
+def standings_rows(standings: Iterable[TeamStanding]) -> Iterator[list]:
+    """Lignes du classement (sans en-tête), voir STANDINGS_HEADER"""
+    for rank, standing in enumerate(standings, 1):
+        yield [rank, standing.name, standing.points, standing.conceded, standing.wins, standing.played]
+
+
+def write_csv(path: str, header: Sequence[str], rows: Iterable[list]):
+    """Écrit un fichier CSV lisible par Excel (UTF-8 avec BOM)"""
+    with open(path, "w", newline="", encoding="utf-8-sig") as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def read_results(rows: Iterable[Row], games: Iterable[Game]) -> ResultReport:
+    """
+    Lit une feuille de résultats
+
+    Toutes les lignes sont contrôlées ; en cas d'erreur, aucun résultat
+    n'est retenu et toutes les erreurs sont rapportées ensemble.
+
+    Args:
+        rows: Des couples (numéro de ligne, cellules), lus par
+              controllers.team_import.read_rows
+        games: Les matchs du calendrier
+
+    Returns:
+        Le bilan, avec les résultats à valider
+    """
+    report = ResultReport()
+    tables = index_tables(games)
+    seen: Dict[TableKey, int] = {}
+    first = True
+    for line, cells in rows:
+        # Une première ligne non numérique est un en-tête
+        if first and not cells[0].isdigit():
+            first = False
+            continue
+        first = False
+
+        if len(cells) < 2:
+            report.errors.append(
+                f"Ligne {line} : attendu « période, table, [équipe 1, équipe 2,] score 1, score 2 ».")
+            continue
+        try:
+            key = (int(cells[0]), int(cells[1]))
+        except ValueError:
+            report.errors.append(f"Ligne {line} : période et table doivent être des nombres.")
+            continue
+        game = tables.get(key)
+        if game is None:
+            report.errors.append(f"Ligne {line} : aucun match en période {key[0]}, table {key[1]}.")
+            continue
+        if key in seen:
+            report.errors.append(f"Ligne {line} : match déjà saisi ligne {seen[key]}.")
+            continue
+        seen[key] = line
+
+        # Les cellules vides finales ont été retirées : un match sans score
+        # exporté par schedule_rows n'a plus que ses quatre premières cellules
+        teams = (game.team1.name, game.team2.name)
+        if tuple(cells[2:4]) == teams:
+            scores = cells[4:]
+        elif len(cells) <= 4:
+            scores = cells[2:]
+        else:
+            report.errors.append(f"Ligne {line} : le match de cette table est {teams[0]} contre {teams[1]}.")
+            continue
+        if not scores:
+            report.skipped += 1
+            continue
+        if len(scores) != 2 or not all(score.isdecimal() and int(score) <= MAX_SCORE for score in scores):
+            report.errors.append(f"Ligne {line} : attendu deux scores entiers entre 0 et {MAX_SCORE}.")
+            continue
+        report.results.append((game.id, (int(scores[0]), int(scores[1]))))
+
+    if report.errors:
+        report.results.clear()
+    return report
+
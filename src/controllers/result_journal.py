@@ -0,0 +1,191 @@
+"""
+Journal des résultats d'un tournoi
+
+Chaque saisie ou annulation de score est ajoutée à un journal que l'on ne
+modifie jamais : l'état des résultats est le repli (fold) de ces
+événements. Un instantané de l'état est conservé tous les
+``snapshot_interval`` événements, de sorte que reconstruire l'état à
+n'importe quel point du journal ne rejoue que les événements postérieurs
+au dernier instantané.
+
+Annuler ou rétablir une action ajoute un événement compensatoire : le
+journal reste une trace complète, utilisable en cas de litige.
+"""
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from models.tournament import SequenceView
+
+DEFAULT_SNAPSHOT_INTERVAL = 256
+
+SUBMIT = "submit"
+CANCEL = "cancel"
+
+# Origine d'un événement
+USER = "user"
+UNDO = "undo"
+REDO = "redo"
+
+Scores = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ResultEvent:
+    """Une saisie ou une annulation de résultat"""
+    seq: int
+    kind: str
+    game_id: int
+    # Scores saisis (None pour une annulation)
+    scores: Optional[Scores]
+    # Scores du match avant l'événement (None s'il n'en avait pas)
+    previous: Optional[Scores]
+    origin: str = USER
+    timestamp: float = 0.0
+
+
+def fold(results: Dict[int, Scores], event: ResultEvent) -> Dict[int, Scores]:
+    """Applique un événement aux résultats (modifiés sur place)"""
+    if event.kind == SUBMIT:
+        results[event.game_id] = event.scores
+    else:
+        results.pop(event.game_id, None)
+    return results
+
+
+class ResultJournal:
+    """Journal append-only des résultats, avec annuler / rétablir"""
+
+    def __init__(self, snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL):
+        """
+        Args:
+            snapshot_interval: Le nombre d'événements entre deux instantanés
+        """
+        if snapshot_interval < 1:
+            raise ValueError("L'intervalle entre instantanés doit être positif.")
+        self.snapshot_interval = snapshot_interval
+        self._events: List[ResultEvent] = []
+        self._results: Dict[int, Scores] = {}
+        # Instantanés (nombre d'événements repliés, résultats), par seq croissant
+        self._snapshot_seqs: List[int] = [0]
+        self._snapshots: List[Dict[int, Scores]] = [{}]
+        self._undo_stack: List[ResultEvent] = []
+        self._redo_stack: List[ResultEvent] = []
+
+    @property
+    def events(self) -> SequenceView[ResultEvent]:
+        """Retourne les événements du journal (lecture seule)"""
+        return SequenceView(self._events)
+
+    @property
+    def results(self) -> Mapping[int, Scores]:
+        """Retourne les résultats courants par identifiant de match (lecture seule)"""
+        return MappingProxyType(self._results)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo_stack)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    # =====================
+    # Actions
+    # =====================
+    def submit(self, game_id: int, scores: Scores) -> ResultEvent:
+        """Enregistre les scores d'un match (remplace un résultat existant)"""
+        event = self._append(SUBMIT, game_id, (scores[0], scores[1]), USER)
+        self._undo_stack.append(event)
+        self._redo_stack.clear()
+        return event
+
+    def cancel(self, game_id: int) -> Optional[ResultEvent]:
+        """Annule le résultat d'un match ; None si le match n'en avait pas"""
+        if game_id not in self._results:
+            return None
+        event = self._append(CANCEL, game_id, None, USER)
+        self._undo_stack.append(event)
+        self._redo_stack.clear()
+        return event
+
+    def undo(self) -> Optional[ResultEvent]:
+        """Annule la dernière action ; retourne l'événement compensatoire ajouté"""
+        if not self._undo_stack:
+            return None
+        undone = self._undo_stack.pop()
+        kind = SUBMIT if undone.previous is not None else CANCEL
+        event = self._append(kind, undone.game_id, undone.previous, UNDO)
+        self._redo_stack.append(undone)
+        return event
+
+    def redo(self) -> Optional[ResultEvent]:
+        """Rétablit la dernière action annulée ; retourne l'événement ajouté"""
+        if not self._redo_stack:
+            return None
+        redone = self._redo_stack.pop()
+        event = self._append(redone.kind, redone.game_id, redone.scores, REDO)
+        self._undo_stack.append(event)
+        return event
+
+    def clear(self):
+        """Vide le journal (nouveau tournoi)"""
+        self.__init__(self.snapshot_interval)
+
+    def restore(self, events: Iterable[ResultEvent]):
+        """
+        Recharge un journal enregistré (les piles annuler / rétablir repartent vides)
+
+        Args:
+            events: Les événements, dans l'ordre de leur numéro seq
+        """
+        self.clear()
+        for event in events:
+            if event.seq != len(self._events):
+                raise ValueError(f"Journal incomplet : événement {len(self._events)} manquant.")
+            self._push(event)
+
+    # =====================
+    # Relecture
+    # =====================
+    def state_at(self, seq: int) -> Dict[int, Scores]:
+        """
+        Reconstruit les résultats tels qu'après les seq premiers événements
+
+        Seuls les événements postérieurs au dernier instantané sont rejoués.
+        """
+        if not 0 <= seq <= len(self._events):
+            raise IndexError(seq)
+        index = bisect_right(self._snapshot_seqs, seq) - 1
+        results = dict(self._snapshots[index])
+        for event in self._events[self._snapshot_seqs[index]:seq]:
+            fold(results, event)
+        return results
+
+    def history(self, game_id: int) -> List[ResultEvent]:
+        """Retourne tous les événements concernant un match, pour arbitrer un litige"""
+        return [event for event in self._events if event.game_id == game_id]
+
+    def _append(self, kind: str, game_id: int, scores: Optional[Scores], origin: str) -> ResultEvent:
+        return self._push(ResultEvent(
+            seq=len(self._events),
+            kind=kind,
+            game_id=game_id,
+            scores=scores,
+            previous=self._results.get(game_id),
+            origin=origin,
+            timestamp=time.time(),
+        ))
+
+    def _push(self, event: ResultEvent) -> ResultEvent:
+        self._events.append(event)
+        fold(self._results, event)
+        if len(self._events) % self.snapshot_interval == 0:
+            self._snapshot_seqs.append(len(self._events))
+            self._snapshots.append(dict(self._results))
+        return event
@@ -0,0 +1,84 @@
+"""
+Génération paresseuse d'un calendrier de tournoi en Round-Robin
+
+Méthode du cercle : la première équipe reste fixe et les autres tournent
+d'un cran à chaque ronde. La rotation n'est jamais matérialisée : la
+position de chaque équipe dans une ronde est calculée par arithmétique
+modulaire, de sorte qu'une ronde ne coûte que ses propres paires. Avec un
+nombre impair d'équipes, une équipe fantôme est ajoutée et son adversaire
+est exempt pour la ronde.
+"""
+from dataclasses import dataclass
+from typing import Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Round(Generic[T]):
+    """Une ronde du calendrier"""
+    index: int
+    pairs: List[Tuple[T, T]]
+    # Équipe exempte de cette ronde (nombre impair d'équipes)
+    bye: Optional[T] = None
+
+
+def num_rounds(num_teams: int) -> int:
+    """Retourne le nombre de rondes d'un Round-Robin complet"""
+    if num_teams < 2:
+        return 0
+    return num_teams - 1 if num_teams % 2 == 0 else num_teams
+
+
+def round_robin(teams: Sequence[T], rounds: Optional[int] = None) -> Iterator[Round[T]]:
+    """
+    Génère les rondes d'un Round-Robin, une par une
+
+    Chaque équipe joue au plus une fois par ronde et aucune rencontre
+    n'est répétée.
+
+    Args:
+        teams: Les équipes, dans l'ordre de tirage
+        rounds: Le nombre de rondes voulues (par défaut, le Round-Robin complet)
+
+    Yields:
+        Les rondes successives
+
+    Raises:
+        ValueError: Si rounds est négatif ou dépasse le Round-Robin complet
+    """
+    total = num_rounds(len(teams))
+    if rounds is None:
+        rounds = total
+    if not 0 <= rounds <= total:
+        raise ValueError(f"Un Round-Robin de {len(teams)} équipes compte au plus {total} rondes.")
+    return _generate(teams, rounds)
+
+
+def _generate(teams: Sequence[T], rounds: int) -> Iterator[Round[T]]:
+    fixed = teams[0] if teams else None
+    rotating = list(teams[1:])
+    if len(teams) % 2:
+        rotating.append(None)
+    size = len(rotating)
+    half = size // 2
+
+    for index in range(rounds):
+        # rotating décalé de index crans vers la droite : position j -> rotating[(j - index) % size]
+        last = rotating[(size - 1 - index) % size]
+        pairs: List[Tuple[T, T]] = []
+        bye = None
+        if last is None:
+            bye = fixed
+        else:
+            pairs.append((fixed, last))
+        for i in range(half):
+            team1 = rotating[(i - index) % size]
+            team2 = rotating[(size - 2 - i - index) % size]
+            if team1 is None:
+                bye = team2
+            elif team2 is None:
+                bye = team1
+            else:
+                pairs.append((team1, team2))
+        yield Round(index, pairs, bye)
@@ -0,0 +1,190 @@
+"""
+Appariement d'une ronde de système suisse
+
+Les équipes sont classées par score puis appariées par un couplage de
+cardinalité maximale (algorithme d'Edmonds) sur le graphe des rencontres
+encore possibles : une revanche n'est acceptée que si aucun appariement
+complet sans revanche n'existe, et l'exemption, sommet de plus relié aux
+équipes jamais exemptées, est choisie par le même couplage.
+
+La proximité des scores reste une heuristique : le couplage part d'un
+appariement glouton (chaque équipe, de haut en bas, avec la plus proche
+équipe libre qu'elle n'a pas encore rencontrée), puis chaque équipe restée
+seule est casée par un chemin augmentant qui essaie d'abord les équipes
+les plus proches au classement. Les écarts de score ne sont donc pas
+minimisés globalement : une équipe du bas peut devoir remonter de
+plusieurs rangs si ses voisines l'ont toutes déjà rencontrée.
+
+Coût : O(N·d) pour l'appariement glouton (d, distance au plus proche
+adversaire possible, reste petit), plus O(N) par équipe restée seule tant
+que le graphe est dense ; prouver qu'une revanche est inévitable peut
+coûter O(N²), ce qui n'arrive qu'en fin de tournoi sur peu d'équipes.
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Hashable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SwissRound(Generic[T]):
+    """Résultat de l'appariement d'une ronde"""
+    pairs: List[Tuple[T, T]] = field(default_factory=list)
+    # Équipe exempte (nombre impair d'équipes)
+    bye: Optional[T] = None
+    # Nombre de revanches qu'il a fallu accepter
+    rematches: int = 0
+
+
+def swiss_pairs(teams: Sequence[T], score: Callable[[T], int], key: Callable[[T], Hashable],
+                played: Set[frozenset], byes: Set[Hashable] = frozenset()) -> SwissRound[T]:
+    """
+    Apparie les équipes de scores égaux ou proches
+
+    Args:
+        teams: Les équipes, dans l'ordre d'inscription (départage des égalités)
+        score: Retourne le score d'une équipe
+        key: Retourne l'identifiant unique d'une équipe
+        played: Les rencontres déjà jouées, sous forme frozenset({clé1, clé2})
+        byes: Les équipes déjà exemptées, qui ne le seront pas une seconde fois
+              tant qu'une autre peut l'être
+
+    Returns:
+        Les paires de la ronde (de la mieux classée à la moins bien classée),
+        l'équipe exempte et le nombre de revanches
+    """
+    ranked = sorted(teams, key=score, reverse=True)
+    keys = [key(team) for team in ranked]
+    size = len(ranked)
+    met: Dict[Hashable, Set[Hashable]] = {}
+    for meeting in played:
+        if len(meeting) == 2:
+            first, second = meeting
+            met.setdefault(first, set()).add(second)
+            met.setdefault(second, set()).add(first)
+
+    # Exemption : un sommet de plus, classé dernier
+    bye = size if size % 2 else -1
+    count = size + (size % 2)
+
+    def can_meet(first: int, second: int) -> bool:
+        if first == bye:
+            return keys[second] not in byes
+        if second == bye:
+            return keys[first] not in byes
+        return keys[second] not in met.get(keys[first], ())
+
+    # Appariement glouton : exemption à la moins bien classée possible, puis de haut en bas
+    mate = [-1] * count
+    if bye >= 0:
+        for index in range(size - 1, -1, -1):
+            if can_meet(index, bye):
+                mate[index], mate[bye] = bye, index
+                break
+    for index in range(size):
+        if mate[index] >= 0:
+            continue
+        for other in range(index + 1, size):
+            if mate[other] < 0 and can_meet(index, other):
+                mate[index], mate[other] = other, index
+                break
+
+    # Équipes restées seules : chemins augmentants
+    exposed = [vertex for vertex in range(count) if mate[vertex] < 0]
+    for root in exposed:
+        if mate[root] < 0:
+            _augment(root, count, mate, can_meet, exposed)
+
+    result: SwissRound[T] = SwissRound()
+    pairs = [(index, mate[index]) for index in range(size) if index < mate[index] < size]
+    # Revanches inévitables : les équipes restantes, dans l'ordre du classement
+    single = [index for index in range(size) if mate[index] < 0]
+    if bye >= 0:
+        if mate[bye] >= 0:
+            result.bye = ranked[mate[bye]]
+        else:
+            result.bye = ranked[single.pop()]
+    for position in range(0, len(single), 2):
+        pairs.append((single[position], single[position + 1]))
+        result.rematches += 1
+    pairs.sort()
+    result.pairs = [(ranked[first], ranked[second]) for first, second in pairs]
+    return result
+
+
+def _augment(root: int, count: int, mate: List[int], can_meet: Callable[[int, int], bool],
+             exposed: List[int]) -> bool:
+    """
+    Cherche un chemin augmentant depuis root (arbre alterné d'Edmonds, avec
+    contraction des fleurs) et l'applique à mate
+
+    Les voisins d'un sommet sont essayés dans cet ordre : sommets encore
+    seuls d'abord (chemin court), puis du plus proche au plus éloigné au
+    classement.
+    """
+    base = list(range(count))
+    parent = [-1] * count
+    in_tree = [False] * count
+    in_tree[root] = True
+    queue = deque([root])
+
+    def neighbours(vertex: int) -> Iterator[int]:
+        for other in exposed:
+            if other != vertex and mate[other] < 0 and can_meet(vertex, other):
+                yield other
+        for distance in range(1, count):
+            for other in (vertex - distance, vertex + distance):
+                if 0 <= other < count and can_meet(vertex, other):
+                    yield other
+
+    def common_base(first: int, second: int) -> int:
+        seen = [False] * count
+        while True:
+            first = base[first]
+            seen[first] = True
+            if mate[first] < 0:
+                break
+            first = parent[mate[first]]
+        while True:
+            second = base[second]
+            if seen[second]:
+                return second
+            second = parent[mate[second]]
+
+    def mark_path(vertex: int, stop: int, child: int, blossom: List[bool]):
+        while base[vertex] != stop:
+            blossom[base[vertex]] = blossom[base[mate[vertex]]] = True
+            parent[vertex] = child
+            child = mate[vertex]
+            vertex = parent[mate[vertex]]
+
+    while queue:
+        vertex = queue.popleft()
+        for other in neighbours(vertex):
+            if base[vertex] == base[other] or mate[vertex] == other:
+                continue
+            if other == root or (mate[other] >= 0 and parent[mate[other]] >= 0):
+                # Cycle impair : la fleur est contractée sur sa base
+                stop = common_base(vertex, other)
+                blossom = [False] * count
+                mark_path(vertex, stop, other, blossom)
+                mark_path(other, stop, vertex, blossom)
+                for member in range(count):
+                    if blossom[base[member]]:
+                        base[member] = stop
+                        if not in_tree[member]:
+                            in_tree[member] = True
+                            queue.append(member)
+            elif parent[other] < 0:
+                parent[other] = vertex
+                if mate[other] < 0:
+                    while other >= 0:
+                        previous = parent[other]
+                        following = mate[previous]
+                        mate[other], mate[previous] = previous, other
+                        other = following
+                    return True
+                in_tree[mate[other]] = True
+                queue.append(mate[other])
+    return False
@@ -0,0 +1,181 @@
+"""
+Lecture de fichiers d'inscription d'équipes (CSV ou XLSX)
+
+Chaque ligne décrit une équipe : ``équipe, joueur 1, joueur 2``. Les
+fichiers sont lus en flux, ligne à ligne ; une éventuelle ligne d'en-tête
+est ignorée. Le format XLSX est lu avec la bibliothèque standard
+(zipfile + ElementTree), première feuille uniquement ; ces modules ne sont
+chargés qu'à la première lecture d'un classeur, pour ne pas ralentir le
+démarrage (voir cli.py).
+"""
+import csv
+import os
+import posixpath
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import zipfile
+    from xml.etree import ElementTree
+
+# Premières cellules reconnues comme une ligne d'en-tête
+HEADER_NAMES = {"team", "équipe", "equipe", "nom", "nom de l'équipe", "name"}
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# (numéro de ligne dans le fichier, cellules)
+Row = Tuple[int, List[str]]
+
+
+@dataclass
+class ImportReport:
+    """Bilan d'un import d'équipes"""
+    # (nom, joueur 1, joueur 2) des équipes ajoutées
+    added: List[Tuple[str, str, str]] = field(default_factory=list)
+    # Messages d'erreur, préfixés par le numéro de ligne
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def read_rows(path: str) -> Iterator[Row]:
+    """
+    Lit les lignes non vides d'un fichier CSV ou XLSX
+
+    Args:
+        path: Un fichier .csv (séparateur , ; ou tabulation) ou .xlsx
+
+    Yields:
+        (numéro de ligne, cellules sans espaces superflus ni cellules vides finales)
+
+    Raises:
+        ValueError: Si l'extension n'est pas prise en charge ou le fichier illisible
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".xlsx":
+        rows = _read_xlsx(path)
+    elif extension in (".csv", ".txt"):
+        rows = _read_csv(path)
+    else:
+        raise ValueError(f"Format de fichier non pris en charge : {extension or path}")
+
+    for line, cells in rows:
+        cells = [cell.strip() for cell in cells]
+        while cells and not cells[-1]:
+            cells.pop()
+        if cells:
+            yield line, cells
+
+
+def read_team_rows(path: str) -> Iterator[Row]:
+    """
+    Lit les lignes d'un fichier d'équipes, en sautant l'en-tête et les lignes vides
+
+    Args:
+        path: Un fichier .csv (séparateur , ; ou tabulation) ou .xlsx
+
+    Yields:
+        (numéro de ligne, cellules sans espaces superflus)
+
+    Raises:
+        ValueError: Si l'extension n'est pas prise en charge ou le fichier illisible
+    """
+    first = True
+    for line, cells in read_rows(path):
+        if first and cells[0].lower() in HEADER_NAMES:
+            first = False
+            continue
+        first = False
+        yield line, cells
+
+
+def _read_csv(path: str) -> Iterator[Row]:
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        sample = file.read(4096)
+        file.seek(0)
+        # Le séparateur le plus fréquent de la première ligne (Excel en français utilise ;)
+        first_line = sample.split("\n", 1)[0]
+        delimiter = max(",;\t", key=first_line.count)
+        for line, cells in enumerate(csv.reader(file, delimiter=delimiter), 1):
+            yield line, cells
+
+
+def _read_xlsx(path: str) -> Iterator[Row]:
+    import zipfile
+    from xml.etree import ElementTree
+
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as error:
+        raise ValueError(f"Fichier XLSX illisible : {error}") from None
+    with archive:
+        try:
+            shared = _shared_strings(archive)
+            with archive.open(_first_sheet(archive)) as sheet:
+                for _, element in ElementTree.iterparse(sheet):
+                    if element.tag != _MAIN_NS + "row":
+                        continue
+                    cells: Dict[int, str] = {}
+                    for cell in element.iter(_MAIN_NS + "c"):
+                        cells[_column_index(cell.get("r", ""), len(cells))] = _cell_text(cell, shared)
+                    line = int(element.get("r", 0))
+                    element.clear()
+                    if cells:
+                        yield line, [cells.get(i, "") for i in range(max(cells) + 1)]
+        except (KeyError, IndexError, ElementTree.ParseError) as error:
+            raise ValueError(f"Fichier XLSX illisible : {error}") from None
+
+
+def _shared_strings(archive: "zipfile.ZipFile") -> List[str]:
+    from xml.etree import ElementTree
+
+    try:
+        data = archive.read("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    root = ElementTree.fromstring(data)
+    return ["".join(text.text or "" for text in item.iter(_MAIN_NS + "t"))
+            for item in root.iter(_MAIN_NS + "si")]
+
+
+def _first_sheet(archive: "zipfile.ZipFile") -> str:
+    from xml.etree import ElementTree
+
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    sheet = workbook.find(f"{_MAIN_NS}sheets/{_MAIN_NS}sheet")
+    if sheet is None:
+        raise ValueError("Le classeur ne contient aucune feuille.")
+    relations = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    relation_id = sheet.get(_REL_NS + "id")
+    for relation in relations.iter(_PACKAGE_REL_NS + "Relationship"):
+        if relation.get("Id") == relation_id:
+            target = relation.get("Target", "")
+            return target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+    raise ValueError("Feuille introuvable dans le classeur.")
+
+
+def _column_index(reference: str, default: int) -> int:
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - ord("A") + 1
+    return index - 1 if index else default
+
+
+def _cell_text(cell: "ElementTree.Element", shared: List[str]) -> str:
+    kind = cell.get("t")
+    if kind == "inlineStr":
+        return "".join(text.text or "" for text in cell.iter(_MAIN_NS + "t"))
+    value = cell.find(_MAIN_NS + "v")
+    if value is None or value.text is None:
+        return ""
+    if kind == "s":
+        return shared[int(value.text)]
+    text = value.text
+    # Les nombres entiers sont stockés sous la forme "12.0" par certains tableurs
+    return text[:-2] if kind is None and text.endswith(".0") else text
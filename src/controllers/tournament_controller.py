@@ -3,19 +3,87 @@ Contrôleur pour gérer un tournoi de Bélote
 """
 import random
 from itertools import combinations
-from typing import List, Set, Tuple
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from controllers.result_import import ResultReport, read_results
+from controllers.result_journal import ResultEvent, ResultJournal
+from controllers.round_robin import num_rounds, round_robin
+from controllers.swiss_pairing import SwissRound, swiss_pairs
+from controllers.team_import import ImportReport, read_rows, read_team_rows
+from diagnostics.instrumentation import count, timed
+
 from models.team import Team
 from models.player import Player
 from models.tournament import Tournament
 from models.game import Game
+from models.standings import Standings
+from storage.snapshot import Snapshot, save_snapshot
+from storage.sqlite_store import SqliteStore
+
+if TYPE_CHECKING:
+    from controllers.leaderboard import LeaderboardFeed
+
+# Nature d'une modification notifiée aux abonnés
+TEAMS = "teams"
+SCHEDULE = "schedule"
+RESULTS = "results"
+STANDINGS = "standings"
+RESET = "reset"
+
+
+@dataclass(frozen=True)
+class Change:
+    """Modification du tournoi notifiée aux abonnés du contrôleur"""
+    kind: str
+    # Matchs dont le résultat a changé (RESULTS) ou qui ont été créés (SCHEDULE)
+    game_ids: Tuple[int, ...] = ()
+    # Équipes inscrites ou désinscrites (TEAMS)
+    team_names: Tuple[str, ...] = ()
+
+
+Listener = Callable[[Change], None]
+
+# Rapport d'avancement d'un calcul : appelé avec (fait, total). Il peut lever
+# une exception pour interrompre le calcul (voir views.workers).
+Progress = Callable[[int, int], None]
+
+
+def _no_progress(done: int, total: int):
+    pass
+
 
 @dataclass
 class TournamentController:
     """Contrôleur pour un tournoi de Bélote"""
     _tournament_model: Tournament = field(default_factory=Tournament)
+    # Équipes déjà exemptées lors d'une ronde suisse
+    _swiss_byes: Set[str] = field(default_factory=set)
+    _standings: Standings = field(default_factory=Standings)
+    _journal: ResultJournal = field(default_factory=ResultJournal)
+    # Stockage optionnel : chaque modification y est écrite en arrière-plan
+    _store: Optional[SqliteStore] = None
+    _listeners: List[Listener] = field(default_factory=list)
+    # Vrai quand des résultats ont été saisis sans mettre le classement à jour
+    # (validate_matches(defer_standings=True)) ; voir compute_standings
+    _standings_stale: bool = False
+    # Flux du classement en direct, créé au premier abonné (voir leaderboard)
+    _leaderboard: Optional["LeaderboardFeed"] = field(default=None, repr=False)
+
+    def add_listener(self, listener: Listener):
+        """Abonne listener à chaque modification du tournoi (voir Change)"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @timed("controller.notify")
+    def _notify(self, change: Change):
+        for listener in list(self._listeners):
+            listener(change)
     
+    @timed("controller.add_team")
     def add_team(self, team_name: str, player1_name: str, player2_name: str) -> bool: 
         # il faut aussi regarder que le nom d'équipe n'existe pas déjà
         if self._check_team_exists(team_name):
@@ -25,81 +93,529 @@ class TournamentController:
         player2 = Player(player2_name)
         team = Team(team_name, player1, player2)
         self._tournament_model.add_team(team)
+        self._standings.add_team(team_name)
+        if self._store:
+            self._store.add_teams([team])
+        self._notify(Change(TEAMS, team_names=(team_name,)))
         return True
 
+    @timed("controller.import_teams")
+    def import_teams(self, rows: Iterable[Tuple[int, Sequence[str]]]) -> ImportReport:
+        """
+        Inscrit un lot d'équipes en une seule passe
+
+        Toutes les lignes sont validées avant toute inscription : si une
+        seule est invalide, aucune équipe n'est ajoutée et toutes les
+        erreurs sont rapportées ensemble.
+
+        Args:
+            rows: Des couples (numéro de ligne, [équipe, joueur 1, joueur 2]),
+                  lus en flux (voir controllers.team_import.read_team_rows)
+
+        Returns:
+            Le bilan de l'import
+        """
+        report = ImportReport()
+        seen: Set[str] = set()
+        for line, cells in rows:
+            if len(cells) != 3 or not all(cells):
+                report.errors.append(f"Ligne {line} : attendu « équipe, joueur 1, joueur 2 ».")
+                continue
+            team_name, player1, player2 = cells
+            if team_name in seen:
+                report.errors.append(f"Ligne {line} : l'équipe '{team_name}' apparaît plusieurs fois.")
+            elif self._check_team_exists(team_name):
+                report.errors.append(f"Ligne {line} : l'équipe '{team_name}' existe déjà.")
+            seen.add(team_name)
+            report.added.append((team_name, player1, player2))
+        if report.errors:
+            report.added.clear()
+            return report
+
+        teams = [Team(name, Player(player1), Player(player2)) for name, player1, player2 in report.added]
+        for team in teams:
+            self._tournament_model.add_team(team)
+            self._standings.add_team(team.name)
+        if self._store:
+            self._store.add_teams(teams)
+        self._notify(Change(TEAMS, team_names=tuple(team.name for team in teams)))
+        return report
+
+    def import_teams_from_file(self, path: str) -> ImportReport:
+        """
+        Inscrit les équipes d'un fichier CSV ou XLSX (voir import_teams)
+
+        Un fichier illisible est rapporté comme une erreur de l'import.
+        """
+        try:
+            return self.import_teams(read_team_rows(path))
+        except (OSError, ValueError) as error:
+            return ImportReport(errors=[str(error)])
+
+    def import_results_from_file(self, path: str) -> ResultReport:
+        """
+        Valide en un seul lot les scores d'une feuille de résultats CSV ou XLSX
+        (voir controllers.result_import) ; rien n'est validé si une ligne est invalide
+        """
+        try:
+            report = read_results(read_rows(path), self._tournament_model.games)
+        except (OSError, ValueError) as error:
+            return ResultReport(errors=[str(error)])
+        if report.results:
+            self.validate_matches(report.results)
+        return report
+
     def remove_team(self, team_name: str) -> bool:
+        """
+        Désinscrit une équipe
+
+        Returns:
+            False si l'équipe n'existe pas ou a déjà des matchs au calendrier
+            (ils la référencent, en mémoire comme dans le stockage)
+        """
         if not self._check_team_exists(team_name):
             return False
-        return self._tournament_model.remove_team(team_name)
+        if any(game.team1.name == team_name or game.team2.name == team_name
+               for game in self._tournament_model.games):
+            return False
+        self._standings.remove_team(team_name)
+        if self._store:
+            self._store.remove_team(team_name)
+        removed = self._tournament_model.remove_team(team_name)
+        self._notify(Change(TEAMS, team_names=(team_name,)))
+        return removed
     
-    def remove_all_teams(self):
+    def remove_all_teams(self) -> bool:
+        """
+        Désinscrit toutes les équipes
+
+        Returns:
+            False, sans rien supprimer, si des matchs sont déjà au calendrier
+            (voir clear_tournament)
+        """
+        if self._tournament_model.games:
+            return False
+        team_names = tuple(team.name for team in self._tournament_model.teams)
         self._tournament_model.clear_teams()
+        self._standings.clear()
+        if self._store:
+            self._store.clear_teams()
+        self._notify(Change(TEAMS, team_names=team_names))
+        return True
+
+    def attach_store(self, store: Optional[SqliteStore]):
+        """
+        Associe un stockage au contrôleur : les inscriptions, le calendrier
+        et les résultats y sont ensuite écrits au fil de l'eau
+
+        Args:
+            store: Le stockage, ou None pour travailler uniquement en mémoire
+        """
+        self._store = store
+
+    def load_from(self, store: SqliteStore):
+        """
+        Recharge le tournoi enregistré dans store et s'y associe
+
+        Les scores, totaux et classement sont recalculés à partir du journal.
+        """
+        self.adopt(self.prepare(*store.load()))
+        self._store = store
+
+    def export_snapshot(self, path: str):
+        """Écrit l'état complet du tournoi dans un instantané binaire (voir storage.snapshot)"""
+        save_snapshot(path, self._tournament_model.teams, self._tournament_model.games,
+                      self._journal.events)
+
+    def import_snapshot(self, path: str):
+        """
+        Remplace le tournoi par celui d'un instantané binaire
+
+        Le stockage associé, s'il y en a un, est réécrit avec l'état importé.
+        """
+        self.adopt(self.read_snapshot(path), rewrite_store=True)
+
+    # =====================
+    # Préparation hors du thread de l'interface
+    #
+    # Le contrôleur n'est modifié que depuis le thread de l'interface. Les
+    # calculs longs se font sur des objets détachés (prepare, plan_*,
+    # compute_standings) qui peuvent tourner dans un autre thread ; leur
+    # résultat est ensuite installé par la méthode correspondante (adopt,
+    # add_periods, add_swiss_round, adopt_standings), rapide.
+    # =====================
+    @classmethod
+    def prepare(cls, teams: Iterable[Team], games: Iterable[Game], events: Iterable[ResultEvent],
+                progress: Progress = _no_progress) -> "TournamentController":
+        """
+        Construit un contrôleur détaché (sans stockage ni abonné) contenant
+        l'état donné, scores et classement recalculés, à installer par adopt
+        """
+        prepared = cls()
+        prepared._load_state(teams, games, events, progress)
+        return prepared
+
+    @classmethod
+    def read_snapshot(cls, path: str, progress: Progress = _no_progress) -> "TournamentController":
+        """Lit un instantané binaire dans un contrôleur détaché (voir prepare)"""
+        with Snapshot(path) as snapshot:
+            teams, games, events = snapshot.load()
+        return cls.prepare(teams, games, events, progress)
+
+    @timed("controller.adopt")
+    def adopt(self, prepared: "TournamentController", rewrite_store: bool = False):
+        """
+        Remplace le tournoi par celui d'un contrôleur préparé
+
+        Args:
+            prepared: Un contrôleur construit par prepare ou read_snapshot
+            rewrite_store: Réécrire le stockage associé avec l'état adopté
+        """
+        self._tournament_model = prepared._tournament_model
+        self._swiss_byes = prepared._swiss_byes
+        self._standings = prepared._standings
+        self._journal = prepared._journal
+        self._standings_stale = False
+        if rewrite_store and self._store:
+            self._rewrite_store()
+        self._notify(Change(RESET))
+
+    def save_to(self, store: SqliteStore):
+        """
+        Associe store au contrôleur et y remplace le tournoi enregistré par
+        l'état courant (tournoi préparé sans stockage, voir attach_store)
+        """
+        self._store = store
+        self._rewrite_store()
+
+    def _rewrite_store(self):
+        self._store.clear()
+        self._store.add_teams(self._tournament_model.teams)
+        self._store.add_games(self._tournament_model.games)
+        self._store.append_events(self._journal.events)
+
+    def _load_state(self, teams: Iterable[Team], games: Iterable[Game], events: Iterable[ResultEvent],
+                    progress: Progress = _no_progress):
+        self._clear_state()
+        progress(0, 4)
+        for team in teams:
+            self._tournament_model.add_team(team)
+        progress(1, 4)
+        for game in games:
+            self._tournament_model.add_game(game)
+        progress(2, 4)
+        self._journal.restore(events)
+        progress(3, 4)
+        self.rebuild_results()
+        progress(4, 4)
+
+    @property
+    def teams(self) -> Sequence[Team]:
+        """Retourne les équipes inscrites (vue en lecture seule)"""
+        return self._tournament_model.teams
+
+    @property
+    def games(self) -> Sequence[Game]:
+        """Retourne les matchs du calendrier (vue en lecture seule)"""
+        return self._tournament_model.games
+
+    @property
+    def standings(self) -> Standings:
+        """Retourne le classement, tenu à jour à chaque résultat"""
+        return self._standings
+
+    @property
+    def leaderboard(self) -> "LeaderboardFeed":
+        """Retourne le flux des changements du classement (un seul par contrôleur)"""
+        if self._leaderboard is None:
+            # Importé ici : le flux dépend de ce module
+            from controllers.leaderboard import LeaderboardFeed
+            self._leaderboard = LeaderboardFeed(self)
+        return self._leaderboard
 
     def _check_team_exists(self, team_name: str) -> bool:
-        return any(team.name == team_name for team in self._tournament_model.teams)
+        return self._tournament_model.has_team(team_name)
 
-    def start_tournament(self) -> List[List['Game']]:
+    @timed("controller.start_tournament")
+    def start_tournament(self, num_periods: int = 4) -> List[List['Game']]:
         """
-        Génère 4 périodes de matchs pour un tournoi en Round-Robin.
-        Chaque équipe joue exactement une fois par période et aucun match n'est répété.
-        
+        Génère les périodes de matchs d'un tournoi en Round-Robin.
+        Chaque équipe joue au plus une fois par période (avec un nombre impair
+        d'équipes, une équipe est exempte à chaque période) et aucun match n'est répété.
+
+
+        Args:
+            num_periods: Le nombre de périodes souhaité, ramené au Round-Robin
+                         complet s'il y a trop peu d'équipes
+
         Returns:
             List[List[Game]] : liste des périodes, chaque période est une liste de Game
         """
-        teams = self._tournament_model.teams
-        num_teams = len(teams)
-        
-        if num_teams % 2 != 0:
-            raise ValueError("Le round-robin classique nécessite un nombre pair d'équipes.")
+        return self.add_periods(self.plan_tournament(num_periods))
 
-        num_periods = 4  # nombre de périodes souhaité
+    @timed("controller.plan_tournament")
+    def plan_tournament(self, num_periods: int = 4, progress: Progress = _no_progress) -> List[List['Game']]:
+        """
+        Calcule les périodes de start_tournament sans les ajouter au tournoi
+        (peut s'exécuter hors du thread de l'interface ; voir add_periods)
+        """
+        teams = tuple(self._tournament_model.teams)
+        num_periods = min(num_periods, num_rounds(len(teams)))
         all_games: List[List['Game']] = []
 
-        # Round-Robin : on fixe la première équipe et on fait tourner les autres
-        fixed_team = teams[0]
-        rotating_teams = teams[1:]
+        for schedule_round in round_robin(teams, num_periods):
+            all_games.append([
+                Game(team1, team2, _period=schedule_round.index)
+                for team1, team2 in schedule_round.pairs
+            ])
+            progress(len(all_games), num_periods)
+        return all_games
 
-        for period in range(num_periods):
-            period_games: List['Game'] = []
+    @timed("controller.add_periods")
+    def add_periods(self, periods: List[List['Game']]) -> List[List['Game']]:
+        """Ajoute au tournoi des périodes calculées par plan_tournament"""
+        for period_games in periods:
+            for game in period_games:
+                self._tournament_model.add_game(game)
 
-            # Création des paires
-            pairs = []
+        if self._store:
+            self._store.add_games(game for period_games in periods for game in period_games)
+        self._notify(Change(SCHEDULE, game_ids=tuple(
+            game.id for period_games in periods for game in period_games)))
+        return periods
 
-            # Première paire avec l'équipe fixe
-            pair = (fixed_team, rotating_teams[-1])
-            pairs.append(pair)
+    def start_swiss_round(self) -> List['Game']:
+        """
+        Génère la ronde suivante d'un tournoi en système suisse.
+        Les équipes de scores égaux ou proches se rencontrent, sans revanche
+        tant que c'est possible ; avec un nombre impair d'équipes, la moins
+        bien classée non encore exemptée ne joue pas cette ronde.
 
-            # Paires pour le reste des équipes
-            for i in range(len(rotating_teams) // 2):
-                pair = (rotating_teams[i], rotating_teams[-i-2])
-                pairs.append(pair)
+        Returns:
+            List[Game] : les matchs de la nouvelle ronde
 
-            # Créer les objets Game et ajouter au tournoi
-            for team1, team2 in pairs:
-                game = Game(team1, team2)
-                period_games.append(game)
-                self._tournament_model.add_game(game)
+        Raises:
+            ValueError: Si un match de la ronde précédente n'a pas encore de score
+        """
+        return self.add_swiss_round(self.plan_swiss_round())
 
-            all_games.append(period_games)
+    def plan_swiss_round(self, progress: Progress = _no_progress) -> SwissRound[Team]:
+        """
+        Calcule l'appariement de start_swiss_round sans l'ajouter au tournoi
+        (peut s'exécuter hors du thread de l'interface ; voir add_swiss_round)
 
-            # Affichage lisible
-            print(f"\n=== Période {period + 1} ===")
-            for i, game in enumerate(period_games, 1):
-                print(f"Table {i}: {game.team1.name} vs {game.team2.name}")
-            print(f"Total matchs période {len(period_games)}")
+        Raises:
+            ValueError: Si un match de la ronde précédente n'a pas encore de score
+        """
+        games = tuple(self._tournament_model.games)
+        if any(not game.is_played for game in games):
+            raise ValueError("Tous les matchs de la ronde précédente doivent être validés.")
+        played = {frozenset((game.team1.name, game.team2.name)) for game in games}
+        progress(0, 1)
 
-            # Rotation des équipes (excepté la première)
-            rotating_teams = [rotating_teams[-1]] + rotating_teams[:-1]
+        swiss_round = swiss_pairs(
+            tuple(self._tournament_model.teams),
+            score=lambda team: team.score,
+            key=lambda team: team.name,
+            played=played,
+            byes=set(self._swiss_byes),
+        )
+        progress(1, 1)
+        return swiss_round
 
-        return all_games
+    def add_swiss_round(self, swiss_round: SwissRound[Team]) -> List['Game']:
+        """Ajoute au tournoi une ronde calculée par plan_swiss_round"""
+        games = self._tournament_model.games
+        period = games[-1].period + 1 if games else 0
+        if swiss_round.bye is not None:
+            self._swiss_byes.add(swiss_round.bye.name)
 
+        period_games = [Game(team1, team2, _period=period) for team1, team2 in swiss_round.pairs]
+        for game in period_games:
+            self._tournament_model.add_game(game)
+        if self._store:
+            self._store.add_games(period_games)
+        self._notify(Change(SCHEDULE, game_ids=tuple(game.id for game in period_games)))
+        return period_games
+
+    @timed("controller.validate_match")
     def validate_match(self, game_id: int, scores: tuple):
         """Valide les scores d'un match"""
-        game = next((g for g in self._tournament_model.games if g.id == game_id), None)
-        if game: 
-            game.set_scores(scores[0], scores[1])
+        if self._tournament_model.get_game(game_id): 
+            self._apply_event(self._journal.submit(game_id, scores))
+            count("controller.results")
+            self._notify(Change(RESULTS, game_ids=(game_id,)))
+
+    @timed("controller.cancel_match")
+    def cancel_match(self, game_id: int) -> bool:
+        """
+        Annule les scores d'un match validé
+
+        Returns:
+            True si un résultat a été annulé
+        """
+        if self._tournament_model.get_game(game_id) is None:
+            return False
+        event = self._journal.cancel(game_id)
+        if event is None:
+            return False
+        self._apply_event(event)
+        self._notify(Change(RESULTS, game_ids=(game_id,)))
+        return True
+
+    @timed("controller.validate_matches")
+    def validate_matches(self, results: Iterable[Tuple[int, tuple]],
+                         defer_standings: bool = False) -> Tuple[int, ...]:
+        """
+        Valide les scores de plusieurs matchs en un seul appel
+
+        Args:
+            results: Des couples (identifiant du match, (score1, score2))
+            defer_standings: Ne pas mettre le classement à jour : il devra
+                             être recalculé par compute_standings puis
+                             installé par adopt_standings, par exemple hors
+                             du thread de l'interface pour un gros lot
+
+        Returns:
+            Les identifiants des matchs validés (les identifiants inconnus sont ignorés)
+        """
+        if defer_standings:
+            self._standings_stale = True
+        get_game = self._tournament_model.get_game
+        validated, events = [], []
+        for game_id, scores in results:
+            if get_game(game_id):
+                event = self._journal.submit(game_id, scores)
+                self._apply_event(event, persist=False)
+                events.append(event)
+                validated.append(game_id)
+        if self._store and events:
+            self._store.append_events(events)
+        count("controller.results", len(validated))
+        # Une seule notification pour tout le lot
+        if validated:
+            self._notify(Change(RESULTS, game_ids=tuple(validated)))
+        return tuple(validated)
+
+    @property
+    def standings_stale(self) -> bool:
+        """Indique que le classement attend un recalcul (voir validate_matches)"""
+        return self._standings_stale
+
+    @timed("controller.compute_standings")
+    def compute_standings(self, progress: Progress = _no_progress) -> Tuple[Standings, int]:
+        """
+        Recalcule un classement complet à partir du journal, sans rien modifier
+
+        Peut s'exécuter hors du thread de l'interface : seul l'état du journal
+        à l'appel est lu, et les saisies faites pendant le calcul seront
+        rejouées par adopt_standings.
+
+        Returns:
+            (classement, nombre d'événements du journal pris en compte)
+        """
+        seq = len(self._journal)
+        results = self._journal.state_at(seq)
+        team_names = [team.name for team in tuple(self._tournament_model.teams)]
+        progress(1, 3)
+        get_game = self._tournament_model.get_game
+        played = []
+        for game_id, scores in results.items():
+            game = get_game(game_id)
+            if game:
+                played.append((game.team1.name, game.team2.name, *scores))
+        progress(2, 3)
+        standings = Standings()
+        standings.rebuild(team_names, played)
+        progress(3, 3)
+        return standings, seq
+
+    def adopt_standings(self, standings: Standings, seq: int):
+        """
+        Installe un classement calculé par compute_standings
+
+        Les événements du journal postérieurs à seq y sont d'abord rejoués.
+        """
+        get_game = self._tournament_model.get_game
+        for event in self._journal.events[seq:]:
+            game = get_game(event.game_id)
+            if game is None:
+                continue
+            if event.previous is not None:
+                standings.cancel_result(game.team1.name, game.team2.name, *event.previous)
+            if event.scores is not None:
+                standings.record_result(game.team1.name, game.team2.name, *event.scores)
+        self._standings = standings
+        self._standings_stale = False
+        self._notify(Change(STANDINGS))
+
+    @property
+    def journal(self) -> ResultJournal:
+        """Retourne le journal des saisies et annulations de scores"""
+        return self._journal
+
+    def undo(self) -> bool:
+        """Annule la dernière saisie ou annulation de score"""
+        event = self._journal.undo()
+        if event is None:
+            return False
+        self._apply_event(event)
+        self._notify(Change(RESULTS, game_ids=(event.game_id,)))
+        return True
+
+    def redo(self) -> bool:
+        """Rétablit la dernière action annulée par undo"""
+        event = self._journal.redo()
+        if event is None:
+            return False
+        self._apply_event(event)
+        self._notify(Change(RESULTS, game_ids=(event.game_id,)))
+        return True
+
+    def rebuild_results(self):
+        """
+        Recalcule scores des matchs, totaux des équipes et classement
+        à partir de l'état replié du journal
+        """
+        for game in self._tournament_model.games:
+            game.cancel_scores()
+        played = []
+        for game_id, scores in self._journal.results.items():
+            game = self._tournament_model.get_game(game_id)
+            if game:
+                game.set_scores(*scores)
+                played.append((game.team1.name, game.team2.name, *scores))
+        self._standings.rebuild((team.name for team in self._tournament_model.teams), played)
+        self._standings_stale = False
+        self._notify(Change(RESET))
+
+    def _apply_event(self, event: ResultEvent, persist: bool = True):
+        """Répercute un événement du journal sur le match et le classement"""
+        game = self._tournament_model.get_game(event.game_id)
+        # Un classement en attente de recalcul sera remplacé : inutile de le tenir à jour
+        update_standings = not self._standings_stale
+        if game.is_played:
+            if update_standings:
+                self._standings.cancel_result(game.team1.name, game.team2.name, *game.scores)
+            game.cancel_scores()
+        if event.scores is not None:
+            game.set_scores(*event.scores)
+            if update_standings:
+                self._standings.record_result(game.team1.name, game.team2.name, *event.scores)
+        if persist and self._store:
+            self._store.append_events([event])
 
     def clear_tournament(self):
         """Réinitialise le tournoi en supprimant toutes les équipes et tous les matchs"""
+        self._clear_state()
+        if self._store:
+            self._store.clear()
+        self._notify(Change(RESET))
+
+    def _clear_state(self):
         self._tournament_model.clear_teams()
-        self._tournament_model.clear_games()
\ No newline at end of file
+        self._tournament_model.clear_games()
+        self._swiss_byes.clear()
+        self._standings.clear()
+        self._journal.clear()
+        self._standings_stale = False
\ No newline at end of file
@@ -0,0 +1,306 @@
+"""
+Instrumentation à la demande : durées, compteurs, profil et mémoire
+
+Désactivée par défaut. La variable d'environnement BELOTE_INSTRUMENT
+l'active au lancement ; elle contient une liste de modes séparés par des
+virgules :
+
+- ``timers`` (ou ``1``) : durées et compteurs des opérations instrumentées ;
+- ``profile`` : profil cProfile du thread principal, écrit dans ``belote.prof`` ;
+- ``memory`` : suivi des allocations par tracemalloc, écrit dans ``belote-memory.txt``.
+
+``profile`` et ``memory`` activent aussi ``timers``. Les fichiers sont écrits
+à la fermeture de l'application dans BELOTE_INSTRUMENT_DIR (dossier courant
+par défaut), avec les statistiques agrégées dans ``belote-stats.json`` ; le
+panneau de diagnostic (Ctrl+Maj+D, voir views.diagnostics_view) les affiche
+en cours d'exécution.
+
+Coût nul si l'instrumentation est désactivée : le mode est lu une seule fois,
+à l'import, et ``timed`` renvoie alors la fonction décorée telle quelle.
+
+Usage :
+    @timed("controller.validate_match")
+    def validate_match(...): ...
+
+    with span("views.build.matches"):
+        ...
+
+    count("controller.results", len(results))
+"""
+import atexit
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Set, TypeVar
+
+ENV_VAR = "BELOTE_INSTRUMENT"
+OUTPUT_DIR_ENV_VAR = "BELOTE_INSTRUMENT_DIR"
+
+TIMERS = "timers"
+PROFILE = "profile"
+MEMORY = "memory"
+
+STATS_FILE = "belote-stats.json"
+PROFILE_FILE = "belote.prof"
+MEMORY_FILE = "belote-memory.txt"
+
+# Histogramme log-linéaire : chaque puissance de deux (en microsecondes) est
+# découpée en SUB_BUCKETS seaux, soit une erreur relative d'au plus 25 %
+SUB_BUCKETS = 4
+_SUB_BITS = 2
+# Jusqu'à 2**31 µs (~36 min) ; au-delà, tout tombe dans le dernier seau
+NUM_BUCKETS = 31 * SUB_BUCKETS
+# Lignes de code les plus allocatrices écrites dans MEMORY_FILE
+MEMORY_TOP_LINES = 30
+
+F = TypeVar("F", bound=Callable)
+
+
+def _bucket(micros: int) -> int:
+    """Indice du seau d'une durée en microsecondes"""
+    if micros < SUB_BUCKETS:
+        return micros
+    exponent = micros.bit_length() - 1
+    sub = (micros >> (exponent - _SUB_BITS)) - SUB_BUCKETS
+    return min((exponent - 1) * SUB_BUCKETS + sub, NUM_BUCKETS - 1)
+
+
+def _bucket_limit(index: int) -> int:
+    """Borne haute (exclue) du seau index, en microsecondes"""
+    if index < SUB_BUCKETS:
+        return index + 1
+    exponent, sub = divmod(index, SUB_BUCKETS)
+    return (SUB_BUCKETS + sub + 1) << (exponent - 1)
+
+
+def _read_modes() -> Set[str]:
+    value = os.environ.get(ENV_VAR, "").strip().lower()
+    if value in ("", "0", "off", "false"):
+        return set()
+    modes = {mode.strip() for mode in value.split(",") if mode.strip()}
+    modes.discard("1")
+    modes.add(TIMERS)
+    return modes
+
+
+MODES = _read_modes()
+ENABLED = TIMERS in MODES
+
+
+# =====================
+# Agrégats
+# =====================
+@dataclass
+class LatencyHistogram:
+    """Histogramme log-linéaire des durées d'une opération"""
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * NUM_BUCKETS)
+
+    def record(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[_bucket(int(seconds * 1e6))] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Durée sous laquelle se trouve la fraction donnée des appels
+
+        Approchée par la borne haute du seau (au plus 25 % au-dessus de la
+        valeur exacte), sans dépasser la durée maximale observée.
+        """
+        if not self.calls:
+            return 0.0
+        threshold = fraction * self.calls
+        seen = 0
+        for bucket, calls in enumerate(self.buckets):
+            seen += calls
+            if seen >= threshold:
+                return min(_bucket_limit(bucket) / 1e6, self.max)
+        return self.max
+
+    def to_json(self) -> dict:
+        return {
+            "calls": self.calls, "total": self.total, "mean": self.mean, "max": self.max,
+            "p50": self.percentile(0.5), "p90": self.percentile(0.9), "p99": self.percentile(0.99),
+            "buckets_us": {f"<{_bucket_limit(bucket)}": calls
+                           for bucket, calls in enumerate(self.buckets) if calls},
+        }
+
+
+class Instruments:
+    """Durées et compteurs agrégés, alimentés depuis n'importe quel thread"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, int] = {}
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> dict:
+        """État courant, sérialisable en JSON"""
+        with self._lock:
+            stats = {
+                "timers": {name: histogram.to_json() for name, histogram in sorted(self.histograms.items())},
+                "counters": dict(sorted(self.counters.items())),
+            }
+        memory = memory_usage()
+        if memory is not None:
+            stats["memory"] = {"current": memory[0], "peak": memory[1]}
+        return stats
+
+
+INSTRUMENTS = Instruments()
+
+
+# =====================
+# Points de mesure
+# =====================
+class _Span:
+    __slots__ = ("_name", "_start")
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        INSTRUMENTS.record(self._name, time.perf_counter() - self._start)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Décorateur : mesure chaque appel de la fonction sous le nom name"""
+    def decorate(function: F) -> F:
+        if not ENABLED:
+            return function
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                INSTRUMENTS.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def span(name: str):
+    """Gestionnaire de contexte : mesure la durée du bloc sous le nom name"""
+    return _Span(name) if ENABLED else _NULL_SPAN
+
+
+def count(name: str, amount: int = 1):
+    """Ajoute amount au compteur name"""
+    if ENABLED:
+        INSTRUMENTS.count(name, amount)
+
+
+# =====================
+# Profil, mémoire et export
+# =====================
+_profiler = None
+
+
+def start():
+    """Lance les captures demandées par BELOTE_INSTRUMENT ; à appeler une fois au démarrage"""
+    global _profiler
+    if not ENABLED:
+        return
+    if MEMORY in MODES:
+        import tracemalloc
+        tracemalloc.start(25)
+    if PROFILE in MODES and _profiler is None:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    atexit.register(dump)
+
+
+def memory_usage() -> Optional[tuple]:
+    """(mémoire allouée, pic) en octets si tracemalloc est actif, None sinon"""
+    if MEMORY not in MODES:
+        return None
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()
+
+
+def output_directory() -> str:
+    return os.environ.get(OUTPUT_DIR_ENV_VAR) or os.getcwd()
+
+
+def dump(directory: Optional[str] = None) -> List[str]:
+    """
+    Écrit les statistiques, et le profil et les allocations s'ils sont capturés
+
+    Args:
+        directory: Le dossier de destination (BELOTE_INSTRUMENT_DIR par défaut)
+
+    Returns:
+        Les chemins des fichiers écrits
+    """
+    if not ENABLED:
+        return []
+    import json
+    directory = directory or output_directory()
+    os.makedirs(directory, exist_ok=True)
+    written = [os.path.join(directory, STATS_FILE)]
+    with open(written[0], "w", encoding="utf-8") as file:
+        json.dump(INSTRUMENTS.snapshot(), file, indent=2)
+
+    if _profiler is not None:
+        path = os.path.join(directory, PROFILE_FILE)
+        _profiler.disable()
+        _profiler.dump_stats(path)
+        _profiler.enable()
+        written.append(path)
+
+    if memory_usage() is not None:
+        import tracemalloc
+        path = os.path.join(directory, MEMORY_FILE)
+        top = tracemalloc.take_snapshot().statistics("lineno")[:MEMORY_TOP_LINES]
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(str(stat) for stat in top) + "\n")
+        written.append(path)
+    return written
@@ -1,15 +1,33 @@
 """
 Point d'entrée de l'application Bélote
+
+Seul le cadre de la fenêtre est construit avant le premier affichage ; le
+contrôleur et les vues sont chargés ensuite (voir views.main_window).
+Budget de démarrage vérifié par benchmarks/bench_startup.py.
 """
 import sys
+from typing import List, Tuple
+
 from PySide6.QtWidgets import QApplication
+from diagnostics import instrumentation
 from views.main_window import MainWindow
+from views.theme import apply_theme
+
+
+def launch(argv: List[str]) -> Tuple[QApplication, MainWindow]:
+    """Crée l'application et affiche la fenêtre, sans lancer la boucle d'événements"""
+    app = QApplication(argv)
+    apply_theme(app)
+    with instrumentation.span("views.build.main_window"):
+        window = MainWindow()
+    return app, window
 
 
 def main():
     """Fonction principale pour lancer l'application"""
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    # Profil et suivi mémoire si demandés par BELOTE_INSTRUMENT
+    instrumentation.start()
+    app, window = launch(sys.argv)
     sys.exit(app.exec())
 
 
@@ -1,8 +1,15 @@
 """
 Module pour gérer les cartes à jouer de la Bélote
+
+Les cartes sont encodées en interne par un petit entier de 0 à 31
+(``indice = couleur * 8 + rang``) et une main par un masque de 32 bits
+(le bit ``i`` est à 1 si la carte d'indice ``i`` est dans la main).
+Les points sont précalculés dans des tables indexées par l'atout, ce qui
+ramène le comptage d'une main ou d'un pli à quelques lectures de table.
 """
 from enum import Enum
 from dataclasses import dataclass
+from typing import Iterable, List, Tuple
 
 
 class Suit(Enum):
@@ -25,12 +32,113 @@ class Rank(Enum):
     ACE = "A"
 
 
+# =====================
+# Encodage entier
+# =====================
+NUM_CARDS = 32
+SUITS: Tuple[Suit, ...] = tuple(Suit)
+RANKS: Tuple[Rank, ...] = tuple(Rank)
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+
+FULL_DECK_MASK = (1 << NUM_CARDS) - 1
+# Masque des 8 cartes de chaque couleur
+SUIT_MASKS: Tuple[int, ...] = tuple(0xFF << (8 * s) for s in range(len(SUITS)))
+
+# Points par rang (dans l'ordre de Rank) à l'atout et hors atout
+TRUMP_RANK_POINTS: Tuple[int, ...] = (0, 0, 14, 10, 20, 3, 4, 11)
+PLAIN_RANK_POINTS: Tuple[int, ...] = (0, 0, 0, 10, 2, 3, 4, 11)
+
+# CARD_POINTS[atout][carte] : points de la carte selon la couleur d'atout
+CARD_POINTS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        (TRUMP_RANK_POINTS if card >> 3 == trump else PLAIN_RANK_POINTS)[card & 7]
+        for card in range(NUM_CARDS)
+    )
+    for trump in range(len(SUITS))
+)
+
+
+def _byte_points(rank_points: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Points de chacun des 256 sous-ensembles de rangs d'une couleur"""
+    return tuple(
+        sum(points for bit, points in enumerate(rank_points) if byte >> bit & 1)
+        for byte in range(256)
+    )
+
+
+# Points d'un octet de main (une couleur) à l'atout / hors atout
+TRUMP_BYTE_POINTS = _byte_points(TRUMP_RANK_POINTS)
+PLAIN_BYTE_POINTS = _byte_points(PLAIN_RANK_POINTS)
+
+
+def card_index(rank: Rank, suit: Suit) -> int:
+    """Retourne l'indice (0-31) d'une carte"""
+    return SUIT_INDEX[suit] * 8 + RANK_INDEX[rank]
+
+
+def hand_mask(cards: Iterable["Card"]) -> int:
+    """Convertit une collection de cartes en masque de 32 bits"""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.index
+    return mask
+
+
+def mask_to_indices(mask: int) -> List[int]:
+    """Retourne les indices des cartes présentes dans un masque, par ordre croissant"""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
+def hand_points(mask: int, trump: int) -> int:
+    """
+    Compte les points d'une main ou d'un pli encodé en masque
+
+    Args:
+        mask: Le masque de 32 bits des cartes
+        trump: L'indice de la couleur d'atout (voir SUIT_INDEX)
+
+    Returns:
+        Le total des points des cartes du masque
+    """
+    total = 0
+    for suit in range(4):
+        byte = (mask >> (8 * suit)) & 0xFF
+        total += TRUMP_BYTE_POINTS[byte] if suit == trump else PLAIN_BYTE_POINTS[byte]
+    return total
+
+
+def suit_count(mask: int, suit: int) -> int:
+    """Retourne le nombre de cartes d'une couleur dans un masque"""
+    return (mask & SUIT_MASKS[suit]).bit_count()
+
+
 @dataclass
 class Card:
     """Représente une carte à jouer"""
     rank: Rank
     suit: Suit
 
+    @classmethod
+    def from_index(cls, index: int) -> "Card":
+        """Construit une carte à partir de son indice (0-31)"""
+        return cls(RANKS[index & 7], SUITS[index >> 3])
+
+    @property
+    def index(self) -> int:
+        """Retourne l'indice (0-31) de la carte"""
+        return SUIT_INDEX[self.suit] * 8 + RANK_INDEX[self.rank]
+
+    @property
+    def mask(self) -> int:
+        """Retourne le masque de 32 bits ne contenant que cette carte"""
+        return 1 << self.index
+
     def __str__(self) -> str:
         return f"{self.rank.value}{self.suit.value}"
 
@@ -40,36 +148,11 @@ class Card:
     def get_points_at_suit(self, trump_suit: Suit) -> int:
         """
         Retourne les points de la carte selon si elle est un atout ou non
-        
+
         Args:
             trump_suit: La couleur d'atout
-            
+
         Returns:
             Le nombre de points de la carte
         """
-        is_trump = self.suit == trump_suit
-        
-        if is_trump:
-            points_map = {
-                Rank.SEVEN: 0,
-                Rank.EIGHT: 0,
-                Rank.NINE: 14,
-                Rank.TEN: 10,
-                Rank.JACK: 20,
-                Rank.QUEEN: 3,
-                Rank.KING: 4,
-                Rank.ACE: 11,
-            }
-        else:
-            points_map = {
-                Rank.SEVEN: 0,
-                Rank.EIGHT: 0,
-                Rank.NINE: 0,
-                Rank.TEN: 10,
-                Rank.JACK: 2,
-                Rank.QUEEN: 3,
-                Rank.KING: 4,
-                Rank.ACE: 11,
-            }
-        
-        return points_map.get(self.rank, 0)
+        return CARD_POINTS[SUIT_INDEX[trump_suit]][self.index]
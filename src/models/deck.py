@@ -1,18 +1,33 @@
 """
 Module pour gérer le jeu de cartes (paquet)
+
+En plus du paquet d'objets ``Card`` utilisé par l'interface, le module
+fournit une distribution vectorisée (NumPy) pour les simulations : les
+cartes y sont manipulées par leur indice entier (voir ``models.card``).
 """
 import random
-from typing import List
-from .card import Card, Suit, Rank
+from typing import List, Optional
+
+import numpy as np
+
+from .card import Card, Suit, Rank, NUM_CARDS
+
+NUM_PLAYERS = 4
+HAND_SIZE = NUM_CARDS // NUM_PLAYERS
+
+# Les 32 indices de cartes, dans l'ordre du paquet neuf
+_ORDERED_INDICES = np.arange(NUM_CARDS, dtype=np.uint8)
+# Masque de 32 bits de chaque indice, pour convertir une main en bitboard
+_INDEX_BITS = np.left_shift(np.uint32(1), np.arange(NUM_CARDS, dtype=np.uint32))
 
 
 class Deck:
     """Représente un paquet de cartes"""
-    
+
     def __init__(self, shuffled: bool = True):
         """
         Initialise le paquet
-        
+
         Args:
             shuffled: Si True, les cartes sont mélangées
         """
@@ -34,10 +49,10 @@ class Deck:
     def draw(self) -> Card:
         """
         Tire une carte du paquet
-        
+
         Returns:
             La carte tirée
-            
+
         Raises:
             IndexError: Si le paquet est vide
         """
@@ -48,16 +63,23 @@ class Deck:
     def deal(self, num_cards: int) -> List[Card]:
         """
         Distribue plusieurs cartes
-        
+
         Args:
             num_cards: Le nombre de cartes à distribuer
-            
+
         Returns:
             Liste des cartes distribuées
+
+        Raises:
+            IndexError: S'il reste moins de num_cards cartes
         """
-        dealt = []
-        for _ in range(num_cards):
-            dealt.append(self.draw())
+        if num_cards > len(self.cards):
+            raise IndexError("Le paquet est vide")
+        if num_cards <= 0:
+            return []
+        # Même ordre que des draw() successifs, mais en une seule opération
+        dealt = self.cards[:-num_cards - 1:-1]
+        del self.cards[-num_cards:]
         return dealt
 
     def __len__(self) -> int:
@@ -67,3 +89,82 @@ class Deck:
     def is_empty(self) -> bool:
         """Vérifie si le paquet est vide"""
         return len(self.cards) == 0
+
+    # =====================
+    # Distribution vectorisée
+    # =====================
+    @staticmethod
+    def deal_batch(num_deals: int, seed=None) -> np.ndarray:
+        """
+        Génère num_deals paquets mélangés d'un coup
+
+        Args:
+            num_deals: Le nombre de donnes à générer
+            seed: Graine ou np.random.Generator, pour des tirages reproductibles
+
+        Returns:
+            Un tableau (num_deals, 32) uint8 : chaque ligne est une permutation
+            des indices de cartes
+        """
+        rng = np.random.default_rng(seed)
+        deals = np.broadcast_to(_ORDERED_INDICES, (num_deals, NUM_CARDS))
+        return rng.permuted(deals, axis=1)
+
+    @staticmethod
+    def split_hands(deals: np.ndarray) -> np.ndarray:
+        """
+        Découpe des donnes en quatre mains de 8 cartes
+
+        Args:
+            deals: Un tableau (N, 32) d'indices de cartes
+
+        Returns:
+            Une vue (N, 4, 8) sur le même tableau (aucune copie)
+        """
+        return deals.reshape(-1, NUM_PLAYERS, HAND_SIZE)
+
+    @staticmethod
+    def hand_masks(hands: np.ndarray) -> np.ndarray:
+        """
+        Convertit des mains d'indices en masques de 32 bits
+
+        Args:
+            hands: Un tableau (..., 8) d'indices de cartes
+
+        Returns:
+            Un tableau (...) uint32 de masques (voir models.card.hand_mask)
+        """
+        return np.bitwise_or.reduce(_INDEX_BITS[hands], axis=-1)
+
+
+class IndexDeck:
+    """
+    Paquet réutilisable d'indices de cartes, mélangé sur place
+
+    Le tableau est alloué une seule fois : shuffle() ne crée aucun objet,
+    ce qui convient aux boucles de simulation donne par donne.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initialise le paquet
+
+        Args:
+            seed: Graine ou np.random.Generator du mélange
+        """
+        self._rng = np.random.default_rng(seed)
+        self.cards: np.ndarray = _ORDERED_INDICES.copy()
+        self._hands: np.ndarray = self.cards.reshape(NUM_PLAYERS, HAND_SIZE)
+
+    def shuffle(self, rng: Optional[np.random.Generator] = None):
+        """Mélange le paquet sur place"""
+        (rng or self._rng).shuffle(self.cards)
+
+    @property
+    def hands(self) -> np.ndarray:
+        """Retourne les quatre mains (4, 8), vue sur le paquet courant"""
+        return self._hands
+
+    def __len__(self) -> int:
+        """Retourne le nombre de cartes du paquet"""
+        return NUM_CARDS
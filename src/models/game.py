@@ -2,10 +2,16 @@
 Module pour gérer une partie de Bélote
 """
 from dataclasses import dataclass, field
+from typing import Tuple
 from uuid import uuid4
 
 from models.team import Team
 
+# Score maximal d'une équipe sur un match, commun à toutes les saisies (vue
+# des matchs, feuilles de résultats, serveur) ; il doit tenir dans les
+# scores sur 16 bits signés des instantanés (storage.snapshot)
+MAX_SCORE = 999
+
 @dataclass
 class Game:
     """Représente une partie de Bélote"""
@@ -14,6 +20,8 @@ class Game:
     _score1: int = 0
     _score2: int = 0
     _id: int = field(default_factory=lambda: uuid4().int) 
+    _period: int = 0
+    _played: bool = False
     
     @property
     def team1(self) -> Team:
@@ -26,10 +34,36 @@ class Game:
     @property
     def id(self) -> int:
         return self._id
+
+    @property
+    def period(self) -> int:
+        """Retourne l'indice (à partir de 0) de la période du match"""
+        return self._period
     
+    @property
+    def is_played(self) -> bool:
+        """Indique si les scores du match ont été saisis"""
+        return self._played
+
+    @property
+    def scores(self) -> Tuple[int, int]:
+        """Retourne les scores des deux équipes"""
+        return self._score1, self._score2
+
     def set_scores(self, score1: int, score2: int):
         """Définit les scores pour les deux équipes"""
+        self._played = True
         self._score1 = score1
         self._score2 = score2
         self._team1.add_score(score1)
-        self._team2.add_score(score2)
\ No newline at end of file
+        self._team2.add_score(score2)
+
+    def cancel_scores(self):
+        """Annule les scores saisis et les retire du total des équipes"""
+        if not self._played:
+            return
+        self._team1.add_score(-self._score1)
+        self._team2.add_score(-self._score2)
+        self._score1 = 0
+        self._score2 = 0
+        self._played = False
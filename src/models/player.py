@@ -8,4 +8,7 @@ class Player:
     """Représente un joueur"""
     _name: str
 
-
+    @property
+    def name(self) -> str:
+        """Retourne le nom du joueur"""
+        return self._name
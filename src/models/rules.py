@@ -0,0 +1,360 @@
+"""
+Module pour appliquer les règles de la Bélote : enchères, jeu de la carte,
+ramassage des plis et décompte des points
+
+Tout le moteur travaille sur l'encodage entier de ``models.card`` : une
+carte est un indice de 0 à 31, une main un masque de 32 bits. Les règles
+de fourniture, de coupe et de surcoupe se résument à quelques opérations
+sur des masques précalculés, si bien que la génération des coups légaux
+coûte O(1) quelle que soit la position.
+
+Règles retenues (règlement FFB) :
+- il faut fournir la couleur demandée ; à l'atout, il faut monter si possible ;
+- sans la couleur demandée, il faut couper, sauf si le partenaire est maître ;
+- si un adversaire a déjà coupé, il faut surcouper, ou à défaut sous-couper ;
+- belote et rebelote (roi et dame d'atout dans la même main) : 20 points ;
+- dix de der : 10 points pour l'équipe qui remporte le dernier pli ;
+- le preneur doit marquer plus que la défense, sinon il est dedans ;
+- capot : 252 points pour l'équipe qui remporte tous les plis.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from .card import (
+    Card, Rank, NUM_CARDS, SUIT_MASKS, CARD_POINTS, RANK_INDEX,
+)
+
+NUM_PLAYERS = 4
+NUM_TRICKS = 8
+TOTAL_POINTS = 162
+CAPOT_POINTS = 252
+BELOTE_POINTS = 20
+LAST_TRICK_BONUS = 10
+NO_SUIT = -1
+
+# Force de chaque rang (dans l'ordre de Rank) hors atout et à l'atout
+PLAIN_STRENGTH: Tuple[int, ...] = (0, 1, 2, 6, 3, 4, 5, 7)   # 7 8 9 V D R 10 As
+TRUMP_STRENGTH: Tuple[int, ...] = (0, 1, 6, 4, 7, 2, 3, 5)   # 7 8 D R 10 As 9 V
+
+# HIGHER_TRUMPS[carte] : cartes de la même couleur qui la battent à l'atout
+HIGHER_TRUMPS: Tuple[int, ...] = tuple(
+    sum(
+        1 << ((card & ~7) | other)
+        for other in range(8)
+        if TRUMP_STRENGTH[other] > TRUMP_STRENGTH[card & 7]
+    )
+    for card in range(NUM_CARDS)
+)
+
+# TRICK_STRENGTH[atout][couleur demandée][carte] : 0 pour une défausse,
+# 8-15 pour la couleur demandée, 16-23 pour un atout
+TRICK_STRENGTH: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(
+            16 + TRUMP_STRENGTH[card & 7] if card >> 3 == trump
+            else 8 + PLAIN_STRENGTH[card & 7] if card >> 3 == lead
+            else 0
+            for card in range(NUM_CARDS)
+        )
+        for lead in range(4)
+    )
+    for trump in range(4)
+)
+
+# Roi et dame de chaque couleur, pour détecter la belote
+BELOTE_MASKS: Tuple[int, ...] = tuple(
+    (1 << (8 * s + RANK_INDEX[Rank.KING])) | (1 << (8 * s + RANK_INDEX[Rank.QUEEN]))
+    for s in range(4)
+)
+
+
+def legal_moves(hand: int, lead_suit: int, trump: int,
+                winning_card: int, partner_winning: bool) -> int:
+    """
+    Retourne le masque des cartes jouables
+
+    Coût : O(1), au plus quatre opérations de masque et une lecture de
+    table ; environ 0,2 µs par appel sous CPython 3.11 (voir
+    benchmarks/bench_rules.py).
+
+    Args:
+        hand: Le masque de la main du joueur
+        lead_suit: La couleur demandée, ou NO_SUIT si le joueur entame
+        trump: L'indice de la couleur d'atout
+        winning_card: La carte maîtresse du pli en cours (ignorée à l'entame)
+        partner_winning: True si le partenaire est maître du pli
+
+    Returns:
+        Le masque des cartes que le joueur a le droit de jouer
+    """
+    if lead_suit < 0:
+        return hand
+    follow = hand & SUIT_MASKS[lead_suit]
+    if lead_suit == trump:
+        if follow:
+            return (follow & HIGHER_TRUMPS[winning_card]) or follow
+        return hand
+    if follow:
+        return follow
+    if partner_winning:
+        return hand
+    trumps = hand & SUIT_MASKS[trump]
+    if not trumps:
+        return hand
+    if winning_card >> 3 == trump:
+        return (trumps & HIGHER_TRUMPS[winning_card]) or trumps
+    return trumps
+
+
+def team_of(seat: int) -> int:
+    """Retourne l'équipe (0 ou 1) d'un joueur"""
+    return seat & 1
+
+
+# =====================================================
+# Enchères
+# =====================================================
+class Bidding:
+    """
+    Enchères classiques à la carte retournée
+
+    Premier tour : chaque joueur, à partir de la droite du donneur, prend
+    dans la couleur de la carte retournée ou passe. Second tour : chaque
+    joueur peut choisir une autre couleur ou passer. Si tout le monde
+    passe deux fois, la donne est à refaire.
+    """
+
+    def __init__(self, dealer: int, turned_card: int):
+        """
+        Initialise les enchères
+
+        Args:
+            dealer: La place du donneur (0-3)
+            turned_card: L'indice de la carte retournée
+        """
+        self.dealer = dealer
+        self.turned_card = turned_card
+        self.current = (dealer + 1) % NUM_PLAYERS
+        self.round = 1
+        self.taker: Optional[int] = None
+        self.trump: Optional[int] = None
+        self._passes = 0
+
+    @property
+    def turned_suit(self) -> int:
+        """Retourne la couleur de la carte retournée"""
+        return self.turned_card >> 3
+
+    @property
+    def is_finished(self) -> bool:
+        """Vérifie si les enchères sont terminées (prise ou donne à refaire)"""
+        return self.taker is not None or self.is_redeal
+
+    @property
+    def is_redeal(self) -> bool:
+        """Vérifie si tous les joueurs ont passé deux fois"""
+        return self._passes >= 2 * NUM_PLAYERS
+
+    def bid(self, take: bool, suit: Optional[int] = None):
+        """
+        Enregistre l'annonce du joueur courant
+
+        Args:
+            take: True pour prendre, False pour passer
+            suit: Au second tour, la couleur choisie (différente de la retournée)
+
+        Raises:
+            ValueError: Si les enchères sont terminées ou l'annonce invalide
+        """
+        if self.is_finished:
+            raise ValueError("Les enchères sont terminées.")
+        if not take:
+            self._passes += 1
+            if self._passes == NUM_PLAYERS:
+                self.round = 2
+            self.current = (self.current + 1) % NUM_PLAYERS
+            return
+        if self.round == 1:
+            if suit is not None and suit != self.turned_suit:
+                raise ValueError("Au premier tour, on ne peut prendre qu'à la couleur retournée.")
+            suit = self.turned_suit
+        elif suit is None or suit == self.turned_suit or not 0 <= suit < 4:
+            raise ValueError("Au second tour, il faut choisir une autre couleur.")
+        self.taker = self.current
+        self.trump = suit
+
+
+def initial_deal(cards: Sequence[int], dealer: int) -> Tuple[List[int], int, List[int]]:
+    """
+    Distribue les cinq premières cartes (3 puis 2) et retourne la suivante
+
+    Args:
+        cards: Les 32 indices du paquet mélangé (liste ou tableau NumPy)
+        dealer: La place du donneur
+
+    Returns:
+        (masques des mains de 5 cartes, carte retournée, cartes restantes)
+    """
+    cards = [int(c) for c in cards]
+    hands = [0] * NUM_PLAYERS
+    pos = 0
+    for count in (3, 2):
+        for offset in range(1, NUM_PLAYERS + 1):
+            seat = (dealer + offset) % NUM_PLAYERS
+            for card in cards[pos:pos + count]:
+                hands[seat] |= 1 << card
+            pos += count
+    return hands, cards[pos], cards[pos + 1:]
+
+
+def complete_deal(hands: List[int], turned_card: int, rest: Sequence[int],
+                  dealer: int, taker: int) -> List[int]:
+    """
+    Termine la distribution après la prise
+
+    Le preneur reçoit la carte retournée et deux cartes, les autres trois.
+
+    Returns:
+        Les masques des quatre mains de 8 cartes
+    """
+    hands = list(hands)
+    hands[taker] |= 1 << turned_card
+    pos = 0
+    for offset in range(1, NUM_PLAYERS + 1):
+        seat = (dealer + offset) % NUM_PLAYERS
+        count = 2 if seat == taker else 3
+        for card in rest[pos:pos + count]:
+            hands[seat] |= 1 << int(card)
+        pos += count
+    return hands
+
+
+# =====================================================
+# Jeu de la carte
+# =====================================================
+class BeloteRound:
+    """
+    Déroulement d'une donne une fois l'atout fixé
+
+    L'état est entièrement entier (masques et indices) : play() et
+    legal_moves() ne créent aucun objet, hormis l'entrée d'historique.
+    """
+
+    def __init__(self, hands: Sequence[int], trump: int, leader: int, taker: int):
+        """
+        Initialise la donne
+
+        Args:
+            hands: Les masques des quatre mains de 8 cartes
+            trump: L'indice de la couleur d'atout
+            leader: La place du joueur qui entame le premier pli
+            taker: La place du preneur
+        """
+        self.hands: List[int] = list(hands)
+        self.trump = trump
+        self.taker = taker
+        self.current = leader
+        self.leader = leader
+        self.lead_suit = NO_SUIT
+        self.winning_card = 0
+        self.winning_seat = leader
+        self.trick: List[Tuple[int, int]] = []
+        self.trick_points = 0
+        self.points = [0, 0]
+        self.tricks_won = [0, 0]
+        self.history: List[Tuple[int, int]] = []
+        self.belote_seat = NO_SUIT
+        belote = BELOTE_MASKS[trump]
+        for seat, hand in enumerate(self.hands):
+            if hand & belote == belote:
+                self.belote_seat = seat
+        self._points_table = CARD_POINTS[trump]
+        self._strength = TRICK_STRENGTH[trump]
+
+    @property
+    def is_over(self) -> bool:
+        """Vérifie si toutes les cartes ont été jouées"""
+        return not (self.hands[0] | self.hands[1] | self.hands[2] | self.hands[3])
+
+    def legal_moves(self) -> int:
+        """Retourne le masque des cartes jouables par le joueur courant"""
+        return legal_moves(
+            self.hands[self.current], self.lead_suit, self.trump, self.winning_card,
+            bool(self.trick) and (self.winning_seat ^ self.current) == 2,
+        )
+
+    def play(self, card: int) -> Optional[int]:
+        """
+        Joue une carte pour le joueur courant
+
+        Args:
+            card: L'indice de la carte jouée
+
+        Returns:
+            La place du gagnant si la carte termine un pli, sinon None
+
+        Raises:
+            ValueError: Si la carte n'est pas jouable
+        """
+        bit = 1 << card
+        if not self.legal_moves() & bit:
+            raise ValueError(f"Coup illégal : {Card.from_index(card)}")
+        seat = self.current
+        self.hands[seat] ^= bit
+        self.history.append((seat, card))
+        self.trick.append((seat, card))
+        self.trick_points += self._points_table[card]
+        if len(self.trick) == 1:
+            self.lead_suit = card >> 3
+            self.winning_card = card
+            self.winning_seat = seat
+        elif self._strength[self.lead_suit][card] > self._strength[self.lead_suit][self.winning_card]:
+            self.winning_card = card
+            self.winning_seat = seat
+        if len(self.trick) < NUM_PLAYERS:
+            self.current = (seat + 1) % NUM_PLAYERS
+            return None
+        return self._collect_trick()
+
+    def _collect_trick(self) -> int:
+        """Attribue le pli terminé à son gagnant"""
+        winner = self.winning_seat
+        team = team_of(winner)
+        self.points[team] += self.trick_points
+        self.tricks_won[team] += 1
+        if self.is_over:
+            self.points[team] += LAST_TRICK_BONUS
+        self.trick = []
+        self.trick_points = 0
+        self.lead_suit = NO_SUIT
+        self.leader = self.current = winner
+        return winner
+
+    def belote_team(self) -> int:
+        """Retourne l'équipe qui a annoncé belote et rebelote, ou NO_SUIT"""
+        return NO_SUIT if self.belote_seat < 0 else team_of(self.belote_seat)
+
+    def scores(self) -> Tuple[int, int]:
+        """
+        Calcule le score final de la donne, contrat appliqué
+
+        Returns:
+            Le score (équipe 0, équipe 1)
+
+        Raises:
+            ValueError: Si la donne n'est pas terminée
+        """
+        if not self.is_over:
+            raise ValueError("La donne n'est pas terminée.")
+        totals = list(self.points)
+        for team in (0, 1):
+            if self.tricks_won[team] == NUM_TRICKS:
+                totals[team], totals[1 - team] = CAPOT_POINTS, 0
+        belote = [0, 0]
+        if self.belote_team() >= 0:
+            belote[self.belote_team()] = BELOTE_POINTS
+        taker_team = team_of(self.taker)
+        defense = 1 - taker_team
+        if totals[taker_team] + belote[taker_team] <= totals[defense] + belote[defense]:
+            totals[defense] += totals[taker_team]
+            totals[taker_team] = 0
+        return totals[0] + belote[0], totals[1] + belote[1]
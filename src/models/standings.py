@@ -0,0 +1,418 @@
+"""
+Module pour gérer le classement d'un tournoi
+
+Le classement est tenu à jour à chaque résultat validé ou annulé, sans
+jamais retrier toutes les équipes : les équipes sont rangées dans un arbre
+d'ordre statistique (treap dont chaque nœud connaît la taille de son
+sous-arbre), de sorte que la mise à jour d'une équipe, son rang et la
+k-ième place coûtent O(log N).
+
+Départage, dans l'ordre :
+    1. points marqués (décroissant)
+    2. points concédés (croissant)
+    3. confrontation directe, lorsque exactement deux équipes sont à égalité
+       et se sont rencontrées (points marqués l'une contre l'autre)
+    4. Buchholz : somme des points des adversaires rencontrés (décroissant)
+    5. nombre de victoires (décroissant)
+    6. nom de l'équipe
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Clé de tri dans l'arbre : les équipes les mieux classées ont la plus petite clé
+SortKey = Tuple[int, int, int, int, str]
+
+
+@dataclass
+class TeamStanding:
+    """Situation d'une équipe au classement"""
+    name: str
+    points: int = 0
+    conceded: int = 0
+    wins: int = 0
+    played: int = 0
+    buchholz: int = 0
+    # Par adversaire : [matchs joués, points marqués, points concédés]
+    opponents: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def key(self) -> SortKey:
+        """Retourne la clé de tri (hors confrontation directe)"""
+        return (-self.points, self.conceded, -self.buchholz, -self.wins, self.name)
+
+    def head_to_head(self, other: str) -> int:
+        """Retourne l'écart de points marqués contre l'équipe other"""
+        record = self.opponents.get(other)
+        return record[1] - record[2] if record else 0
+
+
+class _Node:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key: SortKey, priority: float):
+        self.key = key
+        self.priority = priority
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+        self.size = 1
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _split(node: Optional[_Node], key: SortKey) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Sépare l'arbre en (clés < key, clés >= key)"""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        node.size = 1 + _size(node.left) + _size(node.right)
+        return node, right
+    left, node.left = _split(node.left, key)
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Fusionne deux arbres dont toutes les clés de left précèdent celles de right"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.size = 1 + _size(left.left) + _size(left.right)
+        return left
+    right.left = _merge(left, right.left)
+    right.size = 1 + _size(right.left) + _size(right.right)
+    return right
+
+
+def _insert(node: Optional[_Node], new: _Node) -> _Node:
+    if node is None:
+        return new
+    if new.priority > node.priority:
+        new.left, new.right = _split(node, new.key)
+        new.size = 1 + _size(new.left) + _size(new.right)
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    node.size += 1
+    return node
+
+
+def _erase(node: Optional[_Node], key: SortKey) -> Optional[_Node]:
+    if node is None:
+        raise KeyError(key)
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _erase(node.left, key)
+    else:
+        node.right = _erase(node.right, key)
+    node.size -= 1
+    return node
+
+
+def _count_less(node: Optional[_Node], key: tuple) -> int:
+    count = 0
+    while node is not None:
+        if node.key < key:
+            count += _size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+
+class Standings:
+    """Classement incrémental des équipes d'un tournoi"""
+
+    def __init__(self, seed: int = 0):
+        self._root: Optional[_Node] = None
+        self._teams: Dict[str, TeamStanding] = {}
+        # Priorités du treap : une graine fixe rend la forme de l'arbre reproductible
+        self._rng = random.Random(seed)
+        # Équipes ajoutées, retirées ou dont la situation a changé depuis le
+        # dernier take_changed (voir controllers.leaderboard)
+        self._changed: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._teams)
+
+    def __contains__(self, team_name: str) -> bool:
+        return team_name in self._teams
+
+    def __iter__(self) -> Iterator[TeamStanding]:
+        """Parcourt les équipes dans l'ordre du classement"""
+        return iter(self.top(len(self._teams)))
+
+    def standing(self, team_name: str) -> TeamStanding:
+        """Retourne la situation de l'équipe (KeyError si elle est inconnue)"""
+        return self._teams[team_name]
+
+    def add_team(self, team_name: str):
+        """Ajoute une équipe sans résultat au classement"""
+        if team_name in self._teams:
+            raise ValueError(f"L'équipe {team_name} est déjà classée.")
+        standing = TeamStanding(team_name)
+        self._teams[team_name] = standing
+        self._root = _insert(self._root, _Node(standing.key, self._rng.random()))
+        self._changed.add(team_name)
+
+    def remove_team(self, team_name: str):
+        """Retire une équipe du classement (elle ne doit plus avoir de résultat)"""
+        standing = self._teams[team_name]
+        if standing.opponents:
+            raise ValueError(f"L'équipe {team_name} a des résultats validés.")
+        self._root = _erase(self._root, standing.key)
+        del self._teams[team_name]
+        self._changed.add(team_name)
+
+    def clear(self):
+        """Vide le classement"""
+        self._changed.update(self._teams)
+        self._root = None
+        self._teams.clear()
+
+    def rebuild(self, team_names: Iterable[str], results: Iterable[Tuple[str, str, int, int]]):
+        """
+        Reconstruit tout le classement en une passe, plus vite que des
+        record_result successifs (rechargement d'un tournoi)
+
+        Args:
+            team_names: Les équipes à classer
+            results: Les résultats (équipe 1, équipe 2, score 1, score 2)
+        """
+        self.clear()
+        teams = self._teams
+        for name in team_names:
+            teams[name] = TeamStanding(name)
+        for name1, name2, score1, score2 in results:
+            first, second = teams[name1], teams[name2]
+            for standing, other, scored, conceded in ((first, second, score1, score2),
+                                                      (second, first, score2, score1)):
+                standing.points += scored
+                standing.conceded += conceded
+                standing.played += 1
+                standing.wins += scored > conceded
+                record = standing.opponents.setdefault(other.name, [0, 0, 0])
+                record[0] += 1
+                record[1] += scored
+                record[2] += conceded
+        for standing in teams.values():
+            standing.buchholz = sum(games * teams[name].points
+                                    for name, (games, _, _) in standing.opponents.items())
+        for standing in teams.values():
+            self._root = _insert(self._root, _Node(standing.key, self._rng.random()))
+        self._changed.update(teams)
+
+    # =====================
+    # Mise à jour
+    # =====================
+    def record_result(self, team1: str, team2: str, score1: int, score2: int):
+        """Prend en compte le résultat d'un match"""
+        self._apply(team1, team2, score1, score2, 1)
+
+    def cancel_result(self, team1: str, team2: str, score1: int, score2: int):
+        """Annule un résultat précédemment pris en compte"""
+        self._apply(team1, team2, score1, score2, -1)
+
+    def _apply(self, name1: str, name2: str, score1: int, score2: int, sign: int):
+        first, second = self._teams[name1], self._teams[name2]
+        if sign < 0 and not first.opponents.get(name2, (0,))[0]:
+            raise ValueError(f"Aucun match entre {name1} et {name2} à annuler.")
+        # Les points d'une équipe entrent dans le Buchholz de tous ses adversaires
+        affected = dict.fromkeys((name1, name2, *first.opponents, *second.opponents))
+        for name in affected:
+            self._root = _erase(self._root, self._teams[name].key)
+
+        if sign < 0:
+            self._link(first, second, score1, score2, -1)
+        self._add_points(first, sign * score1)
+        self._add_points(second, sign * score2)
+        if sign > 0:
+            self._link(first, second, score1, score2, 1)
+        for standing, won in ((first, score1 > score2), (second, score2 > score1)):
+            standing.played += sign
+            standing.wins += sign * won
+        first.conceded += sign * score2
+        second.conceded += sign * score1
+
+        for name in affected:
+            self._root = _insert(self._root, _Node(self._teams[name].key, self._rng.random()))
+        self._changed.update(affected)
+
+    def _add_points(self, standing: TeamStanding, points: int):
+        standing.points += points
+        for name, (games, _, _) in standing.opponents.items():
+            self._teams[name].buchholz += points * games
+
+    def _link(self, first: TeamStanding, second: TeamStanding, score1: int, score2: int, sign: int):
+        """Ajoute (sign=1) ou retire (sign=-1) la rencontre entre deux équipes"""
+        for standing, other, scored, conceded in ((first, second, score1, score2),
+                                                  (second, first, score2, score1)):
+            record = standing.opponents.setdefault(other.name, [0, 0, 0])
+            record[0] += sign
+            record[1] += sign * scored
+            record[2] += sign * conceded
+            if not record[0]:
+                del standing.opponents[other.name]
+            standing.buchholz += sign * other.points
+
+    # =====================
+    # Requêtes
+    # =====================
+    def rank_of(self, team_name: str) -> int:
+        """Retourne la place (à partir de 1) de l'équipe, en O(log N)"""
+        standing = self._teams[team_name]
+        index = self._count_less(standing.key)
+        low = self._swapped_pair(standing)
+        if low is not None:
+            index = low + (index == low)
+        return index + 1
+
+    def team_at(self, rank: int) -> TeamStanding:
+        """Retourne l'équipe à la place rank (à partir de 1), en O(log N)"""
+        if not 1 <= rank <= len(self._teams):
+            raise IndexError(rank)
+        index = rank - 1
+        standing = self._teams[self._key_at(index)[4]]
+        low = self._swapped_pair(standing)
+        if low is not None:
+            return self._teams[self._key_at(low + (index == low))[4]]
+        return standing
+
+    def top(self, count: int) -> List[TeamStanding]:
+        """Retourne les count premières équipes du classement, en O(log N + count)"""
+        # Une équipe de plus pour départager une égalité à la dernière place
+        ranked = [self._teams[key[4]] for key in self._first_keys(count + 1)]
+        for index in range(len(ranked) - 1):
+            first, second = ranked[index], ranked[index + 1]
+            if (first.points, first.conceded) == (second.points, second.conceded) \
+                    and self._swapped_pair(first) == index:
+                ranked[index], ranked[index + 1] = second, first
+        return ranked[:count]
+
+    def tied_with(self, team_name: str, limit: int) -> List[str]:
+        """
+        Retourne les équipes (team_name comprise) qui partagent les points
+        marqués et concédés de team_name, dans l'ordre de l'arbre, ou une
+        liste vide si elles sont plus de limit ; en O(log N + limit)
+        """
+        standing = self._teams[team_name]
+        return self.tied_at(standing.points, standing.conceded, limit)
+
+    def tied_at(self, points: int, conceded: int, limit: int) -> List[str]:
+        """
+        Retourne les équipes qui ont ces points marqués et concédés, dans
+        l'ordre de l'arbre, ou une liste vide si elles sont plus de limit ;
+        en O(log N + limit)
+        """
+        low = self._count_less((-points, conceded))
+        high = self._count_less((-points, conceded + 1))
+        if high - low > limit:
+            return []
+        return [self._key_at(index)[4] for index in range(low, high)]
+
+    def take_changed(self) -> Set[str]:
+        """
+        Retourne et oublie les équipes ajoutées, retirées ou dont la
+        situation a changé depuis l'appel précédent
+
+        Un seul lecteur par classement : le flux du contrôleur (voir
+        TournamentController.leaderboard).
+        """
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def _swapped_pair(self, standing: TeamStanding) -> Optional[int]:
+        """
+        Applique la confrontation directe à l'égalité de standing
+
+        Returns:
+            La position (à partir de 0) de la première des deux équipes si
+            exactement deux équipes partagent les points marqués et concédés
+            de standing, se sont rencontrées, et que la seconde dans l'ordre
+            de l'arbre a l'avantage ; None sinon
+        """
+        low = self._count_less((-standing.points, standing.conceded))
+        high = self._count_less((-standing.points, standing.conceded + 1))
+        if high - low != 2:
+            return None
+        first = self._teams[self._key_at(low)[4]]
+        second = self._teams[self._key_at(low + 1)[4]]
+        return low if first.head_to_head(second.name) < 0 else None
+
+    def _count_less(self, key: tuple) -> int:
+        """Nombre de clés strictement inférieures à key"""
+        return _count_less(self._root, key)
+
+    def _key_at(self, index: int) -> SortKey:
+        """Clé de position index (à partir de 0) dans l'ordre de l'arbre"""
+        node = self._root
+        while node is not None:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.key
+            else:
+                index -= left + 1
+                node = node.right
+        raise IndexError(index)
+
+    def _first_keys(self, count: int) -> List[SortKey]:
+        keys: List[SortKey] = []
+        stack: List[_Node] = []
+        node = self._root
+        while (stack or node is not None) and len(keys) < count:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        return keys
+
+
+class KeyIndex:
+    """
+    Ensemble ordonné de clés (tuples), avec le rang d'une clé en O(log N) :
+    même arbre que le classement, pour les lecteurs qui tiennent leur propre
+    ordre (voir controllers.leaderboard)
+    """
+
+    def __init__(self, seed: int = 0):
+        self._root: Optional[_Node] = None
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Parcourt les clés dans l'ordre croissant"""
+        stack: List[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def add(self, key: tuple):
+        self._root = _insert(self._root, _Node(key, self._rng.random()))
+
+    def remove(self, key: tuple):
+        """Retire la clé (KeyError si elle est absente)"""
+        self._root = _erase(self._root, key)
+
+    def count_less(self, key: tuple) -> int:
+        """Nombre de clés strictement inférieures à key"""
+        return _count_less(self._root, key)
@@ -28,6 +28,11 @@ class Team:
         """Retourne le second joueur de l'équipe"""
         return self._player2
     
+    @property
+    def score(self) -> int:
+        """Retourne le score cumulé de l'équipe"""
+        return self._score
+
     def add_score(self, score: int): 
         """Ajoute des points au score de l'équipe"""
         self._score += score
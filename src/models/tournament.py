@@ -1,48 +1,110 @@
 """
 Module pour gérer les tournois de Bélote
 """
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import List
+from types import MappingProxyType
+from typing import Dict, Generic, Iterator, List, Mapping, Optional, TypeVar, Union
 from models.game import Game
 from models.team import Team
 
+T = TypeVar("T")
+
+
+class SequenceView(Sequence, Generic[T]):
+    """
+    Vue en lecture seule sur une liste, sans copie
+
+    La vue reflète les modifications ultérieures de la liste ; une tranche
+    retourne en revanche une nouvelle liste.
+    """
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[T]):
+        self._items = items
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __repr__(self) -> str:
+        return f"SequenceView({self._items!r})"
+
 
 @dataclass
 class Tournament:
     """Représente un tournoi de Bélote"""
     _teams: List[Team] = field(default_factory=list)
     _games: List[Game] = field(default_factory=list)
+    # Index des matchs par identifiant, tenu à jour par add_game et clear_games
+    _games_by_id: Dict[int, Game] = field(default_factory=dict)
+    # Index des équipes par nom, tenu à jour par add_team, remove_team et clear_teams
+    _teams_by_name: Dict[str, Team] = field(default_factory=dict)
 
     @property
-    def teams(self) -> List[Team]:
-        """Retourne la liste des équipes du tournoi"""
-        return self._teams.copy()
+    def teams(self) -> SequenceView[Team]:
+        """Retourne les équipes du tournoi (vue en lecture seule, sans copie)"""
+        return SequenceView(self._teams)
     
     @property
-    def games(self) -> List[Game]:
-        """Retourne la liste des matchs du tournoi"""
-        return self._games.copy()
+    def games(self) -> SequenceView[Game]:
+        """Retourne les matchs du tournoi (vue en lecture seule, sans copie)"""
+        return SequenceView(self._games)
+
+    @property
+    def teams_by_name(self) -> Mapping[str, Team]:
+        """Retourne l'index des équipes par nom (lecture seule)"""
+        return MappingProxyType(self._teams_by_name)
+
+    def has_team(self, team_name: str) -> bool:
+        """Indique si une équipe de ce nom est inscrite"""
+        return team_name in self._teams_by_name
+
+    def get_team(self, team_name: str) -> Optional[Team]:
+        """Retourne l'équipe de ce nom, ou None si elle n'existe pas"""
+        return self._teams_by_name.get(team_name)
     
     def add_team(self, team: Team):
         """Ajoute une équipe au tournoi"""
         self._teams.append(team)
+        self._teams_by_name[team.name] = team
 
     def remove_team(self, team_name: str) -> bool: 
         """Supprime une équipe du tournoi par son nom"""
-        for team in self._teams:
-            if team.name == team_name:
-                self._teams.remove(team)
-                return True
-        return False
+        team = self._teams_by_name.pop(team_name, None)
+        if team is None:
+            return False
+        # Comparaison par identité : deux équipes peuvent être égales champ à champ
+        index = next(i for i, other in enumerate(self._teams) if other is team)
+        del self._teams[index]
+        return True
     
     def clear_teams(self): 
         """Supprime toutes les équipes du tournoi"""
         self._teams.clear()
+        self._teams_by_name.clear()
 
     def clear_games(self):
         """Supprime tous les matchs du tournoi"""
         self._games.clear()
+        self._games_by_id.clear()
     
     def add_game(self, game: Game):
         """Ajoute un match au tournoi"""
         self._games.append(game)
+        self._games_by_id[game.id] = game
+
+    def get_game(self, game_id: int) -> Optional[Game]:
+        """Retourne le match d'identifiant game_id, ou None s'il n'existe pas"""
+        return self._games_by_id.get(game_id)
@@ -0,0 +1,198 @@
+"""
+Client de substitution du serveur de saisie des scores
+
+Simule les capitaines de table : chacun envoie le score de son match en
+même temps que les autres, en HTTP (une connexion par saisie, comme un
+navigateur de téléphone) ou par WebSocket, et la latence de chaque saisie
+est mesurée jusqu'à la réponse du serveur, donc jusqu'à l'application de
+son lot. Bibliothèque standard uniquement.
+
+Usage (serveur lancé par l'application ou par ``python cli.py serve``) :
+    python -m server.score_client --code CODE [--host 127.0.0.1] [--port 8765] [--captains 200] [--websocket 0.5]
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from server.score_server import DEFAULT_PORT, MAX_SCORE
+
+DEFAULT_CAPTAINS = 200
+
+
+async def request(host: str, port: int, method: str, path: str, payload=None) -> Tuple[int, object]:
+    """Une requête HTTP sur une nouvelle connexion ; retourne (code, réponse JSON décodée)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n"
+                     f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+                     .encode("latin-1") + body)
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        length = 0
+        for line in head.decode("latin-1").split("\r\n")[1:]:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await reader.readexactly(length)) if length else None
+    finally:
+        writer.close()
+
+
+class WebSocketClient:
+    """Client WebSocket minimal : messages JSON, trames masquées comme l'exige la RFC 6455"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int, path: str = "/ws") -> "WebSocketClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                     f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        if not head.startswith(b"HTTP/1.1 101"):
+            writer.close()
+            raise ConnectionError(head.split(b"\r\n", 1)[0].decode("latin-1"))
+        return cls(reader, writer)
+
+    async def send(self, message):
+        payload = json.dumps(message).encode("utf-8")
+        mask = os.urandom(4)
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x81, 0x80 | length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x81, 0x80 | 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x81, 0x80 | 127, length)
+        masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        self._writer.write(header + mask + masked)
+        await self._writer.drain()
+
+    async def receive(self):
+        """Le message JSON suivant (les trames de contrôle sont ignorées), None à la fermeture"""
+        while True:
+            first, second = await self._reader.readexactly(2)
+            length = second & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", await self._reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", await self._reader.readexactly(8))[0]
+            payload = await self._reader.readexactly(length)
+            opcode = first & 0x0F
+            if opcode == 0x8:
+                return None
+            if opcode == 0x1:
+                return json.loads(payload)
+
+    async def close(self):
+        self._writer.write(struct.pack("!BB", 0x88, 0x80) + os.urandom(4))
+        try:
+            await self._writer.drain()
+        finally:
+            self._writer.close()
+
+
+# =====================
+# Simulation des capitaines
+# =====================
+@dataclass
+class SimulationReport:
+    """Latences (en secondes) des saisies acceptées et erreurs des autres"""
+    latencies: List[float] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+    # (période, table) effectivement saisies
+    tables: List[Tuple[int, int]] = field(default_factory=list)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self) -> str:
+        return (f"{len(self.latencies)} saisie(s) en {self.elapsed * 1000:.0f} ms, {len(self.errors)} erreur(s) ; "
+                f"latence p50 {self.percentile(0.5) * 1000:.1f} ms, p99 {self.percentile(0.99) * 1000:.1f} ms, "
+                f"max {max(self.latencies, default=0) * 1000:.1f} ms")
+
+
+async def simulate(host: str, port: int, code: str, captains: int = DEFAULT_CAPTAINS,
+                   websocket_share: float = 0.5, seed: int = 0) -> SimulationReport:
+    """
+    Fait saisir en même temps le score de captains tables encore sans résultat
+
+    Args:
+        code: Le code de l'événement (voir ScoreServer.code)
+        websocket_share: La part des capitaines qui saisissent par WebSocket
+    """
+    rng = random.Random(seed)
+    status, tables = await request(host, port, "GET", "/tables")
+    if status != 200:
+        raise ConnectionError(f"GET /tables : {status}")
+    chosen = [(table["period"], table["table"]) for table in tables[:captains]]
+    report = SimulationReport(tables=chosen)
+
+    async def captain(key: Tuple[int, int], use_websocket: bool):
+        message = {"code": code, "period": key[0], "table": key[1],
+                   "scores": [rng.randint(0, MAX_SCORE // 6), rng.randint(0, MAX_SCORE // 6)]}
+        websocket: Optional[WebSocketClient] = None
+        try:
+            if use_websocket:
+                websocket = await WebSocketClient.connect(host, port)
+            start = time.perf_counter()
+            if websocket is not None:
+                await websocket.send(dict(message, id=f"{key[0]}-{key[1]}"))
+                response = await websocket.receive()
+                status = response.get("status", 0) if response else 0
+            else:
+                status, response = await request(host, port, "POST", "/results", message)
+            elapsed = time.perf_counter() - start
+        except (OSError, asyncio.IncompleteReadError) as error:
+            report.errors.append(f"{key} : {error}")
+            return
+        finally:
+            if websocket is not None:
+                await websocket.close()
+        if status == 200 and response and response.get("ok"):
+            report.latencies.append(elapsed)
+        else:
+            report.errors.append(f"{key} : {status} {response and response.get('error')}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(captain(key, rng.random() < websocket_share) for key in chosen))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--code", required=True, help="code de l'événement affiché par le serveur")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--captains", type=int, default=DEFAULT_CAPTAINS, help="saisies simultanées")
+    parser.add_argument("--websocket", type=float, default=0.5, help="part des saisies par WebSocket")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    report = asyncio.run(simulate(args.host, args.port, args.code, args.captains, args.websocket, args.seed))
+    print(report.summary())
+    for error in report.errors[:10]:
+        print(error, file=sys.stderr)
+    sys.exit(1 if report.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,734 @@
+"""
+Serveur de saisie des scores à distance (HTTP et WebSocket)
+
+Les capitaines de table envoient le score de leur match depuis un
+téléphone du réseau local, en même temps, au lieu de le dicter à
+l'opérateur. Le serveur n'utilise que la bibliothèque standard (asyncio) :
+- ``GET /`` : formulaire de saisie pour navigateur mobile ;
+- ``GET /tables`` : les tables du calendrier, en JSON ;
+- ``POST /results`` : un score
+  ``{"code": "K7PM2XQA", "period": 1, "table": 3, "scores": [90, 72]}``
+  (période et table numérotées à partir de 1, comme dans la vue des
+  matchs ; code de l'événement, voir plus bas) ;
+- ``GET /ws`` : WebSocket, un score par message texte, même format ; la
+  réponse reprend l'éventuel champ ``id`` du message ;
+- ``GET /leaderboard`` : classement en direct pour les écrans de la salle ;
+- ``GET /leaderboard/ws`` : WebSocket du classement en direct : le
+  classement complet, puis seulement les changements de rang, chaque
+  message étant une liste de mises à jour JSON (voir
+  controllers.leaderboard) ; les messages du client sont ignorés.
+
+Les saisies (``POST /results`` et ``/ws``) portent le code de l'événement
+dans un champ ``code`` : tiré au hasard au démarrage (voir new_event_code)
+ou choisi par l'organisateur, il est affiché avec l'adresse du serveur par
+l'application et la ligne de commande, et communiqué aux seuls capitaines.
+Sans lui, le serveur répond 401 : un appareil du réseau local ne peut pas
+saisir de score. Les pages et le classement en direct restent publics.
+
+Les saisies ne touchent pas le contrôleur une par une : elles sont
+accumulées pendant BATCH_WINDOW, puis appliquées en un seul lot par le
+rappel apply_batch (un appel à TournamentController.validate_matches, donc
+une seule notification aux vues). Chaque saisie reçoit sa réponse une fois
+son lot appliqué : la latence est bornée par la fenêtre de regroupement
+plus la durée du lot. Une saisie n'est confirmée que si son match fait
+partie des matchs validés retournés par apply_batch : sinon le serveur
+répond 404 (match retiré du calendrier entre-temps) ou 409 (score
+remplacé, dans le même lot, par une autre saisie du même match). Au-delà
+de MAX_PENDING saisies en attente, le serveur répond 503 au lieu de
+laisser la file grossir.
+
+Le contrôleur n'est jamais lu depuis le serveur : la correspondance
+(période, table) → match lui est fournie par set_tables, à chaque
+changement du calendrier, et le classement est lu dans le flux
+controllers.leaderboard, qui en garde sa propre copie. L'application
+graphique fait tourner le serveur dans un thread (BackgroundServer) et
+applique les lots dans le thread de l'interface (voir views.score_bridge) ;
+la ligne de commande l'exécute directement (``python cli.py serve``,
+rappel apply_to).
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import socket
+import struct
+import threading
+from dataclasses import dataclass
+from typing import AbstractSet, Awaitable, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from controllers.result_import import MAX_SCORE, TableKey, index_tables
+from diagnostics.instrumentation import count, span
+
+if TYPE_CHECKING:
+    from controllers.leaderboard import LeaderboardFeed
+    from controllers.tournament_controller import TournamentController
+    from models.game import Game
+
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 8765
+# Durée pendant laquelle les saisies sont accumulées avant d'être appliquées
+BATCH_WINDOW = 0.02
+MAX_BATCH_SIZE = 1000
+# Saisies en attente au-delà desquelles le serveur refuse (503)
+MAX_PENDING = 10_000
+# Connexions en attente d'acceptation par le système
+BACKLOG = 1024
+MAX_HEADER_SIZE = 16 * 1024
+MAX_BODY_SIZE = 64 * 1024
+# Délai maximal de lecture d'une requête ou d'attente d'un message
+REQUEST_TIMEOUT = 30.0
+# Code de l'événement : majuscules et chiffres sans confusion possible (ni 0/O, ni 1/I/L),
+# 31 ** 8 combinaisons, de quoi décourager les essais à l'aveugle
+CODE_ALPHABET = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
+CODE_LENGTH = 8
+
+_WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+# Opcodes WebSocket (RFC 6455)
+_CONTINUATION, _TEXT, _BINARY, _CLOSE, _PING, _PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+_REASONS = {200: "OK", 101: "Switching Protocols", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+            405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 503: "Service Unavailable"}
+
+# (identifiant du match, (score1, score2)), comme pour validate_matches
+Result = Tuple[int, Tuple[int, int]]
+# Applique un lot et retourne les identifiants des matchs validés
+ApplyBatch = Callable[[List[Result]], Awaitable[AbstractSet[int]]]
+
+
+@dataclass(frozen=True)
+class Table:
+    """Un match du calendrier, tel que vu par le serveur"""
+    game_id: int
+    team1: str
+    team2: str
+
+
+class SubmissionError(Exception):
+    """Saisie refusée ; status est le code HTTP de la réponse"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class _Submission:
+    table: Table
+    scores: Tuple[int, int]
+    future: "asyncio.Future[None]"
+
+
+def tables_of(games: "List[Game]") -> Dict[TableKey, Table]:
+    """Correspondance (période, table) → match, à passer à ScoreServer.set_tables"""
+    return {key: Table(game.id, game.team1.name, game.team2.name)
+            for key, game in index_tables(games).items()}
+
+
+def lan_address() -> str:
+    """Adresse IP de la machine sur le réseau local (celle à ouvrir depuis un téléphone)"""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # Aucun paquet n'est envoyé : le système choisit seulement l'interface de sortie
+        probe.connect(("10.255.255.255", 1))
+        return probe.getsockname()[0]
+    except OSError:
+        return "127.0.0.1"
+    finally:
+        probe.close()
+
+
+def new_event_code() -> str:
+    """Tire un code d'événement au hasard (voir CODE_ALPHABET)"""
+    return "".join(secrets.choice(CODE_ALPHABET) for _ in range(CODE_LENGTH))
+
+
+def _normalize_code(code: str) -> str:
+    # Saisi sur un téléphone : casse et espaces autour indifférents
+    return code.strip().upper()
+
+
+def _is_integer(value) -> bool:
+    # true et false du JSON sont décodés en bool, sous-classe d'int
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def apply_to(controller: "TournamentController") -> ApplyBatch:
+    """Rappel apply_batch qui valide les lots directement (boucle asyncio du thread du contrôleur)"""
+    async def apply_batch(results: List[Result]) -> AbstractSet[int]:
+        return frozenset(controller.validate_matches(results))
+    return apply_batch
+
+
+# =====================
+# Serveur
+# =====================
+class ScoreServer:
+    """Reçoit les scores en HTTP et WebSocket et les applique par lots"""
+
+    def __init__(self, apply_batch: ApplyBatch, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 batch_window: float = BATCH_WINDOW, leaderboard: Optional["LeaderboardFeed"] = None,
+                 code: Optional[str] = None):
+        """
+        Args:
+            code: Le code de l'événement exigé pour chaque saisie ; tiré au
+                  hasard si absent (voir new_event_code)
+        """
+        self.host = host
+        self.port = port
+        self.code = _normalize_code(code) if code else new_event_code()
+        self.batch_window = batch_window
+        self._apply_batch = apply_batch
+        # Flux du classement diffusé sur /leaderboard/ws (aucun classement sans flux)
+        self._leaderboard = leaderboard
+        # Remplacé d'un bloc par set_tables : lisible depuis n'importe quel thread
+        self._tables: Dict[TableKey, Table] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._connections: set = set()
+
+    def set_tables(self, tables: Dict[TableKey, Table]):
+        """Installe le calendrier (voir tables_of)"""
+        self._tables = tables
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(hôte, port) d'écoute effectifs, une fois le serveur démarré"""
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self):
+        """Commence à écouter ; le serveur tourne tant que la boucle asyncio tourne"""
+        self._queue = asyncio.Queue(MAX_PENDING)
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, backlog=BACKLOG, limit=MAX_HEADER_SIZE)
+        self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def close(self):
+        """Arrête d'écouter et ferme les connexions ; les saisies en attente sont abandonnées"""
+        if self._server is not None:
+            self._server.close()
+        if self._batcher is not None:
+            self._batcher.cancel()
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+        for writer in list(self._connections):
+            writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    # =====================
+    # Saisies et lots
+    # =====================
+    async def submit(self, message) -> dict:
+        """
+        Contrôle une saisie, attend que son lot soit appliqué et retourne la réponse
+
+        Raises:
+            SubmissionError: Saisie invalide, match inconnu, non validé ou
+                             remplacé par une autre saisie, ou serveur saturé
+        """
+        if not isinstance(message, dict):
+            raise SubmissionError(400, "Attendu un objet JSON : code, période, table, scores.")
+        code = message.get("code")
+        if not isinstance(code, str) or not hmac.compare_digest(_normalize_code(code).encode("utf-8"),
+                                                                self.code.encode("utf-8")):
+            count("server.unauthorized")
+            raise SubmissionError(401, "Code de l'événement manquant ou incorrect.")
+        period, table, scores = message.get("period"), message.get("table"), message.get("scores")
+        if not _is_integer(period) or not _is_integer(table):
+            raise SubmissionError(400, "Période et table doivent être des nombres entiers.")
+        if (not isinstance(scores, list) or len(scores) != 2
+                or not all(_is_integer(score) and 0 <= score <= MAX_SCORE for score in scores)):
+            raise SubmissionError(400, f"Attendu deux scores entiers entre 0 et {MAX_SCORE}.")
+        game = self._tables.get((period, table))
+        if game is None:
+            raise SubmissionError(404, f"Aucun match en période {period}, table {table}.")
+
+        submission = _Submission(game, (scores[0], scores[1]), asyncio.get_running_loop().create_future())
+        try:
+            self._queue.put_nowait(submission)
+        except asyncio.QueueFull:
+            count("server.rejected")
+            raise SubmissionError(503, "Serveur saturé, réessayez dans un instant.") from None
+        with span("server.submission"):
+            await submission.future
+        return {"ok": True, "period": period, "table": table,
+                "team1": game.team1, "team2": game.team2, "scores": list(submission.scores)}
+
+    async def _batch_loop(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            # Les saisies qui arrivent pendant la fenêtre rejoignent le lot
+            if queue.qsize() < MAX_BATCH_SIZE:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < MAX_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            await self._apply(batch)
+
+    async def _apply(self, batch: List[_Submission]):
+        # Deux saisies du même match dans un lot : la dernière l'emporte
+        latest: Dict[int, _Submission] = {}
+        for submission in batch:
+            latest[submission.table.game_id] = submission
+        count("server.batches")
+        count("server.submissions", len(batch))
+        try:
+            with span("server.batch"):
+                validated = await self._apply_batch(
+                    [(game_id, submission.scores) for game_id, submission in latest.items()])
+        except asyncio.CancelledError:
+            # Serveur arrêté pendant le lot
+            for submission in batch:
+                submission.future.cancel()
+            raise
+        except Exception as error:  # remontée à chaque saisie du lot
+            for submission in batch:
+                if not submission.future.done():
+                    submission.future.set_exception(error)
+            return
+        for submission in batch:
+            if submission.future.done():
+                continue
+            game_id = submission.table.game_id
+            if latest[game_id] is not submission:
+                count("server.superseded")
+                submission.future.set_exception(SubmissionError(
+                    409, "Score remplacé par une autre saisie du même match, reçue en même temps."))
+            elif game_id not in validated:
+                count("server.unrecorded")
+                submission.future.set_exception(SubmissionError(
+                    404, "Ce match ne fait plus partie du calendrier : score non enregistré."))
+            else:
+                submission.future.set_result(None)
+
+    # =====================
+    # HTTP
+    # =====================
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections.add(writer)
+        try:
+            # Connexion persistante : plusieurs requêtes à la suite
+            while True:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                if headers.get("upgrade", "").lower() == "websocket":
+                    if path == "/ws":
+                        await self._handle_websocket(reader, writer, headers)
+                        break
+                    if path == "/leaderboard/ws" and self._leaderboard is not None:
+                        await self._stream_leaderboard(reader, writer, headers)
+                        break
+                status, content_type, payload = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, content_type, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _read_request(self, reader, writer):
+        """(méthode, chemin, en-têtes, corps), ou None si le client a fermé la connexion"""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), REQUEST_TIMEOUT)
+        except asyncio.IncompleteReadError as error:
+            if error.partial:
+                raise
+            return None
+        except asyncio.LimitOverrunError:
+            await self._respond(writer, 413, "text/plain", "En-têtes trop longs.", False)
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            await self._respond(writer, 400, "text/plain", "Requête invalide.", False)
+            return None
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            await self._respond(writer, 400, "text/plain", "Longueur de corps invalide.", False)
+            return None
+        length = int(length)
+        if length > MAX_BODY_SIZE:
+            await self._respond(writer, 413, "text/plain", "Corps de requête trop long.", False)
+            return None
+        body = await asyncio.wait_for(reader.readexactly(length), REQUEST_TIMEOUT) if length else b""
+        return method, target.split("?", 1)[0], headers, body
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, str, str]:
+        if path == "/":
+            return 200, "text/html; charset=utf-8", ENTRY_PAGE
+        if path == "/leaderboard" and self._leaderboard is not None:
+            return 200, "text/html; charset=utf-8", LEADERBOARD_PAGE
+        if path == "/tables":
+            tables = [{"period": period, "table": table, "team1": game.team1, "team2": game.team2}
+                      for (period, table), game in self._tables.items()]
+            return 200, "application/json", json.dumps(tables)
+        if path == "/results":
+            if method != "POST":
+                return 405, "application/json", json.dumps({"ok": False, "error": "Utiliser POST."})
+            try:
+                message = json.loads(body)
+            except ValueError:
+                message = None
+            status, response = await self._answer(message)
+            return status, "application/json", json.dumps(response)
+        return 404, "application/json", json.dumps({"ok": False, "error": "Page inconnue."})
+
+    async def _answer(self, message) -> Tuple[int, dict]:
+        """(code HTTP, réponse) d'une saisie décodée du JSON (None si le JSON est invalide)"""
+        if message is None:
+            return 400, {"ok": False, "error": "JSON invalide."}
+        try:
+            return 200, await self.submit(message)
+        except SubmissionError as error:
+            return error.status, {"ok": False, "error": str(error)}
+        except Exception as error:  # lot refusé par le contrôleur
+            return 503, {"ok": False, "error": str(error)}
+
+    @staticmethod
+    async def _respond(writer, status: int, content_type: str, payload: str, keep_alive: bool):
+        body = payload.encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n".encode("latin-1") + body)
+        await writer.drain()
+
+    # =====================
+    # WebSocket
+    # =====================
+    async def _accept_websocket(self, reader, writer, headers) -> Optional["WebSocket"]:
+        """Répond à la demande d'ouverture ; None si elle est invalide"""
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self._respond(writer, 400, "text/plain", "Clé WebSocket manquante.", False)
+            return None
+        accept = base64.b64encode(hashlib.sha1(key.encode("latin-1") + _WEBSOCKET_GUID).digest())
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                     b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+        await writer.drain()
+        return WebSocket(reader, writer)
+
+    async def _handle_websocket(self, reader, writer, headers):
+        websocket = await self._accept_websocket(reader, writer, headers)
+        if websocket is None:
+            return
+        # Chaque message est traité à part : une saisie en attente de son lot
+        # ne bloque pas la lecture des suivantes
+        pending = set()
+        try:
+            while True:
+                message = await websocket.receive()
+                if message is None:
+                    break
+                task = asyncio.create_task(self._answer_websocket(websocket, message))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _answer_websocket(self, websocket: "WebSocket", text: str):
+        try:
+            message = json.loads(text)
+        except ValueError:
+            message = None
+        status, response = await self._answer(message)
+        if isinstance(message, dict) and "id" in message:
+            response["id"] = message["id"]
+        response["status"] = status
+        try:
+            await websocket.send(json.dumps(response))
+        except ConnectionError:
+            pass
+
+
+    async def _stream_leaderboard(self, reader, writer, headers):
+        """
+        Envoie les mises à jour du classement jusqu'à la fermeture par le client
+
+        Un client lent ne retient rien : pendant qu'un envoi attend, les
+        mises à jour s'accumulent dans son abonnement, envoyées ensuite en
+        un seul message, ou remplacées par le classement complet s'il a
+        pris trop de retard.
+        """
+        websocket = await self._accept_websocket(reader, writer, headers)
+        if websocket is None:
+            return
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+
+        def wakeup():
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                # Boucle du serveur déjà fermée
+                pass
+
+        subscription = self._leaderboard.subscribe(wakeup)
+        # Seules la fermeture et les ping du client sont à traiter
+        closed = asyncio.create_task(_until_closed(websocket))
+        try:
+            while not closed.done():
+                ready.clear()
+                updates = subscription.take()
+                if updates:
+                    count("server.leaderboard_messages")
+                    await websocket.send(json.dumps([update.to_json() for update in updates]))
+                    continue
+                waiter = asyncio.create_task(ready.wait())
+                await asyncio.wait((waiter, closed), return_when=asyncio.FIRST_COMPLETED)
+                waiter.cancel()
+        except (ConnectionError, asyncio.CancelledError):
+            # Client parti ou serveur arrêté
+            pass
+        finally:
+            subscription.close()
+            closed.cancel()
+
+
+async def _until_closed(websocket: "WebSocket"):
+    """Lit (et ignore) les messages du client jusqu'à la fermeture de la connexion"""
+    try:
+        while await websocket.receive() is not None:
+            pass
+    except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+        pass
+
+
+class WebSocket:
+    """Connexion WebSocket côté serveur : messages texte, ping/pong et fermeture"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        # Les réponses de plusieurs tâches ne s'entremêlent pas
+        self._send_lock = asyncio.Lock()
+
+    async def receive(self) -> Optional[str]:
+        """Le message texte suivant, ou None quand le client ferme la connexion"""
+        fragments: List[bytes] = []
+        while True:
+            opcode, payload, final = await self._read_frame()
+            if opcode == _CLOSE:
+                await self._send_frame(_CLOSE, payload[:2])
+                return None
+            if opcode == _PING:
+                await self._send_frame(_PONG, payload)
+                continue
+            if opcode == _PONG:
+                continue
+            fragments.append(payload)
+            if sum(len(fragment) for fragment in fragments) > MAX_BODY_SIZE:
+                await self._send_frame(_CLOSE, struct.pack("!H", 1009))
+                return None
+            if final:
+                return b"".join(fragments).decode("utf-8", errors="replace")
+
+    async def send(self, text: str):
+        await self._send_frame(_TEXT, text.encode("utf-8"))
+
+    async def _read_frame(self) -> Tuple[int, bytes, bool]:
+        first, second = await asyncio.wait_for(self._reader.readexactly(2), REQUEST_TIMEOUT * 10)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", await self._reader.readexactly(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", await self._reader.readexactly(8))[0]
+        if length > MAX_BODY_SIZE:
+            raise ConnectionError("Message WebSocket trop long.")
+        mask = await self._reader.readexactly(4) if second & 0x80 else b""
+        payload = await self._reader.readexactly(length)
+        if mask:
+            payload = _unmask(payload, mask)
+        return first & 0x0F, payload, bool(first & 0x80)
+
+    async def _send_frame(self, opcode: int, payload: bytes):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        async with self._send_lock:
+            self._writer.write(header + payload)
+            await self._writer.drain()
+
+
+def _unmask(payload: bytes, mask: bytes) -> bytes:
+    """Applique le masque XOR d'une trame client (un seul entier, sans boucle par octet)"""
+    repeated = (mask * (len(payload) // 4 + 1))[:len(payload)]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(len(payload), "big")
+
+
+# =====================
+# Exécution dans un thread
+# =====================
+class BackgroundServer:
+    """Fait tourner un ScoreServer dans sa propre boucle asyncio, dans un thread dédié"""
+
+    def __init__(self, server: ScoreServer):
+        self.server = server
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> Tuple[str, int]:
+        """Démarre le serveur et retourne son adresse d'écoute"""
+        started = threading.Event()
+        failure: List[BaseException] = []
+
+        def run():
+            loop = self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.server.start())
+            except BaseException as error:  # port occupé, adresse invalide : remonté à start
+                failure.append(error)
+                started.set()
+                loop.close()
+                return
+            started.set()
+            try:
+                loop.run_forever()
+            finally:
+                loop.run_until_complete(self.server.close())
+                # Connexions encore ouvertes : leurs tâches sont annulées proprement
+                tasks = asyncio.all_tasks(loop)
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="score-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        if failure:
+            self._thread.join()
+            self._thread = None
+            raise failure[0]
+        return self.server.address
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+
+ENTRY_PAGE = """<!DOCTYPE html>
+<html lang="fr"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Saisie des scores</title>
+<style>
+body { font-family: sans-serif; background: #1e1e2f; color: white; margin: 1.5em; }
+input, button { font-size: 1.3em; width: 100%; margin: .3em 0; padding: .4em; box-sizing: border-box; }
+button { background: #66cc66; color: white; border: none; border-radius: 8px; }
+#status { margin-top: 1em; font-size: 1.1em; }
+</style></head><body>
+<h2>Saisie des scores</h2>
+<form id="entry">
+<input name="code" placeholder="Code de l'événement" autocapitalize="characters" autocomplete="off" required>
+<input name="period" type="number" min="1" placeholder="Période" required>
+<input name="table" type="number" min="1" placeholder="Table" required>
+<input name="score1" type="number" min="0" placeholder="Score équipe 1" required>
+<input name="score2" type="number" min="0" placeholder="Score équipe 2" required>
+<button>Envoyer</button>
+</form>
+<div id="status"></div>
+<script>
+// Le code n'est tapé qu'une fois par téléphone
+const entry = document.getElementById("entry");
+entry.elements.code.value = localStorage.getItem("code") || "";
+entry.addEventListener("submit", async (event) => {
+  event.preventDefault();
+  const form = new FormData(event.target), value = (name) => parseInt(form.get(name), 10);
+  localStorage.setItem("code", form.get("code"));
+  const response = await fetch("/results", {method: "POST", headers: {"Content-Type": "application/json"},
+    body: JSON.stringify({code: form.get("code"), period: value("period"), table: value("table"),
+                          scores: [value("score1"), value("score2")]})});
+  const result = await response.json();
+  document.getElementById("status").textContent = result.ok
+    ? `Enregistré : ${result.team1} ${result.scores[0]} – ${result.scores[1]} ${result.team2}`
+    : result.error;
+});
+</script></body></html>
+"""
+
+
+LEADERBOARD_PAGE = """<!DOCTYPE html>
+<html lang="fr"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Classement en direct</title>
+<style>
+body { font-family: sans-serif; background: #1e1e2f; color: white; margin: 1.5em; }
+h1 { text-align: center; color: #ffcc66; }
+ol { list-style: none; counter-reset: rank; padding: 0; max-width: 60em; margin: auto; }
+li { counter-increment: rank; display: flex; font-size: 1.6em; font-weight: bold; padding: .5em 1em;
+     margin: .3em 0; background: #2b2b3d; border: 2px solid #3c3c55; border-radius: 10px; }
+li::before { content: "#" counter(rank); width: 4em; color: #cccccc; }
+li:nth-child(1) { border-color: #ffd700; } li:nth-child(2) { border-color: #c0c0c0; }
+li:nth-child(3) { border-color: #cd7f32; }
+.name { flex: 1; } .points { color: #66cc66; }
+#status { text-align: center; color: #cc6666; }
+</style></head><body>
+<h1>🏆 Classement en direct</h1>
+<div id="status"></div>
+<ol id="ranking"></ol>
+<script>
+// Voir controllers.leaderboard : retirer par rang précédent décroissant,
+// puis insérer par rang croissant ; le rang affiché est le compteur CSS
+const ranking = document.getElementById("ranking"), status = document.getElementById("status");
+function entry(change) {
+  const item = document.createElement("li"), name = document.createElement("span"),
+        points = document.createElement("span");
+  name.className = "name"; name.textContent = change.name;
+  points.className = "points"; points.textContent = `${change.points} pts`;
+  item.append(name, points);
+  return item;
+}
+function apply(update) {
+  if (update.full) {
+    ranking.replaceChildren();
+  } else {
+    update.changes.filter((change) => change.previous).sort((a, b) => b.previous - a.previous)
+      .forEach((change) => ranking.children[change.previous - 1].remove());
+  }
+  update.changes.filter((change) => change.rank)
+    .forEach((change) => ranking.insertBefore(entry(change), ranking.children[change.rank - 1] || null));
+}
+function connect() {
+  const socket = new WebSocket(`ws://${location.host}/leaderboard/ws`);
+  // Le serveur ferme les connexions muettes : un message vide de temps en temps
+  const keepAlive = setInterval(() => socket.readyState === WebSocket.OPEN && socket.send("{}"), 60000);
+  socket.onopen = () => { status.textContent = ""; };
+  socket.onmessage = (event) => JSON.parse(event.data).forEach(apply);
+  socket.onclose = () => {
+    clearInterval(keepAlive);
+    status.textContent = "Connexion perdue, nouvelle tentative…";
+    setTimeout(connect, 2000);
+  };
+}
+connect();
+</script></body></html>
+"""
@@ -0,0 +1,217 @@
+"""
+Simulateur Monte-Carlo de donnes de Bélote
+
+Les donnes sont tirées par lots vectorisés (``Deck.deal_batch``) et
+réparties en tranches sur un ``ProcessPoolExecutor``. Chaque tranche a son
+propre flux aléatoire, dérivé d'une graine unique par ``SeedSequence.spawn``,
+et ne renvoie que des agrégats de taille fixe (sommes et histogrammes) :
+le résultat est donc reproductible et ne dépend pas du nombre de processus.
+
+Usage : python -m simulation.deal_simulator --deals 1000000 --playouts 20000
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from models.card import CARD_POINTS, SUITS, hand_points
+from models.deck import Deck, NUM_PLAYERS
+from models.rules import (
+    BeloteRound, TRICK_STRENGTH, NUM_TRICKS, team_of,
+)
+
+# Borne des points d'une main, pour dimensionner les histogrammes : une main
+# de 8 cartes vaut au plus 98 points (V et 9 d'atout, les 4 As, deux 10),
+# et 152 est le total du jeu (62 à l'atout + 3 × 30 hors atout), qu'aucune
+# main ne peut dépasser quelle que soit sa taille
+MAX_HAND_POINTS = 152
+BID_BUCKET_WIDTH = 10
+NUM_BID_BUCKETS = MAX_HAND_POINTS // BID_BUCKET_WIDTH + 1
+DEFAULT_CHUNK_SIZE = 50_000
+
+_CARD_POINTS = np.array(CARD_POINTS, dtype=np.uint16)
+
+
+@dataclass
+class SimulationStats:
+    """Agrégats d'une simulation, fusionnables entre processus"""
+    num_deals: int = 0
+    # Somme et somme des carrés des points d'une main, par atout
+    points_sum: np.ndarray = field(default_factory=lambda: np.zeros(4, dtype=np.int64))
+    points_sq_sum: np.ndarray = field(default_factory=lambda: np.zeros(4, dtype=np.int64))
+    # histogram[atout][points] : nombre de mains ayant ce total
+    histogram: np.ndarray = field(
+        default_factory=lambda: np.zeros((4, MAX_HAND_POINTS + 1), dtype=np.int64)
+    )
+    # Prises jouées et réussies, par tranche de points du preneur
+    bids: np.ndarray = field(default_factory=lambda: np.zeros(NUM_BID_BUCKETS, dtype=np.int64))
+    bids_made: np.ndarray = field(default_factory=lambda: np.zeros(NUM_BID_BUCKETS, dtype=np.int64))
+
+    def merge(self, other: "SimulationStats"):
+        """Ajoute les agrégats d'une autre simulation"""
+        self.num_deals += other.num_deals
+        self.points_sum += other.points_sum
+        self.points_sq_sum += other.points_sq_sum
+        self.histogram += other.histogram
+        self.bids += other.bids
+        self.bids_made += other.bids_made
+
+    @property
+    def num_hands(self) -> int:
+        """Retourne le nombre de mains évaluées par atout"""
+        return self.num_deals * NUM_PLAYERS
+
+    def expected_points(self) -> np.ndarray:
+        """Retourne l'espérance des points d'une main, par atout"""
+        return self.points_sum / max(self.num_hands, 1)
+
+    def points_std(self) -> np.ndarray:
+        """Retourne l'écart-type des points d'une main, par atout"""
+        mean = self.expected_points()
+        return np.sqrt(np.maximum(self.points_sq_sum / max(self.num_hands, 1) - mean ** 2, 0))
+
+    def bid_success_rates(self) -> np.ndarray:
+        """Retourne le taux de réussite des prises par tranche de points (NaN si aucune)"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.bids_made / self.bids
+
+
+def greedy_move(game: BeloteRound) -> int:
+    """
+    Choisit une carte selon une stratégie gloutonne simple
+
+    Le joueur prend le pli avec sa plus petite carte gagnante, charge des
+    points si son partenaire est maître, et se défausse de sa plus petite
+    carte sinon.
+    """
+    moves = game.legal_moves()
+    points = CARD_POINTS[game.trump]
+    cards = []
+    while moves:
+        low = moves & -moves
+        cards.append(low.bit_length() - 1)
+        moves ^= low
+    if not game.trick:
+        return max(cards, key=lambda c: (TRICK_STRENGTH[game.trump][c >> 3][c], -points[c]))
+    strength = TRICK_STRENGTH[game.trump][game.lead_suit]
+    if (game.winning_seat ^ game.current) == 2:
+        return max(cards, key=lambda c: (points[c], -strength[c]))
+    winners = [c for c in cards if strength[c] > strength[game.winning_card]]
+    if winners:
+        return min(winners, key=lambda c: strength[c])
+    return min(cards, key=lambda c: (points[c], strength[c]))
+
+
+def _play_out(hands: List[int], trump: int, taker: int) -> bool:
+    """Joue une donne avec greedy_move et indique si le preneur a réussi"""
+    game = BeloteRound(hands, trump, 0, taker)
+    for _ in range(NUM_TRICKS * NUM_PLAYERS):
+        game.play(greedy_move(game))
+    scores = game.scores()
+    return scores[team_of(taker)] > scores[1 - team_of(taker)]
+
+
+def simulate_chunk(num_deals: int, num_playouts: int, seed: np.random.SeedSequence) -> SimulationStats:
+    """
+    Simule une tranche de donnes dans le processus courant
+
+    Args:
+        num_deals: Le nombre de donnes à évaluer
+        num_playouts: Le nombre de ces donnes à jouer jusqu'au bout
+        seed: Le flux aléatoire propre à la tranche
+
+    Returns:
+        Les agrégats de la tranche
+    """
+    rng = np.random.default_rng(seed)
+    stats = SimulationStats(num_deals=num_deals)
+    hands = Deck.split_hands(Deck.deal_batch(num_deals, rng))
+    for trump in range(4):
+        # points[i, j] : points de la main j de la donne i avec cet atout
+        points = _CARD_POINTS[trump][hands].sum(axis=2, dtype=np.int64)
+        stats.points_sum[trump] = points.sum()
+        stats.points_sq_sum[trump] = (points * points).sum()
+        stats.histogram[trump] = np.bincount(points.ravel(), minlength=MAX_HAND_POINTS + 1)
+
+    # Le joueur 0 entame et prend à la couleur où sa main vaut le plus
+    masks = Deck.hand_masks(hands[:num_playouts])
+    for deal in masks:
+        deal = [int(mask) for mask in deal]
+        values = [hand_points(deal[0], trump) for trump in range(4)]
+        trump = max(range(4), key=values.__getitem__)
+        bucket = values[trump] // BID_BUCKET_WIDTH
+        stats.bids[bucket] += 1
+        stats.bids_made[bucket] += _play_out(deal, trump, 0)
+    return stats
+
+
+def simulate(num_deals: int, num_playouts: int = 0, seed: Optional[int] = None,
+             workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> SimulationStats:
+    """
+    Simule num_deals donnes aléatoires en parallèle
+
+    Args:
+        num_deals: Le nombre de donnes à évaluer
+        num_playouts: Le nombre de donnes à jouer jusqu'au bout pour les prises
+        seed: La graine globale ; None pour un tirage non reproductible
+        workers: Le nombre de processus (par défaut, le nombre de cœurs)
+        chunk_size: Le nombre de donnes par tranche envoyée à un processus
+
+    Returns:
+        Les agrégats fusionnés de toutes les tranches
+    """
+    num_chunks = max(1, -(-num_deals // chunk_size))
+    seeds = np.random.SeedSequence(seed).spawn(num_chunks)
+    deals = [num_deals // num_chunks + (i < num_deals % num_chunks) for i in range(num_chunks)]
+    playouts = [num_playouts // num_chunks + (i < num_playouts % num_chunks) for i in range(num_chunks)]
+    playouts = [min(p, d) for p, d in zip(playouts, deals)]
+
+    stats = SimulationStats()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or num_chunks == 1:
+        for chunk in map(simulate_chunk, deals, playouts, seeds):
+            stats.merge(chunk)
+        return stats
+    with ProcessPoolExecutor(max_workers=min(workers, num_chunks)) as executor:
+        for chunk in executor.map(simulate_chunk, deals, playouts, seeds):
+            stats.merge(chunk)
+    return stats
+
+
+def format_report(stats: SimulationStats) -> str:
+    """Met en forme les agrégats pour l'affichage"""
+    lines = [f"Donnes simulées : {stats.num_deals}", "", "Points d'une main selon l'atout :"]
+    for trump, suit in enumerate(SUITS):
+        lines.append(
+            f"  {suit.value}  moyenne {stats.expected_points()[trump]:6.2f}"
+            f"  écart-type {stats.points_std()[trump]:6.2f}"
+        )
+    if stats.bids.any():
+        lines += ["", "Réussite des prises (points du preneur) :"]
+        for bucket, rate in enumerate(stats.bid_success_rates()):
+            if stats.bids[bucket]:
+                low = bucket * BID_BUCKET_WIDTH
+                lines.append(
+                    f"  {low:3d}-{low + BID_BUCKET_WIDTH - 1:3d} pts : {rate:6.1%}"
+                    f"  ({stats.bids[bucket]} donnes)"
+                )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulateur Monte-Carlo de donnes de Bélote")
+    parser.add_argument("--deals", type=int, default=1_000_000)
+    parser.add_argument("--playouts", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+    stats = simulate(args.deals, args.playouts, args.seed, args.workers, args.chunk_size)
+    print(format_report(stats))
+
+
+if __name__ == "__main__":
+    main()
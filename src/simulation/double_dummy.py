@@ -0,0 +1,636 @@
+"""
+Solveur « double mort » de la Bélote (information parfaite)
+
+Les quatre mains et l'atout sont connus : le solveur calcule les points
+de cartes (dix de der compris) que chaque camp obtient si tout le monde
+joue parfaitement. Recherche alpha-bêta sur l'encodage entier de
+``models.card`` :
+
+- la valeur exacte est trouvée par dichotomie de recherches à fenêtre nulle,
+  en commençant par les extrêmes (capots) ;
+- les coups sont ordonnés (meilleur coup de la table, puis cartes maîtresses
+  qu'on ne peut pas couper, plis sûrs à charger, défausses les moins
+  chères) et les cartes sans valeur interchangeables ne sont explorées
+  qu'une fois ;
+- une table de transposition à hachage de Zobrist, de taille bornée,
+  mémorise des bornes à chaque début de pli, et la valeur exacte des fins
+  de donne (ENDGAME_CARDS cartes par main) sert à toutes les recherches ;
+- les atouts maîtres de chaque camp donnent des bornes immédiates.
+
+Sous CPython, la plupart des donnes complètes de 32 cartes se résolvent en
+quelques centaines de millisecondes ; celles où un camp tient presque tous
+les atouts ont un arbre de preuve de plusieurs millions de nœuds. Chaque
+résolution est donc plafonnée à max_nodes nœuds : au-delà, la dichotomie
+s'arrête et le résultat, marqué inexact, donne l'intervalle où se trouve la
+valeur (voir benchmarks/bench_double_dummy.py). Les compteurs de nœuds et
+de succès de la table sont exposés pour le suivi.
+
+Les points de belote ne dépendent pas du jeu de la carte et ne sont donc
+pas comptés ici ; ajoutez-les au résultat si besoin.
+"""
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from models.card import CARD_POINTS, SUIT_MASKS, TRUMP_BYTE_POINTS, hand_points
+from models.rules import (
+    BeloteRound, HIGHER_TRUMPS, PLAIN_STRENGTH, TRICK_STRENGTH, TRUMP_STRENGTH,
+    LAST_TRICK_BONUS, NUM_PLAYERS, NO_SUIT,
+)
+
+DEFAULT_TT_BITS = 20
+# Nœuds au plus par résolution (environ 0,7 s sous CPython)
+DEFAULT_MAX_NODES = 500_000
+# Cartes par main en deçà desquelles la valeur exacte est mémorisée
+ENDGAME_CARDS = 2
+
+# Cartes sans valeur (7 et 8 d'atout, 7, 8 et 9 ailleurs) : deux d'entre
+# elles, de même couleur et sans carte adverse de force intermédiaire, sont
+# interchangeables et une seule est explorée. ZERO_POINT_MASKS[atout] les
+# regroupe ; EQUIVALENCE_MASKS[atout] donne les 7 de toutes les couleurs,
+# puis les 7 et les 8 hors atout.
+_SEVENS = 0x01010101
+ZERO_POINT_MASKS: Tuple[int, ...] = tuple(
+    (_SEVENS * 0b111) & ~SUIT_MASKS[trump] | (_SEVENS * 0b11) & SUIT_MASKS[trump]
+    for trump in range(4)
+)
+EQUIVALENCE_MASKS: Tuple[Tuple[int, int, int], ...] = tuple(
+    (_SEVENS, _SEVENS & ~SUIT_MASKS[trump], (_SEVENS << 1) & ~SUIT_MASKS[trump])
+    for trump in range(4)
+)
+
+# BEST_TRUMP_RANK[octet] : rang de l'atout le plus fort d'un octet de couleur
+BEST_TRUMP_RANK: Tuple[int, ...] = (-1,) + tuple(
+    max((r for r in range(8) if byte >> r & 1), key=TRUMP_STRENGTH.__getitem__)
+    for byte in range(1, 256)
+)
+
+# BEST_PLAIN_RANK[octet] : rang de la carte la plus forte d'un octet de couleur hors atout
+BEST_PLAIN_RANK: Tuple[int, ...] = (-1,) + tuple(
+    max((r for r in range(8) if byte >> r & 1), key=PLAIN_STRENGTH.__getitem__)
+    for byte in range(1, 256)
+)
+
+# HIGHER_IN_SUIT[atout][carte] : cartes de la même couleur qui la battent
+HIGHER_IN_SUIT: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        HIGHER_TRUMPS[card] if card >> 3 == trump else sum(
+            1 << ((card & ~7) | other)
+            for other in range(8)
+            if PLAIN_STRENGTH[other] > PLAIN_STRENGTH[card & 7]
+        )
+        for card in range(32)
+    )
+    for trump in range(4)
+)
+
+# Clés de Zobrist : une par (joueur, carte), une par joueur à l'entame et
+# une par atout, pour pouvoir réutiliser la table d'une résolution à l'autre
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST_CARDS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_zobrist_rng.getrandbits(64) for _ in range(32)) for _ in range(NUM_PLAYERS)
+)
+ZOBRIST_LEADER: Tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(NUM_PLAYERS))
+ZOBRIST_TRUMP: Tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(4))
+
+
+class _NodeLimitReached(Exception):
+    """Levée par la recherche quand la résolution a épuisé ses nœuds"""
+
+
+@dataclass
+class SolveResult:
+    """Résultat d'une résolution"""
+    # Si la résolution est inexacte, estimation : milieu de l'intervalle bounds
+    points: Tuple[int, int]
+    nodes: int
+    tt_probes: int
+    tt_hits: int
+    # Points de l'équipe 0 au moins et au plus
+    bounds: Tuple[int, int] = (0, 0)
+
+    @property
+    def exact(self) -> bool:
+        """Vrai si la valeur a été prouvée avant d'atteindre max_nodes"""
+        return self.bounds[0] == self.bounds[1]
+
+    @property
+    def hit_rate(self) -> float:
+        """Retourne la proportion de sondages de la table ayant trouvé une entrée"""
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+
+class TranspositionTable:
+    """
+    Table de transposition de taille fixe (2**bits entrées)
+
+    Chaque case garde une seule entrée. En cas de collision, l'entrée qui
+    résume la plus grosse sous-recherche (le plus de cartes restantes) est
+    conservée, sauf si elle date d'une résolution précédente.
+    """
+
+    def __init__(self, bits: int = DEFAULT_TT_BITS):
+        self.size = 1 << bits
+        self._mask = self.size - 1
+        self._slots: List[Optional[tuple]] = [None] * self.size
+        self.generation = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def new_search(self):
+        """Marque les entrées existantes comme anciennes (remplaçables)"""
+        self.generation += 1
+
+    def clear(self):
+        """Vide la table"""
+        self._slots = [None] * self.size
+        self.generation = 0
+
+    def probe(self, key: int) -> Optional[tuple]:
+        """Retourne (borne basse, borne haute, meilleure carte) pour une clé, ou None"""
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            return entry[3], entry[4], entry[5]
+        return None
+
+    def store(self, key: int, depth: int, lower: int, upper: int, move: int):
+        """Enregistre des bornes selon la politique de remplacement"""
+        index = key & self._mask
+        entry = self._slots[index]
+        if entry is not None:
+            if entry[0] == key:
+                # Même position : on combine les bornes des recherches successives
+                lower = max(lower, entry[3])
+                upper = min(upper, entry[4])
+            elif entry[2] == self.generation and entry[1] > depth:
+                return
+            else:
+                self.replacements += 1
+        self._slots[index] = (key, depth, self.generation, lower, upper, move)
+        self.stores += 1
+
+
+class DoubleDummySolver:
+    """Solveur alpha-bêta à information parfaite"""
+
+    def __init__(self, tt_bits: int = DEFAULT_TT_BITS, max_nodes: Optional[int] = DEFAULT_MAX_NODES):
+        """
+        Args:
+            tt_bits: Le logarithme en base 2 du nombre d'entrées de la table
+            max_nodes: Les nœuds au plus par résolution (None : pas de limite,
+                       résultat toujours exact)
+        """
+        self.table = TranspositionTable(tt_bits)
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.tt_probes = 0
+        self.tt_hits = 0
+
+    # =====================
+    # API
+    # =====================
+    def solve(self, hands: Sequence[int], trump: int, leader: int) -> SolveResult:
+        """
+        Résout une donne depuis le début d'un pli
+
+        Args:
+            hands: Les masques des quatre mains (même nombre de cartes)
+            trump: L'indice de la couleur d'atout
+            leader: La place du joueur qui entame
+
+        Returns:
+            Les points (équipe 0, équipe 1) restant à marquer et les compteurs
+        """
+        self._start(trump)
+        hands = list(hands)
+        remaining = self._remaining_points(hands)
+        bounds = self._solve_value(hands, leader, NO_SUIT, 0, leader, 0, 0,
+                                   self._hash(hands, leader), remaining)
+        return self._result(bounds, remaining)
+
+    def solve_round(self, game: BeloteRound) -> SolveResult:
+        """
+        Résout une donne en cours, éventuellement au milieu d'un pli
+
+        Returns:
+            Les points totaux (équipe 0, équipe 1) de la donne, plis déjà
+            ramassés compris
+        """
+        self._start(game.trump)
+        bounds, remaining = self._search_round(game)
+        result = self._result(bounds, remaining)
+        result.points = (result.points[0] + game.points[0], result.points[1] + game.points[1])
+        result.bounds = (result.bounds[0] + game.points[0], result.bounds[1] + game.points[0])
+        return result
+
+    def evaluate_moves(self, game: BeloteRound) -> Dict[int, int]:
+        """
+        Évalue chaque carte jouable par le joueur courant
+
+        Returns:
+            Pour chaque carte jouable, les points totaux de l'équipe 0 sur la
+            donne si cette carte est jouée puis que tous jouent parfaitement
+            (estimés si la résolution de la carte atteint max_nodes)
+        """
+        self._start(game.trump)
+        values = {}
+        moves = game.legal_moves()
+        while moves:
+            low = moves & -moves
+            moves ^= low
+            card = low.bit_length() - 1
+            child = _copy_round(game)
+            child.play(card)
+            if child.is_over:
+                values[card] = child.points[0]
+                continue
+            (lower, upper), _ = self._search_round(child)
+            values[card] = (lower + upper) // 2 + child.points[0]
+        return values
+
+    @property
+    def hit_rate(self) -> float:
+        """Retourne le taux de succès cumulé de la table de transposition"""
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    # =====================
+    # Recherche
+    # =====================
+    def _start(self, trump: int):
+        self.table.new_search()
+        self.nodes = self.tt_probes = self.tt_hits = 0
+        self._trump = trump
+        self._points = CARD_POINTS[trump]
+        self._strength = TRICK_STRENGTH[trump]
+        self._order_memo = {}
+        self._exact = {}
+
+    def _result(self, bounds: Tuple[int, int], remaining: int) -> SolveResult:
+        value = (bounds[0] + bounds[1]) // 2
+        return SolveResult((value, remaining - value), self.nodes, self.tt_probes, self.tt_hits, bounds)
+
+    def _remaining_points(self, hands: Sequence[int]) -> int:
+        cards = hands[0] | hands[1] | hands[2] | hands[3]
+        return hand_points(cards, self._trump) + (LAST_TRICK_BONUS if cards else 0)
+
+    def _hash(self, hands: Sequence[int], leader: int) -> int:
+        key = ZOBRIST_LEADER[leader] ^ ZOBRIST_TRUMP[self._trump]
+        for seat, hand in enumerate(hands):
+            keys = ZOBRIST_CARDS[seat]
+            while hand:
+                low = hand & -hand
+                key ^= keys[low.bit_length() - 1]
+                hand ^= low
+        return key
+
+    def _search_round(self, game: BeloteRound) -> Tuple[Tuple[int, int], int]:
+        """Lance la recherche depuis l'état d'une BeloteRound"""
+        hands = list(game.hands)
+        trick_points = sum(self._points[card] for _, card in game.trick)
+        remaining = self._remaining_points(hands) + trick_points
+        leader = game.trick[0][0] if game.trick else game.current
+        bounds = self._solve_value(
+            hands, game.current, game.lead_suit, game.winning_card, game.winning_seat,
+            trick_points, len(game.trick), self._hash(hands, leader), remaining,
+        )
+        return bounds, remaining
+
+    def _solve_value(self, hands: List[int], seat: int, lead: int, win_card: int, win_seat: int,
+                     trick_points: int, played: int, key: int, remaining: int) -> Tuple[int, int]:
+        """
+        Calcule la valeur exacte d'une position par dichotomie de recherches à fenêtre nulle
+
+        Chaque recherche teste seulement « la valeur est-elle au moins beta ? »,
+        ce qui coupe bien plus qu'une fenêtre large ; la table de transposition
+        conserve les bornes d'une recherche à l'autre. Une dizaine de
+        recherches au plus couvrent les 162 points.
+
+        Returns:
+            Les bornes (basse, haute) de la valeur, égales sauf si la
+            résolution a atteint max_nodes
+        """
+        search = self._make_search(self.max_nodes)
+        lower, upper = 0, remaining
+        # Les deux extrêmes d'abord : un capot se prouve en une recherche, et
+        # sinon elles ne coûtent presque rien et resserrent l'intervalle
+        betas = [1, remaining]
+        while lower < upper:
+            beta = betas.pop() if betas else (lower + upper + 1) // 2
+            if not lower < beta <= upper:
+                continue
+            try:
+                value = search(hands, seat, lead, win_card, win_seat, trick_points, played,
+                               key, beta - 1, beta, remaining)
+            except _NodeLimitReached:
+                break
+            if value >= beta:
+                # Une borne basse fail-soft au-delà de beta est souvent la
+                # valeur exacte : on vérifie d'abord le point suivant
+                if value > beta:
+                    betas.append(value + 1)
+                lower = value
+            else:
+                upper = value
+        return lower, upper
+
+    def _make_search(self, max_nodes: Optional[int]):
+        """
+        Construit la fonction de recherche alpha-bêta pour l'atout courant
+
+        Toutes les tables sont capturées en variables locales de la fermeture :
+        c'est la boucle la plus chaude du module et chaque accès d'attribut
+        évité se compte en dizaines de pour cent. Les recherches successives
+        de la fonction se partagent max_nodes nœuds ; au-delà, elles lèvent
+        _NodeLimitReached.
+        """
+        trump = self._trump
+        card_points = self._points
+        strength_table = self._strength
+        last_trick = self._last_trick
+        # Sondage de la table fait directement sur ses cases (chemin critique)
+        slots = self.table._slots
+        slot_mask = self.table._mask
+        store = self.table.store
+        trump_shift = 8 * trump
+        trump_mask = SUIT_MASKS[trump]
+        zero_points = ZERO_POINT_MASKS[trump]
+        sevens, plain_sevens, plain_eights = EQUIVALENCE_MASKS[trump]
+        adjacent_zeros = sevens | plain_eights
+        higher_in_suit = HIGHER_IN_SUIT[trump]
+        best_ranks = tuple(BEST_TRUMP_RANK if suit == trump else BEST_PLAIN_RANK for suit in range(4))
+        counters = [0, 0, 0]  # noeuds, sondages, succès
+        # Nœuds restants avant l'arrêt, diminués après chaque recherche
+        node_limit = [float("inf") if max_nodes is None else max_nodes]
+        order_memo = self._order_memo
+        exact = self._exact
+
+        def order_leads(moves: int, hands: List[int], seat: int) -> List[int]:
+            """
+            Entames : cartes maîtresses qu'on ne peut pas couper (les plus
+            chères d'abord), puis celles que le partenaire peut reprendre,
+            puis les autres, les moins chères d'abord
+            """
+            opponents = hands[seat ^ 1] | hands[seat ^ 3]
+            partner = hands[seat ^ 2]
+            keys = []
+            while moves:
+                low = moves & -moves
+                moves ^= low
+                card = low.bit_length() - 1
+                points = card_points[card]
+                higher = higher_in_suit[card]
+                if not higher & opponents:
+                    suit_mask = SUIT_MASKS[card >> 3]
+                    ruffed = card >> 3 != trump and any(
+                        not hands[other] & suit_mask and hands[other] & trump_mask
+                        for other in (seat ^ 1, seat ^ 3))
+                    key = 64 + 32 - points if ruffed else 192 + points
+                elif higher & partner:
+                    key = 128 + 32 - points
+                else:
+                    key = 64 + 32 - points
+                keys.append(key << 5 | card)
+            keys.sort(reverse=True)
+            return [key & 31 for key in keys]
+
+        def order_follows(moves: int, strength: Sequence[int], best: int, threat: int,
+                          partner_winning: bool, memo_key: int) -> Tuple[int, ...]:
+            """
+            Cartes suivantes, selon la force best de la carte maîtresse et
+            celle, threat, de la plus forte carte du joueur suivant (-1 si
+            le pli est acquis au camp) : on charge un pli sûr, on prend avec
+            une carte que le suivant ne battra pas, sinon on défausse au
+            moins cher. Le résultat est mémorisé pour la durée d'une
+            résolution, les mêmes situations revenant très souvent.
+            """
+            keys = []
+            while moves:
+                low = moves & -moves
+                moves ^= low
+                card = low.bit_length() - 1
+                points = card_points[card]
+                if partner_winning:
+                    if threat < 0:
+                        key = 128 + points + (0 if card >> 3 == trump else 20)
+                    elif strength[card] > threat:
+                        key = 128 + points
+                    else:
+                        key = 64 + 32 - points
+                elif strength[card] > best:
+                    if strength[card] > threat:
+                        key = 192 + points
+                    else:
+                        key = 128 + strength[card]
+                else:
+                    key = 64 + 32 - points
+                keys.append(key << 5 | card)
+            keys.sort(reverse=True)
+            cards = tuple(key & 31 for key in keys)
+            order_memo[memo_key] = cards
+            return cards
+
+        def search(hands: List[int], seat: int, lead: int, win_card: int, win_seat: int,
+                   trick_points: int, played: int, key: int, alpha: int, beta: int,
+                   remaining: int) -> int:
+            """
+            Retourne les points que l'équipe 0 marque à partir de cette position
+
+            Le pli en cours (played cartes, trick_points points) est compris, et
+            remaining est le total encore en jeu. La valeur est exacte si elle est
+            strictement entre alpha et beta, sinon c'est une borne (fail-soft).
+            """
+            counters[0] += 1
+            tt_move = -1
+            if played == 0:
+                if counters[0] > node_limit[0]:
+                    raise _NodeLimitReached
+                if remaining <= alpha:
+                    return remaining
+                if beta <= 0:
+                    return 0
+                cards_left = hands[seat].bit_count()
+                if cards_left == 1:
+                    return last_trick(hands, seat)
+                endgame = cards_left <= ENDGAME_CARDS
+                if endgame:
+                    # Fin de donne : valeur exacte, calculée une fois pour
+                    # toutes les fenêtres des recherches successives
+                    value = exact.get(key)
+                    if value is not None:
+                        return value
+                    if alpha >= 0 or beta <= remaining:
+                        return search(hands, seat, lead, win_card, win_seat, trick_points, played,
+                                      key, -1, remaining + 1, remaining)
+                else:
+                    # Un atout plus fort que tous ceux des adversaires rapporte au
+                    # moins ses propres points à son camp : bornes immédiates
+                    trumps0 = ((hands[0] | hands[2]) >> trump_shift) & 0xFF
+                    trumps1 = ((hands[1] | hands[3]) >> trump_shift) & 0xFF
+                    if trumps0 or trumps1:
+                        masters0 = trumps0 & (HIGHER_TRUMPS[BEST_TRUMP_RANK[trumps1]] if trumps1 else 0xFF)
+                        lower = TRUMP_BYTE_POINTS[masters0]
+                        if lower >= beta:
+                            return lower
+                        masters1 = trumps1 & (HIGHER_TRUMPS[BEST_TRUMP_RANK[trumps0]] if trumps0 else 0xFF)
+                        upper = remaining - TRUMP_BYTE_POINTS[masters1]
+                        if upper <= alpha:
+                            return upper
+                    counters[1] += 1
+                    entry = slots[key & slot_mask]
+                    if entry is not None and entry[0] == key:
+                        counters[2] += 1
+                        lower, upper, tt_move = entry[3], entry[4], entry[5]
+                        if lower == upper or lower >= beta:
+                            return lower
+                        if upper <= alpha:
+                            return upper
+                        if lower > alpha:
+                            alpha = lower
+                        if upper < beta:
+                            beta = upper
+                alpha_orig, beta_orig = alpha, beta
+
+            maximizing = not seat & 1
+            hand = hands[seat]
+            if played == 0:
+                moves = hand
+                partner_winning = False
+            else:
+                # Mêmes règles que models.rules.legal_moves, en ligne
+                partner_winning = (win_seat ^ seat) == 2
+                moves = hand & SUIT_MASKS[lead]
+                if moves:
+                    if lead == trump:
+                        moves = (moves & HIGHER_TRUMPS[win_card]) or moves
+                elif partner_winning:
+                    moves = hand
+                else:
+                    moves = hand & trump_mask
+                    if not moves:
+                        moves = hand
+                    elif win_card >> 3 == trump:
+                        moves = (moves & HIGHER_TRUMPS[win_card]) or moves
+            zeros = moves & zero_points
+            if zeros & (zeros - 1):
+                # 7 suivi du 8, 8 suivi du 9 : toujours équivalents
+                drop = (zeros >> 1) & zeros & adjacent_zeros
+                # 7 et 9 : équivalents si le 8 n'est ni chez un autre ni maître du pli
+                gap = (zeros >> 2) & zeros & plain_sevens
+                if gap:
+                    others = (hands[0] | hands[1] | hands[2] | hands[3]) ^ hand
+                    if played:
+                        others |= 1 << win_card
+                    drop |= gap & ~(others >> 1)
+                moves &= ~drop
+            if played:
+                strength = strength_table[lead]
+                if moves & (moves - 1) == 0:
+                    ordered = (moves.bit_length() - 1,)
+                else:
+                    best = strength[win_card]
+                    threat = -1
+                    if played < 3:
+                        # Plus forte carte que le joueur suivant peut fournir
+                        next_hand = hands[(seat + 1) & 3]
+                        follow = (next_hand >> 8 * lead) & 0xFF
+                        if follow:
+                            threat = strength[lead << 3 | best_ranks[lead][follow]]
+                        else:
+                            follow = (next_hand >> trump_shift) & 0xFF
+                            threat = strength[trump_shift | BEST_TRUMP_RANK[follow]] if follow else 0
+                        if partner_winning and best > threat:
+                            threat = -1
+                    memo_key = moves | (lead << 5 | win_card) << 32 | (partner_winning << 5 | threat + 1) << 40
+                    ordered = order_memo.get(memo_key)
+                    if ordered is None:
+                        ordered = order_follows(moves, strength, best, threat, partner_winning, memo_key)
+            elif moves & (moves - 1) == 0:
+                ordered = (moves.bit_length() - 1,)
+            else:
+                ordered = order_leads(moves, hands, seat)
+                if tt_move >= 0 and ordered[0] != tt_move:
+                    ordered.remove(tt_move)
+                    ordered.insert(0, tt_move)
+
+            best = -1 if maximizing else 1 << 16
+            best_card = -1
+            seat_keys = ZOBRIST_CARDS[seat]
+            next_seat = (seat + 1) & 3
+            for card in ordered:
+                hands[seat] = hand ^ (1 << card)
+                child_key = key ^ seat_keys[card]
+                points = trick_points + card_points[card]
+                if played == 0:
+                    new_lead, new_card, new_seat = card >> 3, card, seat
+                elif strength[card] > strength[win_card]:
+                    new_lead, new_card, new_seat = lead, card, seat
+                else:
+                    new_lead, new_card, new_seat = lead, win_card, win_seat
+                if played == 3:
+                    # Fin du pli : le gagnant entame le suivant
+                    if hands[new_seat] == 0:
+                        points += LAST_TRICK_BONUS
+                    gained = 0 if new_seat & 1 else points
+                    child_key ^= ZOBRIST_LEADER[next_seat] ^ ZOBRIST_LEADER[new_seat]
+                    value = gained + search(hands, new_seat, NO_SUIT, 0, new_seat, 0, 0, child_key,
+                                            alpha - gained, beta - gained, remaining - points)
+                else:
+                    value = search(hands, next_seat, new_lead, new_card, new_seat, points,
+                                   played + 1, child_key, alpha, beta, remaining)
+                hands[seat] = hand
+                if maximizing:
+                    if value > best:
+                        best, best_card = value, card
+                        if value > alpha:
+                            alpha = value
+                elif value < best:
+                    best, best_card = value, card
+                    if value < beta:
+                        beta = value
+                if alpha >= beta:
+                    break
+
+            if played == 0:
+                if endgame:
+                    exact[key] = best
+                elif best <= alpha_orig:
+                    store(key, cards_left, 0, best, best_card)
+                elif best >= beta_orig:
+                    store(key, cards_left, best, remaining, best_card)
+                else:
+                    store(key, cards_left, best, best, best_card)
+            return best
+
+        def counted_search(*args) -> int:
+            try:
+                return search(*args)
+            finally:
+                node_limit[0] -= counters[0]
+                self.nodes += counters[0]
+                self.tt_probes += counters[1]
+                self.tt_hits += counters[2]
+                counters[0] = counters[1] = counters[2] = 0
+
+        return counted_search
+
+    def _last_trick(self, hands: List[int], leader: int) -> int:
+        """Joue directement le dernier pli (une seule carte par main)"""
+        cards = [hands[(leader + i) & 3].bit_length() - 1 for i in range(NUM_PLAYERS)]
+        strength = self._strength[cards[0] >> 3]
+        best = max(range(NUM_PLAYERS), key=lambda i: strength[cards[i]])
+        winner = (leader + best) & 3
+        if winner & 1:
+            return 0
+        return sum(self._points[card] for card in cards) + LAST_TRICK_BONUS
+
+
+def _copy_round(game: BeloteRound) -> BeloteRound:
+    """Copie légère d'une donne en cours (listes dupliquées)"""
+    copy = BeloteRound.__new__(BeloteRound)
+    copy.__dict__.update(game.__dict__)
+    copy.hands = list(game.hands)
+    copy.trick = list(game.trick)
+    copy.points = list(game.points)
+    copy.tricks_won = list(game.tricks_won)
+    copy.history = list(game.history)
+    return copy
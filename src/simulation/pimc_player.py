@@ -0,0 +1,383 @@
+"""
+Joueur artificiel par échantillonnage de mondes (PIMC)
+
+À chaque coup, le joueur tire des répartitions des cartes cachées
+compatibles avec ce qu'il a vu (défausses, refus de couper, sous-coupes),
+évalue chacune de ses cartes jouables dans chaque monde, puis joue la
+carte dont la moyenne est la meilleure. En fin de donne, les mondes sont
+évalués exactement par le solveur double mort ; plus tôt, par une partie
+jouée avec la stratégie gloutonne du simulateur, bien moins coûteuse.
+
+Les mondes sont répartis, par petits lots, sur un ``ProcessPoolExecutor``
+persistant démarré hors du budget de temps par coup. Les processus
+s'arrêtent un peu avant l'échéance et rendent les totaux partiels de leur
+lot ; les lots sont relevés au fil de l'eau et ceux qui ne sont pas
+arrivés peu après l'échéance sont abandonnés.
+"""
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from models.card import SUIT_MASKS, mask_to_indices
+from models.rules import (
+    BeloteRound, HIGHER_TRUMPS, TRICK_STRENGTH, TOTAL_POINTS, NUM_PLAYERS, team_of,
+)
+from simulation.deal_simulator import greedy_move
+from simulation.double_dummy import DoubleDummySolver, _copy_round
+
+DEFAULT_SAMPLES = 64
+DEFAULT_TIME_BUDGET_MS = 500
+# Nombre de cartes restantes en dessous duquel les mondes sont résolus exactement
+DEFAULT_EXACT_THRESHOLD = 16
+_MAX_SAMPLING_ATTEMPTS = 100
+# Mondes par lot envoyé à un processus : de petits lots arrivent au fil
+# de l'eau, et un lot en retard ne coûte que quelques mondes
+_CHUNK_WORLDS = 4
+# Les processus s'arrêtent cette marge avant l'échéance, pour que leurs
+# totaux partiels arrivent à temps ; les lots sont encore attendus
+# _GRACE_S après l'échéance
+_WORKER_MARGIN_S = 0.02
+_GRACE_S = 0.02
+
+
+@dataclass
+class Constraints:
+    """Ce que l'historique révèle des mains adverses"""
+    # forbidden[place] : cartes que ce joueur ne peut pas avoir
+    forbidden: List[int] = field(default_factory=lambda: [0] * NUM_PLAYERS)
+    # known[place] : cartes que ce joueur a forcément (carte retournée du preneur)
+    known: List[int] = field(default_factory=lambda: [0] * NUM_PLAYERS)
+
+
+@dataclass
+class MoveDecision:
+    """Résultat d'une décision du joueur"""
+    card: int
+    # Points moyens de l'équipe du joueur pour chaque carte évaluée
+    scores: Dict[int, float]
+    worlds: int
+    elapsed: float
+
+
+def infer_constraints(game: BeloteRound, seat: int, turned_card: Optional[int] = None) -> Constraints:
+    """
+    Déduit les cartes impossibles de chaque joueur en rejouant l'historique
+
+    Args:
+        game: La donne en cours
+        seat: La place du joueur qui raisonne
+        turned_card: La carte retournée, connue de tous et détenue par le preneur
+
+    Returns:
+        Les contraintes sur les mains des autres joueurs
+    """
+    constraints = Constraints()
+    trump = game.trump
+    played = 0
+    lead, winning_card, winning_seat = 0, 0, 0
+    for position, (player, card) in enumerate(game.history):
+        played |= 1 << card
+        if position % NUM_PLAYERS == 0:
+            lead, winning_card, winning_seat = card >> 3, card, player
+            continue
+        suit = card >> 3
+        partner_winning = (winning_seat ^ player) == 2
+        if suit != lead:
+            # Il n'a pas fourni ; s'il n'a pas non plus coupé alors qu'il le devait, il n'a plus d'atout
+            constraints.forbidden[player] |= SUIT_MASKS[lead]
+            if suit != trump and not partner_winning:
+                constraints.forbidden[player] |= SUIT_MASKS[trump]
+        must_overtrump = winning_card >> 3 == trump and (lead == trump or not partner_winning)
+        if suit == trump and must_overtrump and not HIGHER_TRUMPS[winning_card] >> card & 1:
+            # Il n'a pas monté : il n'a aucun atout plus fort que le maître du pli
+            constraints.forbidden[player] |= HIGHER_TRUMPS[winning_card]
+        strength = TRICK_STRENGTH[trump][lead]
+        if strength[card] > strength[winning_card]:
+            winning_card, winning_seat = card, player
+    if turned_card is not None and not played >> turned_card & 1 and game.taker != seat:
+        constraints.known[game.taker] |= 1 << turned_card
+    return constraints
+
+
+def sample_world(own: int, seat: int, counts: Sequence[int], hidden: int,
+                 constraints: Constraints, rng: random.Random) -> Optional[List[int]]:
+    """
+    Tire une répartition des cartes cachées compatible avec les contraintes
+
+    Args:
+        own: La main du joueur qui raisonne
+        seat: Sa place
+        counts: Le nombre de cartes restant dans chaque main
+        hidden: Le masque des cartes encore dans les mains des autres joueurs
+        constraints: Les contraintes déduites de l'historique
+        rng: Le générateur aléatoire
+
+    Returns:
+        Les masques des quatre mains, ou None si aucun tirage n'a abouti
+    """
+    others = [p for p in range(NUM_PLAYERS) if p != seat]
+    forbidden = constraints.forbidden
+    for _ in range(_MAX_SAMPLING_ATTEMPTS):
+        hands = [0] * NUM_PLAYERS
+        hands[seat] = own
+        need = list(counts)
+        need[seat] = 0
+        pool = hidden
+        for player in others:
+            known = constraints.known[player] & pool
+            hands[player] |= known
+            need[player] -= known.bit_count()
+            pool &= ~known
+        cards = mask_to_indices(pool)
+        rng.shuffle(cards)
+        # Les cartes les plus contraintes d'abord
+        cards.sort(key=lambda c: sum(1 for p in others if not forbidden[p] >> c & 1))
+        for card in cards:
+            holders = [p for p in others if need[p] > 0 and not forbidden[p] >> card & 1]
+            if not holders:
+                break
+            player = rng.choices(holders, [need[p] for p in holders])[0]
+            hands[player] |= 1 << card
+            need[player] -= 1
+        else:
+            return hands
+    return None
+
+
+def evaluate_worlds(view: BeloteRound, seat: int, counts: Sequence[int], hidden: int,
+                    constraints: Constraints, num_worlds: int, seed: int, deadline: Optional[float],
+                    exact_threshold: int = DEFAULT_EXACT_THRESHOLD) -> Tuple[Dict[int, int], int]:
+    """
+    Évalue les cartes jouables sur num_worlds mondes (exécuté dans un processus)
+
+    Args:
+        view: La donne vue par le joueur (mains des autres vides)
+        seat: La place du joueur
+        counts: Le nombre de cartes restant dans chaque main
+        hidden: Le masque des cartes cachées
+        constraints: Les contraintes déduites de l'historique
+        num_worlds: Le nombre de mondes à tirer
+        seed: La graine de ce lot de mondes
+        deadline: L'échéance (time.monotonic()) au-delà de laquelle on s'arrête
+        exact_threshold: Cartes restantes à partir desquelles on résout exactement
+
+    Returns:
+        (somme des points de l'équipe du joueur par carte, nombre de mondes évalués)
+    """
+    rng = random.Random(seed)
+    team = team_of(seat)
+    totals: Dict[int, int] = {}
+    evaluated = 0
+    for _ in range(num_worlds):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        hands = sample_world(view.hands[seat], seat, counts, hidden, constraints, rng)
+        if hands is None:
+            continue
+        world = _copy_round(view)
+        world.hands = hands
+        if sum(counts) <= exact_threshold:
+            values = _solver().evaluate_moves(world)
+            if team:
+                values = {card: TOTAL_POINTS - value for card, value in values.items()}
+        else:
+            values = {card: _greedy_value(world, card, team)
+                      for card in mask_to_indices(world.legal_moves())}
+        for card, value in values.items():
+            totals[card] = totals.get(card, 0) + value
+        evaluated += 1
+    return totals, evaluated
+
+
+_process_solver: Optional[DoubleDummySolver] = None
+
+
+def _solver() -> DoubleDummySolver:
+    """Solveur propre au processus, dont la table est réutilisée d'un coup à l'autre"""
+    global _process_solver
+    if _process_solver is None:
+        _process_solver = DoubleDummySolver(tt_bits=18)
+    return _process_solver
+
+
+def _warm_up() -> int:
+    """Prépare un processus de calcul (imports et table du solveur)"""
+    _solver()
+    return os.getpid()
+
+
+def _greedy_value(world: BeloteRound, card: int, team: int) -> int:
+    """Joue card puis termine la donne avec la stratégie gloutonne"""
+    game = _copy_round(world)
+    game.play(card)
+    while not game.is_over:
+        game.play(greedy_move(game))
+    return game.points[team]
+
+
+class PimcPlayer:
+    """Joueur artificiel à échantillonnage de mondes"""
+
+    def __init__(self, seat: int, num_samples: int = DEFAULT_SAMPLES,
+                 time_budget_ms: Optional[int] = DEFAULT_TIME_BUDGET_MS,
+                 workers: Optional[int] = None, seed: Optional[int] = None,
+                 exact_threshold: int = DEFAULT_EXACT_THRESHOLD):
+        """
+        Args:
+            seat: La place du joueur (0-3)
+            num_samples: Le nombre de mondes tirés par coup
+            time_budget_ms: Le budget par coup en millisecondes (None : pas de limite)
+            workers: Le nombre de processus (0 ou 1 : tout dans le processus courant)
+            seed: La graine, pour des décisions reproductibles
+            exact_threshold: Cartes restantes à partir desquelles on résout exactement
+        """
+        self.seat = seat
+        self.num_samples = num_samples
+        self.time_budget_ms = time_budget_ms
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.exact_threshold = exact_threshold
+        self.turned_card: Optional[int] = None
+        self._rng = random.Random(seed)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.decisions = 0
+        self.worlds_evaluated = 0
+        self.thinking_time = 0.0
+
+    @property
+    def moves_per_second(self) -> float:
+        """Retourne le nombre de coups joués par seconde de réflexion"""
+        return self.decisions / self.thinking_time if self.thinking_time else 0.0
+
+    @property
+    def worlds_per_second(self) -> float:
+        """Retourne le nombre de mondes évalués par seconde de réflexion"""
+        return self.worlds_evaluated / self.thinking_time if self.thinking_time else 0.0
+
+    def choose_card(self, game: BeloteRound) -> MoveDecision:
+        """
+        Choisit la carte à jouer pour la place du joueur
+
+        Args:
+            game: La donne en cours ; seule la main du joueur et l'historique
+                  sont utilisés, les autres mains restent cachées
+
+        Returns:
+            La décision (carte, scores moyens, mondes évalués, temps écoulé)
+        """
+        if game.current != self.seat:
+            raise ValueError("Ce n'est pas au tour de ce joueur.")
+        moves = game.legal_moves()
+        if moves & (moves - 1) == 0:
+            return self._record(MoveDecision(moves.bit_length() - 1, {}, 0, 0.0))
+        if self.workers > 1:
+            # Démarrage des processus hors du budget du coup
+            self._start_pool()
+        start = time.monotonic()
+
+        deadline = start + self.time_budget_ms / 1000 if self.time_budget_ms is not None else None
+        constraints = infer_constraints(game, self.seat, self.turned_card)
+        # Seules les informations publiques sont transmises : les mains
+        # adverses sont remplacées par leur nombre de cartes
+        counts = [hand.bit_count() for hand in game.hands]
+        hidden = 0
+        for player, hand in enumerate(game.hands):
+            if player != self.seat:
+                hidden |= hand
+        view = _copy_round(game)
+        view.hands = [hand if p == self.seat else 0 for p, hand in enumerate(game.hands)]
+        if self.workers <= 1:
+            results = [evaluate_worlds(view, self.seat, counts, hidden, constraints, self.num_samples,
+                                       self._rng.getrandbits(63), deadline, self.exact_threshold)]
+        else:
+            worker_deadline = deadline - _WORKER_MARGIN_S if deadline is not None else None
+            tasks = [
+                (view, self.seat, counts, hidden, constraints, size, self._rng.getrandbits(63),
+                 worker_deadline, self.exact_threshold)
+                for size in self._split(self.num_samples)
+            ]
+            results = self._run_parallel(tasks, deadline)
+
+        totals: Dict[int, int] = {}
+        worlds = 0
+        for batch_totals, evaluated in results:
+            worlds += evaluated
+            for card, value in batch_totals.items():
+                totals[card] = totals.get(card, 0) + value
+        if worlds:
+            scores = {card: value / worlds for card, value in totals.items()}
+            card = max(sorted(scores), key=scores.__getitem__)
+        else:
+            scores = {}
+            card = greedy_move(game)
+        return self._record(MoveDecision(card, scores, worlds, time.monotonic() - start))
+
+    def close(self):
+        """Arrête les processus de calcul"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _split(self, num_samples: int) -> List[int]:
+        """Découpe les mondes en lots d'au plus _CHUNK_WORLDS"""
+        parts = max(1, -(-num_samples // _CHUNK_WORLDS))
+        return [num_samples // parts + (i < num_samples % parts) for i in range(parts)]
+
+    def _start_pool(self):
+        """Démarre les processus de calcul et attend qu'ils soient prêts"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            warm_ups = [self._executor.submit(_warm_up) for _ in range(self.workers)]
+            for future in warm_ups:
+                future.result()
+
+    def _run_parallel(self, tasks: Sequence[tuple],
+                      deadline: Optional[float]) -> List[Tuple[Dict[int, int], int]]:
+        """
+        Répartit les lots et relève leurs totaux au fil de l'eau
+
+        Les lots encore en file à l'échéance sont annulés ; ceux qui
+        tournent rendent leurs totaux partiels, attendus _GRACE_S au plus.
+        """
+        futures = [self._executor.submit(evaluate_worlds, *task) for task in tasks]
+        timeout = None if deadline is None else max(0.0, deadline + _GRACE_S - time.monotonic())
+        results = []
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                if not future.cancelled():
+                    results.append(future.result())
+                if deadline is not None and time.monotonic() >= deadline:
+                    # Les lots pas encore commencés ne rendraient plus rien
+                    for pending in futures:
+                        pending.cancel()
+        except TimeoutError:
+            pass
+        for future in futures:
+            future.cancel()
+        return results
+
+    def _record(self, decision: MoveDecision) -> MoveDecision:
+        self.decisions += 1
+        self.worlds_evaluated += decision.worlds
+        self.thinking_time += decision.elapsed
+        return decision
+
+
+def play_round(game: BeloteRound, players: Dict[int, PimcPlayer]) -> Tuple[int, int]:
+    """
+    Joue la donne jusqu'au bout, pour des parties entre robots
+
+    Args:
+        game: La donne à jouer (modifiée sur place)
+        players: Les joueurs PIMC par place ; les places absentes jouent
+                 la stratégie gloutonne
+
+    Returns:
+        Les scores finaux des deux équipes
+    """
+    while not game.is_over:
+        player = players.get(game.current)
+        game.play(player.choose_card(game).card if player is not None else greedy_move(game))
+    return game.scores()
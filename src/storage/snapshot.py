@@ -0,0 +1,259 @@
+"""
+Format binaire d'échange d'un tournoi complet
+
+Le fichier contient un en-tête, une table de chaînes (noms des équipes et
+des joueurs, chacun stocké une seule fois) puis trois tableaux
+d'enregistrements de taille fixe : équipes, matchs (calendrier et scores)
+et événements du journal des résultats. Tous les champs sont des entiers
+little-endian packés avec ``struct``.
+
+À la lecture, le fichier est projeté en mémoire avec ``mmap`` : seul
+l'en-tête est décodé à l'ouverture, chaque enregistrement ou chaîne l'est
+à la demande, par son décalage.
+
+    en-tête | décalages des chaînes (u32 × n+1) | octets UTF-8
+            | équipes | matchs | événements
+"""
+import mmap
+import struct
+from typing import Callable, Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from controllers.result_journal import ResultEvent, SUBMIT, CANCEL, USER, UNDO, REDO
+from models.game import Game
+from models.player import Player
+from models.team import Team
+
+MAGIC = b"BLTS"
+VERSION = 1
+
+# magic, version, nombre de chaînes, d'équipes, de matchs, d'événements, taille des octets UTF-8
+_HEADER = struct.Struct("<4sHxxIIIII")
+# nom, joueur 1, joueur 2 (indices dans la table de chaînes)
+_TEAM = struct.Struct("<III")
+# identifiant (128 bits), période, équipe 1, équipe 2 (indices), score 1, score 2, joué
+_GAME = struct.Struct("<16sIIIhhB3x")
+# seq, type, origine, présence des scores (bit 0) et des anciens scores (bit 1),
+# identifiant du match, scores, anciens scores, horodatage
+_EVENT = struct.Struct("<IBBBx16shhhhd")
+_OFFSET = struct.Struct("<I")
+
+_KINDS = (SUBMIT, CANCEL)
+_ORIGINS = (USER, UNDO, REDO)
+_HAS_SCORES = 1
+_HAS_PREVIOUS = 2
+# Bornes des scores, stockés sur 16 bits signés (au-delà de models.game.MAX_SCORE)
+_SCORE_MIN = -0x8000
+_SCORE_MAX = 0x7FFF
+
+T = TypeVar("T")
+
+
+class SnapshotError(ValueError):
+    """Fichier d'instantané invalide"""
+
+
+def save_snapshot(path: str, teams: Sequence[Team], games: Sequence[Game],
+                  events: Sequence[ResultEvent]):
+    """
+    Écrit l'état complet d'un tournoi
+
+    Args:
+        path: Le fichier à écrire
+        teams: Les équipes, dans l'ordre d'inscription
+        games: Les matchs, dans l'ordre du calendrier
+        events: Le journal des résultats
+
+    Raises:
+        SnapshotError: Si un score ne tient pas sur 16 bits signés ; le
+                       fichier n'est alors pas écrit
+    """
+    strings: List[str] = []
+    string_ids = {}
+
+    def intern(text: str) -> int:
+        index = string_ids.get(text)
+        if index is None:
+            index = string_ids[text] = len(strings)
+            strings.append(text)
+        return index
+
+    team_ids = {}
+    team_records = bytearray(_TEAM.size * len(teams))
+    for index, team in enumerate(teams):
+        team_ids[team.name] = index
+        _TEAM.pack_into(team_records, index * _TEAM.size,
+                        intern(team.name), intern(team.player1.name), intern(team.player2.name))
+
+    game_records = bytearray(_GAME.size * len(games))
+    for index, game in enumerate(games):
+        score1, score2 = game.scores
+        _check_scores(game.scores, f"match {game.id}")
+        _GAME.pack_into(game_records, index * _GAME.size, game.id.to_bytes(16, "little"), game.period,
+                        team_ids[game.team1.name], team_ids[game.team2.name],
+                        score1, score2, game.is_played)
+
+    event_records = bytearray(_EVENT.size * len(events))
+    for index, event in enumerate(events):
+        flags = (_HAS_SCORES if event.scores is not None else 0) \
+            | (_HAS_PREVIOUS if event.previous is not None else 0)
+        _check_scores(event.scores, f"événement {event.seq}")
+        _check_scores(event.previous, f"événement {event.seq}")
+        _EVENT.pack_into(event_records, index * _EVENT.size, event.seq, _KINDS.index(event.kind),
+                         _ORIGINS.index(event.origin), flags, event.game_id.to_bytes(16, "little"),
+                         *(event.scores or (0, 0)), *(event.previous or (0, 0)), event.timestamp)
+
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = bytearray(_OFFSET.size * (len(encoded) + 1))
+    position = 0
+    for index, data in enumerate(encoded):
+        _OFFSET.pack_into(offsets, index * _OFFSET.size, position)
+        position += len(data)
+    _OFFSET.pack_into(offsets, len(encoded) * _OFFSET.size, position)
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(strings), len(teams), len(games), len(events), position))
+        file.write(offsets)
+        file.writelines(encoded)
+        file.write(team_records)
+        file.write(game_records)
+        file.write(event_records)
+
+
+def _check_scores(scores: Optional[Tuple[int, int]], owner: str):
+    if scores is not None and not all(_SCORE_MIN <= score <= _SCORE_MAX for score in scores):
+        raise SnapshotError(f"{owner} : scores {scores} hors des bornes du format "
+                            f"({_SCORE_MIN} à {_SCORE_MAX}).")
+
+
+class RecordView(Sequence, Generic[T]):
+    """Tableau d'enregistrements décodés à la demande"""
+
+    def __init__(self, count: int, decode: Callable[[int], T]):
+        self._count = count
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._decode, range(self._count))
+
+
+class Snapshot:
+    """
+    Instantané ouvert en lecture via mmap
+
+    Les propriétés teams, games et events sont des vues décodant chaque
+    enregistrement au moment où on y accède.
+    """
+
+    def __init__(self, path: str):
+        """
+        Ouvre le fichier
+
+        Raises:
+            SnapshotError: Si le fichier n'est pas un instantané valide
+        """
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError(f"{path} est vide.") from None
+        if len(self._map) < _HEADER.size:
+            raise SnapshotError(f"{path} est tronqué.")
+        magic, version, num_strings, num_teams, num_games, num_events, text_size = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise SnapshotError(f"{path} n'est pas un instantané de tournoi.")
+        if version != VERSION:
+            raise SnapshotError(f"Version d'instantané non prise en charge : {version}.")
+
+        self._num_strings = num_strings
+        self._offsets_at = _HEADER.size
+        self._text_at = self._offsets_at + _OFFSET.size * (num_strings + 1)
+        self._teams_at = self._text_at + text_size
+        self._games_at = self._teams_at + _TEAM.size * num_teams
+        self._events_at = self._games_at + _GAME.size * num_games
+        if len(self._map) != self._events_at + _EVENT.size * num_events:
+            raise SnapshotError(f"{path} est tronqué.")
+        self._strings: List[Optional[str]] = [None] * num_strings
+        self._team_cache: List[Optional[Team]] = [None] * num_teams
+
+        self.teams: RecordView[Team] = RecordView(num_teams, self._team)
+        self.games: RecordView[Game] = RecordView(num_games, self._game)
+        self.events: RecordView[ResultEvent] = RecordView(num_events, self._event)
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def string(self, index: int) -> str:
+        """Retourne la chaîne d'indice index de la table"""
+        text = self._strings[index]
+        if text is None:
+            start, end = struct.unpack_from("<II", self._map, self._offsets_at + index * _OFFSET.size)
+            text = self._strings[index] = self._map[self._text_at + start:self._text_at + end].decode("utf-8")
+        return text
+
+    def load(self) -> Tuple[List[Team], List[Game], List[ResultEvent]]:
+        """
+        Décode tout l'instantané
+
+        Les matchs sont retournés sans score, comme SqliteStore.load : les
+        scores se déduisent du journal.
+
+        Returns:
+            (équipes, matchs, événements du journal)
+        """
+        teams = list(self.teams)
+        games = [
+            Game(teams[team1], teams[team2], _id=int.from_bytes(game_id, "little"), _period=period)
+            for game_id, period, team1, team2, _, _, _ in _GAME.iter_unpack(
+                self._map[self._games_at:self._events_at])
+        ]
+        return teams, games, list(self.events)
+
+    # =====================
+    # Décodage d'un enregistrement
+    # =====================
+    def _team(self, index: int) -> Team:
+        # Une même équipe est partagée par tous les matchs qui la référencent
+        team = self._team_cache[index]
+        if team is None:
+            name, player1, player2 = _TEAM.unpack_from(self._map, self._teams_at + index * _TEAM.size)
+            team = self._team_cache[index] = Team(
+                self.string(name), Player(self.string(player1)), Player(self.string(player2)))
+        return team
+
+    def _game(self, index: int) -> Game:
+        game_id, period, team1, team2, score1, score2, played = \
+            _GAME.unpack_from(self._map, self._games_at + index * _GAME.size)
+        return Game(self._team(team1), self._team(team2), score1, score2,
+                    _id=int.from_bytes(game_id, "little"), _period=period, _played=bool(played))
+
+    def _event(self, index: int) -> ResultEvent:
+        seq, kind, origin, flags, game_id, score1, score2, previous1, previous2, timestamp = \
+            _EVENT.unpack_from(self._map, self._events_at + index * _EVENT.size)
+        return ResultEvent(
+            seq=seq,
+            kind=_KINDS[kind],
+            game_id=int.from_bytes(game_id, "little"),
+            scores=(score1, score2) if flags & _HAS_SCORES else None,
+            previous=(previous1, previous2) if flags & _HAS_PREVIOUS else None,
+            origin=_ORIGINS[origin],
+            timestamp=timestamp,
+        )
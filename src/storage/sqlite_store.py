@@ -0,0 +1,272 @@
+"""
+Persistance d'un tournoi dans une base SQLite
+
+La base est ouverte en mode WAL : les lectures ne sont jamais bloquées par
+une écriture en cours. Toutes les écritures passent par une file traitée
+par un thread dédié, qui regroupe les opérations en attente dans une seule
+transaction ; l'interface Qt ne touche donc jamais au disque. Les requêtes
+sont des chaînes constantes, réutilisées par le cache d'instructions
+préparées de sqlite3.
+
+Les résultats ne sont pas stockés comme un état mais comme le journal des
+saisies (voir controllers.result_journal) ; les scores des matchs en sont
+une copie dénormalisée, pratique pour consulter la base directement.
+"""
+import os
+import queue
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from controllers.result_journal import ResultEvent
+from models.game import Game
+from models.player import Player
+from models.team import Team
+
+# Nombre maximum d'opérations regroupées dans une transaction
+MAX_BATCH_SIZE = 10_000
+# Variable d'environnement pour choisir le fichier de la base
+DATABASE_ENV_VAR = "BELOTE_DB"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    position INTEGER PRIMARY KEY,
+    name     TEXT NOT NULL UNIQUE,
+    player1  TEXT NOT NULL,
+    player2  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id       TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    period   INTEGER NOT NULL,
+    team1    TEXT NOT NULL REFERENCES teams(name),
+    team2    TEXT NOT NULL REFERENCES teams(name),
+    score1   INTEGER NOT NULL DEFAULT 0,
+    score2   INTEGER NOT NULL DEFAULT 0,
+    played   INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS games_by_period ON games(period, position);
+CREATE TABLE IF NOT EXISTS events (
+    seq       INTEGER PRIMARY KEY,
+    kind      TEXT NOT NULL,
+    game_id   TEXT NOT NULL,
+    score1    INTEGER,
+    score2    INTEGER,
+    previous1 INTEGER,
+    previous2 INTEGER,
+    origin    TEXT NOT NULL,
+    timestamp REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_game ON events(game_id);
+"""
+
+_INSERT_TEAM = "INSERT INTO teams(position, name, player1, player2) VALUES (?, ?, ?, ?)"
+_DELETE_TEAM = "DELETE FROM teams WHERE name = ?"
+_INSERT_GAME = "INSERT INTO games(id, position, period, team1, team2) VALUES (?, ?, ?, ?, ?)"
+_INSERT_EVENT = "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_UPDATE_SCORES = "UPDATE games SET score1 = ?, score2 = ?, played = ? WHERE id = ?"
+
+# Les identifiants de matchs (uuid de 128 bits) dépassent les entiers SQLite
+_to_db_id = str
+_from_db_id = int
+
+_Operation = Tuple[str, Sequence[tuple]]
+_STOP = object()
+
+
+def default_database_path() -> str:
+    """Retourne le chemin de la base de l'application ($BELOTE_DB ou ~/.belote/tournament.db)"""
+    path = os.environ.get(DATABASE_ENV_VAR)
+    if path:
+        return path
+    directory = os.path.join(os.path.expanduser("~"), ".belote")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, "tournament.db")
+
+
+class SqliteStore:
+    """Stockage SQLite d'un tournoi, à écritures asynchrones"""
+
+    def __init__(self, path: str):
+        """
+        Ouvre (ou crée) la base
+
+        Args:
+            path: Le chemin du fichier de base de données
+        """
+        self.path = path
+        connection = self._connect()
+        try:
+            connection.executescript(_SCHEMA)
+            self._next_team_position = connection.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM teams").fetchone()[0]
+            self._next_game_position = connection.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM games").fetchone()[0]
+        finally:
+            connection.close()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="sqlite-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, cached_statements=32)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # En WAL, NORMAL ne perd au pire que les dernières transactions en cas de coupure
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        return connection
+
+    # =====================
+    # Écritures (asynchrones)
+    # =====================
+    def add_teams(self, teams: Iterable[Team]):
+        """Enregistre des équipes, dans l'ordre d'inscription"""
+        rows = []
+        for team in teams:
+            rows.append((self._next_team_position, team.name, team.player1.name, team.player2.name))
+            self._next_team_position += 1
+        self._submit(_INSERT_TEAM, rows)
+
+    def remove_team(self, team_name: str):
+        """Supprime une équipe"""
+        self._submit(_DELETE_TEAM, [(team_name,)])
+
+    def clear_teams(self):
+        """Supprime toutes les équipes"""
+        self._submit("DELETE FROM teams", [()])
+
+    def add_games(self, games: Iterable[Game]):
+        """Enregistre des matchs, dans l'ordre du calendrier"""
+        rows = []
+        for game in games:
+            rows.append((_to_db_id(game.id), self._next_game_position, game.period,
+                         game.team1.name, game.team2.name))
+            self._next_game_position += 1
+        self._submit(_INSERT_GAME, rows)
+
+    def append_events(self, events: Iterable[ResultEvent]):
+        """Ajoute des événements du journal des résultats et met à jour les scores"""
+        event_rows, score_rows = [], []
+        for event in events:
+            scores = event.scores or (None, None)
+            previous = event.previous or (None, None)
+            game_id = _to_db_id(event.game_id)
+            event_rows.append((event.seq, event.kind, game_id, *scores, *previous,
+                               event.origin, event.timestamp))
+            score_rows.append((*(event.scores or (0, 0)), event.scores is not None, game_id))
+        self._submit(_INSERT_EVENT, event_rows)
+        self._submit(_UPDATE_SCORES, score_rows)
+
+    def clear(self):
+        """Efface tout le tournoi"""
+        self._next_team_position = 0
+        self._next_game_position = 0
+        for table in ("events", "games", "teams"):
+            self._submit(f"DELETE FROM {table}", [()])
+
+    def flush(self):
+        """Attend que toutes les écritures en attente soient sur disque"""
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Termine les écritures en attente et arrête le thread d'écriture"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    def _submit(self, sql: str, rows: Sequence[tuple]):
+        if self._closed:
+            raise RuntimeError("Le stockage est fermé.")
+        if rows:
+            self._queue.put((sql, rows))
+
+    def _write_loop(self):
+        connection = self._connect()
+        try:
+            while True:
+                batch: List[_Operation] = [self._queue.get()]
+                while len(batch) < MAX_BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = _STOP in batch
+                operations = [operation for operation in batch if operation is not _STOP]
+                try:
+                    with connection:
+                        for sql, rows in operations:
+                            connection.executemany(sql, rows)
+                except sqlite3.Error:
+                    # Une opération fautive ne doit pas faire perdre les autres du lot
+                    for sql, rows in operations:
+                        try:
+                            with connection:
+                                connection.executemany(sql, rows)
+                        except sqlite3.Error as error:
+                            # Remonté au prochain flush() ; le thread continue d'écrire
+                            self._error = error
+                for _ in batch:
+                    self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    # =====================
+    # Lecture
+    # =====================
+    def load(self) -> Tuple[List[Team], List[Game], List[ResultEvent]]:
+        """
+        Relit le tournoi enregistré
+
+        Les matchs sont retournés sans score : ceux-ci se déduisent du
+        journal (voir TournamentController.load_from).
+
+        Returns:
+            (équipes, matchs, événements du journal), dans leur ordre d'origine
+        """
+        self.flush()
+        connection = self._connect()
+        try:
+            teams = [
+                Team(name, Player(player1), Player(player2))
+                for name, player1, player2 in connection.execute(
+                    "SELECT name, player1, player2 FROM teams ORDER BY position")
+            ]
+            teams_by_name: Dict[str, Team] = {team.name: team for team in teams}
+            games = [
+                Game(teams_by_name[team1], teams_by_name[team2], _id=_from_db_id(game_id), _period=period)
+                for game_id, period, team1, team2 in connection.execute(
+                    "SELECT id, period, team1, team2 FROM games ORDER BY position")
+            ]
+            events = [
+                ResultEvent(
+                    seq=seq, kind=kind, game_id=_from_db_id(game_id),
+                    scores=_pair(score1, score2), previous=_pair(previous1, previous2),
+                    origin=origin, timestamp=timestamp,
+                )
+                for seq, kind, game_id, score1, score2, previous1, previous2, origin, timestamp
+                in connection.execute("SELECT * FROM events ORDER BY seq")
+            ]
+        finally:
+            connection.close()
+        return teams, games, events
+
+    def has_tournament(self) -> bool:
+        """Indique si la base contient un tournoi commencé (calendrier généré)"""
+        self.flush()
+        connection = self._connect()
+        try:
+            return connection.execute("SELECT EXISTS(SELECT 1 FROM games)").fetchone()[0] == 1
+        finally:
+            connection.close()
+
+
+def _pair(first: Optional[int], second: Optional[int]) -> Optional[Tuple[int, int]]:
+    return None if first is None else (first, second)
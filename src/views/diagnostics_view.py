@@ -0,0 +1,128 @@
+"""
+Panneau de diagnostic (caché, ouvert par Ctrl+Maj+D)
+
+Affiche les durées et compteurs agrégés par diagnostics.instrumentation :
+nombre d'appels, durée totale, moyenne, percentiles et maximum de chaque
+opération mesurée. Permet de les exporter (avec le profil et les
+allocations s'ils sont capturés) ou de les remettre à zéro.
+"""
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+from PySide6.QtCore import Qt, QTimer
+
+from diagnostics.instrumentation import ENABLED, ENV_VAR, INSTRUMENTS, MODES, dump, output_directory
+
+TIMER_HEADERS = ("Opération", "Appels", "Total", "Moyenne", "p50", "p90", "p99", "Max")
+REFRESH_INTERVAL_MS = 1000
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _item(text: str, align_right: bool = True) -> QTableWidgetItem:
+    item = QTableWidgetItem(text)
+    if align_right:
+        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+    return item
+
+
+class DiagnosticsDialog(QDialog):
+    """Statistiques de l'instrumentation, rafraîchies chaque seconde tant que le panneau est ouvert"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostic")
+        self.resize(900, 600)
+
+        layout = QVBoxLayout(self)
+        if ENABLED:
+            modes = ", ".join(sorted(MODES))
+            status = f"Instrumentation active ({modes})"
+        else:
+            status = f"Instrumentation désactivée : relancer avec {ENV_VAR}=timers (ou timers,profile,memory)"
+        self.status_label = QLabel(status)
+        layout.addWidget(self.status_label)
+
+        self.timers_table = QTableWidget(0, len(TIMER_HEADERS))
+        self.timers_table.setHorizontalHeaderLabels(TIMER_HEADERS)
+        self.timers_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.timers_table.verticalHeader().hide()
+        self.timers_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.timers_table, 3)
+
+        self.counters_table = QTableWidget(0, 2)
+        self.counters_table.setHorizontalHeaderLabels(("Compteur", "Valeur"))
+        self.counters_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.counters_table.verticalHeader().hide()
+        self.counters_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.counters_table, 1)
+
+        self.memory_label = QLabel()
+        layout.addWidget(self.memory_label)
+
+        buttons_layout = QHBoxLayout()
+        export_btn = QPushButton("Exporter…")
+        export_btn.clicked.connect(self.on_export)
+        export_btn.setEnabled(ENABLED)
+        buttons_layout.addWidget(export_btn)
+        reset_btn = QPushButton("Remettre à zéro")
+        reset_btn.clicked.connect(self.on_reset)
+        buttons_layout.addWidget(reset_btn)
+        buttons_layout.addStretch()
+        close_btn = QPushButton("Fermer")
+        close_btn.clicked.connect(self.close)
+        buttons_layout.addWidget(close_btn)
+        layout.addLayout(buttons_layout)
+
+        # Rafraîchi seulement quand le panneau est visible
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        stats = INSTRUMENTS.snapshot()
+        timers = stats["timers"]
+        self.timers_table.setRowCount(len(timers))
+        for row, (name, timer) in enumerate(timers.items()):
+            self.timers_table.setItem(row, 0, _item(name, align_right=False))
+            self.timers_table.setItem(row, 1, _item(str(timer["calls"])))
+            for column, key in enumerate(("total", "mean", "p50", "p90", "p99", "max"), 2):
+                self.timers_table.setItem(row, column, _item(_format_duration(timer[key])))
+
+        counters = stats["counters"]
+        self.counters_table.setRowCount(len(counters))
+        for row, (name, value) in enumerate(counters.items()):
+            self.counters_table.setItem(row, 0, _item(name, align_right=False))
+            self.counters_table.setItem(row, 1, _item(str(value)))
+
+        memory = stats.get("memory")
+        self.memory_label.setText(
+            f"Mémoire suivie : {memory['current'] / 2**20:.1f} Mo (pic {memory['peak'] / 2**20:.1f} Mo)"
+            if memory else "")
+
+    def on_export(self):
+        directory = QFileDialog.getExistingDirectory(self, "Exporter le diagnostic", output_directory())
+        if not directory:
+            return
+        written = dump(directory)
+        QMessageBox.information(self, "Diagnostic exporté", "\n".join(written))
+
+    def on_reset(self):
+        INSTRUMENTS.reset()
+        self.refresh()
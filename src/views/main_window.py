@@ -1,24 +1,50 @@
+"""
+Fenêtre principale de l'application
+
+Le démarrage est découpé pour que la fenêtre s'affiche au plus vite :
+seul le cadre (titre, zone des pages, boutons) est construit avant le
+premier affichage. Le contrôleur et la base du tournoi sont chargés juste
+après (voir attach_tournament), et chaque vue n'est importée qu'à sa
+première ouverture. Le module n'importe donc ni le contrôleur ni les vues,
+et évite l'espace de noms ``Qt`` de PySide6, long à charger.
+"""
+from typing import TYPE_CHECKING
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QStackedWidget, QFrame
+    QPushButton, QLabel, QStackedWidget, QFrame, QProgressBar, QMessageBox
 )
-from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QKeySequence, QShortcut
+from PySide6.QtCore import QTimer, Signal
+
+from views.workers import WorkerPool
 
-from views.tournament_views.teams_creation_view import TeamsCreationView
-from views.tournament_views.matches_view import MatchesView
-from views.tournament_views.standings_view import StandingsView
+if TYPE_CHECKING:
+    from controllers.tournament_controller import TournamentController
+    from views.tournament_views.teams_creation_view import TeamsCreationView
+    from views.tournament_views.matches_view import MatchesView
+    from views.tournament_views.standings_view import StandingsView
 
-from controllers.tournament_controller import TournamentController
+# Noms des vues gérées par le ViewManager
+TEAMS_CREATION_VIEW = "teams_creation"
+MATCHES_VIEW = "matches"
+STANDINGS_VIEW = "standings"
 
 class MainWindow(QMainWindow):
     """Fenêtre principale de l'application"""
+    # Le contrôleur est chargé : la navigation est possible
+    ready = Signal()
 
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Application Bélote")
-        self.tournament_controller = TournamentController()
-        self.matches_view = None
+        # Chargés après le premier affichage (voir attach_tournament)
+        self.tournament_controller = None
+        self.store = None
+        self.views = None
+        # Serveur de saisie à distance, créé à sa première activation
+        self.score_bridge = None
+        self._attach_scheduled = False
 
         # =====================
         # Widget central
@@ -38,12 +64,11 @@ class MainWindow(QMainWindow):
         title_font.setPointSize(22)
         title_font.setBold(True)
         title.setFont(title_font)
-        title.setAlignment(Qt.AlignCenter)
+        # Centré par la feuille de style (qproperty-alignment)
         title.setObjectName("titleLabel")
         main_layout.addWidget(title)
 
         subtitle = QLabel("Gestion des matchs et des tournois")
-        subtitle.setAlignment(Qt.AlignCenter)
         subtitle.setObjectName("subtitleLabel")
         main_layout.addWidget(subtitle)
 
@@ -59,6 +84,25 @@ class MainWindow(QMainWindow):
         content_frame.setObjectName("contentFrame")
         main_layout.addWidget(content_frame)
 
+        # =====================
+        # Tâches en arrière-plan (l'interface reste fluide pendant les calculs)
+        # =====================
+        self.workers = WorkerPool(self)
+        self.workers.busy_changed.connect(self.on_busy_changed)
+        self.workers.progress.connect(self.on_task_progress)
+
+        self.task_frame = QFrame()
+        task_layout = QHBoxLayout(self.task_frame)
+        self.task_label = QLabel()
+        task_layout.addWidget(self.task_label)
+        self.task_progress = QProgressBar()
+        task_layout.addWidget(self.task_progress, 1)
+        cancel_task_btn = QPushButton("Annuler")
+        cancel_task_btn.clicked.connect(self.workers.cancel_all)
+        task_layout.addWidget(cancel_task_btn)
+        self.task_frame.hide()
+        main_layout.addWidget(self.task_frame)
+
         # =====================
         # Boutons navigation
         # =====================
@@ -67,53 +111,56 @@ class MainWindow(QMainWindow):
 
         self.tournament_button = self.create_menu_button("🏆 Tournoi")
         self.tournament_button.clicked.connect(self.on_init_tournament)
+        # Activé une fois le contrôleur chargé
+        self.tournament_button.setEnabled(False)
         button_layout.addWidget(self.tournament_button)
 
+        self.resume_button = self.create_menu_button("📂 Reprendre le tournoi")
+        self.resume_button.clicked.connect(self.on_resume_tournament)
+        self.resume_button.hide()
+        button_layout.addWidget(self.resume_button)
+
         main_layout.addLayout(button_layout)
 
-        # =====================
-        # Style global
-        # =====================
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e2f;
-            }
-
-            #titleLabel {
-                color: white;
-            }
-
-            #subtitleLabel {
-                color: #bbbbbb;
-                font-size: 14px;
-            }
-
-            #contentFrame {
-                background-color: #2a2a40;
-                border-radius: 12px;
-                padding: 15px;
-            }
-
-            QPushButton {
-                background-color: #3a3a5a;
-                color: white;
-                border-radius: 10px;
-                padding: 14px;
-                font-size: 14px;
-            }
-
-            QPushButton:hover {
-                background-color: #50507a;
-            }
-
-            QPushButton:pressed {
-                background-color: #2a2a45;
-            }
-        """)
+        # Panneau de diagnostic caché (voir diagnostics.instrumentation)
+        self.diagnostics_dialog = None
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.show_diagnostics)
+
+        # Le style vient de la feuille de l'application (voir views.theme)
 
         # Ouvrir maximisé
         self.showMaximized()
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.tournament_controller is None and not self._attach_scheduled:
+            # La fenêtre est dessinée : le reste du démarrage peut attendre la boucle d'événements
+            self._attach_scheduled = True
+            QTimer.singleShot(0, self.attach_tournament)
+
+    def attach_tournament(self):
+        """Charge le contrôleur et la base du tournoi, puis active la navigation"""
+        from controllers.tournament_controller import TournamentController
+        from storage.sqlite_store import SqliteStore, default_database_path
+        from views.view_manager import ViewManager
+
+        if self.tournament_controller is not None:
+            return
+        self.tournament_controller = TournamentController()
+        # Chaque modification est enregistrée en arrière-plan, sans bloquer l'interface
+        self.store = SqliteStore(default_database_path())
+        self.tournament_controller.attach_store(self.store)
+
+        # Une seule instance par vue, construite (et importée) à la première ouverture
+        self.views = ViewManager(self.stacked_widget, self.tournament_controller)
+        self.views.register(TEAMS_CREATION_VIEW, self.create_teams_creation_view)
+        self.views.register(MATCHES_VIEW, self.create_matches_view)
+        self.views.register(STANDINGS_VIEW, self.create_standings_view)
+
+        self.tournament_button.setEnabled(True)
+        self.resume_button.setVisible(self.store.has_tournament())
+        self.ready.emit()
+
     # =====================
     # Factory bouton stylé
     # =====================
@@ -122,43 +169,163 @@ class MainWindow(QMainWindow):
         btn.setMinimumHeight(60)
         return btn
 
+    # =====================
+    # Factories des vues (appelées une seule fois par le ViewManager)
+    # =====================
+    def create_teams_creation_view(self) -> "TeamsCreationView":
+        from views.tournament_views.teams_creation_view import TeamsCreationView
+        view = TeamsCreationView(self)
+        view.start_btn.clicked.connect(self.on_start_tournament)
+        return view
+
+    def create_matches_view(self) -> "MatchesView":
+        from views.tournament_views.matches_view import MatchesView
+        view = MatchesView(self)
+        view.tournament_standings_requested.connect(self.go_to_standings_view)
+        view.back_requested.connect(self.show_selection_buttons)
+        view.remote_entry_toggled.connect(self.on_remote_entry_toggled)
+        return view
+
+    def create_standings_view(self) -> "StandingsView":
+        from views.tournament_views.standings_view import StandingsView
+        view = StandingsView(self)
+        view.back_button.clicked.connect(self.go_to_matches_view)
+        view.restart_btn.clicked.connect(self.on_init_tournament)
+        view.display_requested.connect(self.open_leaderboard_window)
+        return view
+
     # =====================
     # Slots (à compléter)
     # =====================
     def on_init_tournament(self):
-        self.matches_view = None
+        # Le nouveau tournoi est préparé en mémoire : le tournoi enregistré
+        # n'est remplacé qu'à l'adoption du calendrier (_on_tournament_planned)
+        self.tournament_controller.attach_store(None)
         self.tournament_controller.clear_tournament()
-        team_creation_view = TeamsCreationView(self)
-        team_creation_view.start_btn.clicked.connect(self.go_to_matches_view)
-        self.stacked_widget.addWidget(team_creation_view)
-        self.stacked_widget.setCurrentWidget(team_creation_view)
+        self.views.show(TEAMS_CREATION_VIEW).reset()
         self.hide_selection_buttons()
 
-    def go_to_matches_view(self):
-        if self.matches_view is None: 
-            self.matches_view = MatchesView(self)
-            self.matches_view.tournament_standings_requested.connect(self.go_to_standings_view)
-            self.stacked_widget.addWidget(self.matches_view)
+    def on_resume_tournament(self):
+        from controllers.tournament_controller import TournamentController
+        store = self.store
+        self.workers.submit(
+            "Chargement du tournoi…",
+            lambda progress: TournamentController.prepare(*store.load(), progress=progress),
+            on_result=self._on_tournament_loaded,
+            on_error=self.show_task_error,
+        )
+        self.hide_selection_buttons()
 
-        self.stacked_widget.setCurrentWidget(self.matches_view)
+    def _on_tournament_loaded(self, prepared: "TournamentController"):
+        self.tournament_controller.attach_store(self.store)
+        self.tournament_controller.adopt(prepared)
+        self.go_to_matches_view()
+
+    def on_start_tournament(self):
+        self.workers.submit(
+            "Génération du calendrier…",
+            lambda progress: self.tournament_controller.plan_tournament(progress=progress),
+            on_result=self._on_tournament_planned,
+            on_error=self.show_task_error,
+        )
+
+    def _on_tournament_planned(self, periods):
+        self.tournament_controller.add_periods(periods)
+        self.tournament_controller.save_to(self.store)
+        self.go_to_matches_view()
+
+    def go_to_matches_view(self):
+        self.views.show(MATCHES_VIEW)
         self.hide_selection_buttons()
 
     def go_to_standings_view(self, is_tournament_ended):
-        standings_view = StandingsView(self, is_tournament_ended)
-        standings_view.back_button.clicked.connect(self.go_to_matches_view)
-        if is_tournament_ended:
-            standings_view.restart_btn.clicked.connect(self.on_init_tournament)
-
-        self.stacked_widget.addWidget(standings_view)
-        self.stacked_widget.setCurrentWidget(standings_view)
+        controller = self.tournament_controller
+        if controller.standings_stale:
+            # Résultats validés en lot : le classement est recalculé en arrière-plan
+            self.workers.submit(
+                "Calcul du classement…",
+                controller.compute_standings,
+                on_result=lambda result: self._on_standings_computed(result, is_tournament_ended),
+                on_error=self.show_task_error,
+            )
+            return
+        self.views.get(STANDINGS_VIEW).set_tournament_ended(is_tournament_ended)
+        self.views.show(STANDINGS_VIEW)
         self.hide_selection_buttons()
 
+    def _on_standings_computed(self, result, is_tournament_ended):
+        self.tournament_controller.adopt_standings(*result)
+        self.go_to_standings_view(is_tournament_ended)
+
+    def on_remote_entry_toggled(self, enabled: bool):
+        from server.score_server import lan_address
+        from views.score_bridge import ScoreBridge
+
+        view = self.views.get(MATCHES_VIEW)
+        if not enabled:
+            if self.score_bridge is not None:
+                self.score_bridge.stop()
+            view.set_remote_address("")
+            return
+        if self.score_bridge is None:
+            self.score_bridge = ScoreBridge(self.tournament_controller, self)
+        try:
+            _, port = self.score_bridge.start()
+        except OSError as error:
+            view.set_remote_address("")
+            QMessageBox.warning(self, "Saisie à distance", f"Impossible de démarrer le serveur : {error}")
+            return
+        view.set_remote_address(f"http://{lan_address()}:{port}/", self.score_bridge.code)
+
+    def open_leaderboard_window(self):
+        """Ouvre un écran d'affichage du classement en direct (un par écran de la salle)"""
+        from views.tournament_views.leaderboard_window import LeaderboardWindow
+        LeaderboardWindow(self.tournament_controller.leaderboard, self).show()
+
+    def on_busy_changed(self, busy: bool):
+        """Bloque la saisie pendant une tâche ; la fenêtre continue de se redessiner"""
+        self.stacked_widget.setEnabled(not busy)
+        self.tournament_button.setEnabled(not busy)
+        self.resume_button.setEnabled(not busy)
+        self.task_frame.setVisible(busy)
+
+    def on_task_progress(self, label: str, done: int, total: int):
+        self.task_label.setText(label)
+        # Un total nul affiche une barre d'attente sans pourcentage
+        self.task_progress.setRange(0, total)
+        self.task_progress.setValue(done)
+
+    def show_task_error(self, error: BaseException):
+        QMessageBox.warning(self, "Erreur", str(error))
+
     # Méthodes
     # =====================
     def hide_selection_buttons(self):
         self.tournament_button.hide()
+        self.resume_button.hide()
 
     def show_selection_buttons(self):
         self.tournament_button.show()
+        # Un calendrier en cours est aussi celui de la base : pas de lecture
+        # (ni d'attente de l'écriture en arrière-plan) dans le thread de l'interface
+        self.resume_button.setVisible(bool(self.tournament_controller.games))
+
+    def show_diagnostics(self):
+        if self.diagnostics_dialog is None:
+            from views.diagnostics_view import DiagnosticsDialog
+            self.diagnostics_dialog = DiagnosticsDialog(self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+
+    def closeEvent(self, event):
+        self.workers.cancel_all()
+        self.workers.wait()
+        if self.score_bridge is not None:
+            self.score_bridge.stop()
+        # Fenêtre fermée avant la fin du démarrage : rien n'est encore chargé
+        if self.views is not None:
+            self.views.close()
+            self.store.close()
+        super().closeEvent(event)
 
     
\ No newline at end of file
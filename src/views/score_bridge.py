@@ -0,0 +1,127 @@
+"""
+Saisie des scores à distance depuis l'application graphique
+
+Fait tourner un server.score_server.ScoreServer dans un thread et applique
+ses lots dans le thread de l'interface : le signal batch_received, émis
+depuis le thread du serveur, est remis par Qt à la boucle d'événements de
+l'interface, qui valide le lot (TournamentController.validate_matches) puis
+rend la main au serveur. Les vues sont rafraîchies par la notification du
+contrôleur, comme pour une saisie locale : aucune interrogation périodique.
+Le serveur diffuse aussi le classement en direct (``/leaderboard``), lu
+dans le flux du contrôleur (TournamentController.leaderboard).
+
+Le calendrier connu du serveur est mis à jour à chaque modification du
+tournoi qui le change (nouvelle période, tournoi rechargé ou réinitialisé).
+Le code de l'événement, exigé de chaque saisie, est tiré une fois pour la
+session : arrêter puis relancer la saisie à distance le conserve.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import AbstractSet, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from controllers.tournament_controller import Change, RESULTS, STANDINGS, TournamentController
+from server.score_server import (
+    DEFAULT_HOST, DEFAULT_PORT, BackgroundServer, Result, ScoreServer, new_event_code, tables_of
+)
+
+
+@dataclass
+class _BatchRequest:
+    results: List[Result]
+    future: "asyncio.Future[AbstractSet[int]]"
+    loop: asyncio.AbstractEventLoop
+
+
+def _resolve(future: "asyncio.Future[AbstractSet[int]]", value: AbstractSet[int] = frozenset(),
+             error: Optional[BaseException] = None):
+    # Saisie abandonnée entre-temps (serveur arrêté)
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(value)
+
+
+class ScoreBridge(QObject):
+    """Serveur de saisie à distance relié au contrôleur de la fenêtre"""
+    # Émis depuis le thread du serveur ; traité dans le thread de l'interface
+    batch_received = Signal(object)
+    # Nombre de matchs validés par un lot reçu à distance
+    results_received = Signal(int)
+
+    def __init__(self, controller: TournamentController, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._controller = controller
+        # Code de l'événement, à afficher avec l'adresse du serveur
+        self.code = new_event_code()
+        self._background: Optional[BackgroundServer] = None
+        self.batch_received.connect(self._apply)
+
+    @property
+    def running(self) -> bool:
+        return self._background is not None
+
+    def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> Tuple[str, int]:
+        """
+        Démarre le serveur
+
+        Returns:
+            L'adresse d'écoute (hôte, port)
+
+        Raises:
+            OSError: Le port est déjà utilisé ou l'adresse invalide
+        """
+        if self._background is not None:
+            return self._background.server.address
+        server = ScoreServer(self._apply_batch, host, port, leaderboard=self._controller.leaderboard,
+                             code=self.code)
+        server.set_tables(tables_of(self._controller.games))
+        background = BackgroundServer(server)
+        address = background.start()
+        self._background = background
+        self._controller.add_listener(self._on_change)
+        return address
+
+    def stop(self):
+        if self._background is None:
+            return
+        self._controller.remove_listener(self._on_change)
+        self._background.stop()
+        self._background = None
+
+    # =====================
+    # Thread du serveur
+    # =====================
+    async def _apply_batch(self, results: List[Result]) -> AbstractSet[int]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.batch_received.emit(_BatchRequest(results, future, loop))
+        return await future
+
+    # =====================
+    # Thread de l'interface
+    # =====================
+    def _apply(self, request: _BatchRequest):
+        try:
+            validated = self._controller.validate_matches(request.results)
+        except Exception as error:  # renvoyé aux capitaines du lot
+            self._reply(request, error=error)
+            return
+        self._reply(request, frozenset(validated))
+        self.results_received.emit(len(validated))
+
+    @staticmethod
+    def _reply(request: _BatchRequest, value: AbstractSet[int] = frozenset(),
+               error: Optional[BaseException] = None):
+        try:
+            request.loop.call_soon_threadsafe(_resolve, request.future, value, error)
+        except RuntimeError:
+            # Boucle du serveur déjà fermée
+            pass
+
+    def _on_change(self, change: Change):
+        if change.kind not in (RESULTS, STANDINGS) and self._background is not None:
+            self._background.server.set_tables(tables_of(self._controller.games))
@@ -0,0 +1,156 @@
+"""
+Thème de l'application
+
+Toutes les règles de style sont réunies dans une seule feuille, posée une
+fois sur la QApplication : Qt ne l'analyse qu'une fois, au lieu d'analyser
+une chaîne CSS à chaque widget créé ou à chaque changement d'état.
+
+Les états visuels d'un widget sont des propriétés dynamiques sélectionnées
+par la feuille, par exemple ``QWidget[page="true"]``, posées à la création
+du widget.
+Les listes dessinées par un délégué (matchs, classement) n'ont pas de
+widget par ligne : leurs couleurs sont des QColor de la palette.
+
+Les pages (vues du QStackedWidget) portent la propriété ``page`` pour
+recevoir leur style propre.
+"""
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from diagnostics.instrumentation import timed
+
+# =====================
+# Palette
+# =====================
+BACKGROUND = "#1e1e2f"
+SURFACE = "#2a2a40"
+PANEL = "#252538"
+BORDER = "#3a3a5a"
+BUTTON_HOVER = "#50507a"
+BUTTON_PRESSED = "#2a2a45"
+ACCENT = "#66ccff"
+HIGHLIGHT = "#ffcc66"
+HEADER_TEXT = "#bbbbff"
+PLAYED = "#2a4a2f"
+VALIDATE = "#66cc66"
+CANCEL = "#cc6666"
+
+# Couleurs utilisées par les délégués, qui dessinent sans feuille de style
+PLAYED_BACKGROUND = QColor(PLAYED)
+OPEN_BACKGROUND = QColor(SURFACE)
+PERIOD_SEPARATOR = QColor(ACCENT)
+VALIDATE_COLOR = QColor(VALIDATE)
+CANCEL_COLOR = QColor(CANCEL)
+CARD_BACKGROUND = QColor(SURFACE)
+CARD_BORDER = QColor(BORDER)
+RANK_COLOR = QColor(ACCENT)
+TEAM_NAME_COLOR = QColor("white")
+SCORE_COLOR = QColor(HIGHLIGHT)
+# Fond et bordure des trois premières cartes du classement, par rang
+PODIUM_COLORS = {
+    1: (QColor("#3a5a2a"), QColor("#5a7a4a")),
+    2: (QColor("#3a4a5a"), QColor("#5a6a7a")),
+    3: (QColor("#5a3a2a"), QColor("#7a5a4a")),
+}
+
+STYLESHEET = f"""
+/* ===================== Fenêtre principale ===================== */
+QMainWindow {{
+    background-color: {BACKGROUND};
+}}
+
+#titleLabel {{
+    color: white;
+    qproperty-alignment: AlignCenter;
+}}
+
+#subtitleLabel {{
+    color: #bbbbbb;
+    font-size: 14px;
+    qproperty-alignment: AlignCenter;
+}}
+
+#contentFrame {{
+    background-color: {SURFACE};
+    border-radius: 12px;
+    padding: 15px;
+}}
+
+QPushButton {{
+    background-color: {BORDER};
+    color: white;
+    border-radius: 10px;
+    padding: 14px;
+    font-size: 14px;
+}}
+
+QPushButton:hover {{
+    background-color: {BUTTON_HOVER};
+}}
+
+QPushButton:pressed {{
+    background-color: {BUTTON_PRESSED};
+}}
+
+/* ===================== Pages ===================== */
+QWidget[page="true"], QWidget[page="true"] QWidget {{
+    background-color: {BACKGROUND};
+    color: white;
+    font-size: 13px;
+}}
+
+QWidget[page="true"] QPushButton {{
+    background-color: {BORDER};
+    border-radius: 8px;
+    font-weight: bold;
+    padding: 8px;
+}}
+
+QWidget[page="true"] QPushButton:hover {{
+    background-color: {BUTTON_HOVER};
+}}
+
+QWidget[page="true"] QPushButton:pressed {{
+    background-color: {BUTTON_PRESSED};
+}}
+
+QLabel#matchesHeader {{
+    font-size: 20px;
+    font-weight: bold;
+    color: white;
+}}
+
+QLabel#standingsHeader {{
+    font-size: 24px;
+    font-weight: bold;
+    color: {HIGHLIGHT};
+}}
+
+/* ===================== Matchs ===================== */
+QWidget[page="true"] QTableView {{
+    background-color: {PANEL};
+    border: 1px solid {BORDER};
+    border-radius: 12px;
+}}
+
+QWidget[page="true"] QHeaderView::section {{
+    background-color: {PANEL};
+    color: {HEADER_TEXT};
+    border: none;
+    font-weight: bold;
+    padding: 6px;
+}}
+
+/* ===================== Classement ===================== */
+QWidget[page="true"] QTableView#standingsList {{
+    border: none;
+    background-color: transparent;
+}}
+"""
+
+
+@timed("theme.apply")
+def apply_theme(app: QApplication):
+    """Pose la feuille de style de l'application (une seule analyse pour tous les widgets)"""
+    app.setStyleSheet(STYLESHEET)
+
@@ -0,0 +1,50 @@
+"""
+Écran d'affichage du classement en direct
+
+Fenêtre indépendante, à projeter sur un écran de la salle : autant de
+fenêtres que d'écrans peuvent être ouvertes, chacune abonnée au flux du
+classement (controllers.leaderboard) et tenue à jour à chaque résultat
+validé, sans relire tout le classement. F11 bascule en plein écran.
+"""
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QKeySequence, QShortcut
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from controllers.leaderboard import LeaderboardFeed
+from views.tournament_views.standings_model import StandingsModel, create_standings_table
+
+
+class LeaderboardWindow(QWidget):
+    """Classement en direct, sans commande, pour les écrans de la salle"""
+
+    def __init__(self, feed: LeaderboardFeed, parent: QWidget = None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("Classement en direct")
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setProperty("page", True)
+        self.resize(900, 700)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+
+        header = QLabel("🏆 Classement en direct")
+        header.setAlignment(Qt.AlignCenter)
+        header.setObjectName("standingsHeader")
+        layout.addWidget(header)
+
+        self.standings_model = StandingsModel(self)
+        standings_list = create_standings_table(self.standings_model)
+        layout.addWidget(standings_list)
+
+        QShortcut(QKeySequence(Qt.Key_F11), self, self.toggle_full_screen)
+        self.standings_model.follow(feed)
+
+    def toggle_full_screen(self):
+        if self.isFullScreen():
+            self.showNormal()
+        else:
+            self.showFullScreen()
+
+    def closeEvent(self, event):
+        self.standings_model.unfollow()
+        super().closeEvent(event)
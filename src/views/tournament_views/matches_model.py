@@ -0,0 +1,246 @@
+"""
+Modèle et délégué de la liste des matchs
+
+Un seul ``QTableView`` affiche tous les matchs : le modèle lit les parties
+du contrôleur à la demande et le délégué dessine chaque ligne visible
+(fond selon l'état, séparation des périodes, bouton de validation). Aucun
+widget n'est créé par match ; un ``QSpinBox`` n'existe que pendant la
+saisie d'un score.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, Qt
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen
+from PySide6.QtWidgets import QSpinBox, QStyledItemDelegate, QStyleOptionViewItem
+
+from controllers.tournament_controller import TournamentController
+from models.game import Game, MAX_SCORE
+from views.theme import (
+    CANCEL_COLOR, OPEN_BACKGROUND, PERIOD_SEPARATOR, PLAYED_BACKGROUND, VALIDATE_COLOR
+)
+
+# Colonnes
+PERIOD, TABLE, TEAM1, SCORE1, SCORE2, TEAM2, ACTION = range(7)
+_HEADERS = ("Période", "Table", "Équipe 1", "Score", "Score", "Équipe 2", "")
+_SCORE_COLUMNS = (SCORE1, SCORE2)
+
+# Rôles propres au modèle, utilisés par le délégué
+PlayedRole = Qt.UserRole + 1
+PeriodStartRole = Qt.UserRole + 2
+
+# data() est appelée des milliers de fois par affichage : les énumérations Qt,
+# dont chaque accès coûte plusieurs microsecondes avec PySide6, sont lues une fois
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_EDIT_ROLE = int(Qt.EditRole)
+_ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+_ALIGNMENTS = {
+    TEAM1: int(Qt.AlignRight | Qt.AlignVCenter),
+    TEAM2: int(Qt.AlignLeft | Qt.AlignVCenter),
+}
+_ALIGN_CENTER = int(Qt.AlignCenter)
+_BOLD_COLUMNS = (PERIOD, TEAM1, TEAM2)
+_NO_BRUSH = QBrush(Qt.NoBrush)
+_NO_PEN = Qt.NoPen
+_BUTTON_TEXT = QColor(Qt.white)
+_BUTTON_ALIGNMENT = Qt.AlignCenter
+_ANTIALIASING = QPainter.RenderHint.Antialiasing
+
+
+class MatchesTableModel(QAbstractTableModel):
+    """Modèle en lecture directe des matchs du tournoi"""
+
+    def __init__(self, controller: TournamentController, parent=None):
+        super().__init__(parent)
+        self._controller = controller
+        self._games: Sequence[Game] = controller.games
+        # Scores saisis mais pas encore validés, par ligne
+        self._pending: Dict[int, List[int]] = {}
+        self._period_starts: Dict[int, int] = {}
+        self._rows_by_id: Dict[int, int] = {}
+        self._index_games()
+
+    def _index_games(self):
+        self._period_starts.clear()
+        self._rows_by_id.clear()
+        for row, game in enumerate(self._games):
+            self._period_starts.setdefault(game.period, row)
+            self._rows_by_id[game.id] = row
+
+    def reload(self):
+        """Relit les matchs du contrôleur (nouvelle ronde, tournoi rechargé)"""
+        self.beginResetModel()
+        # Un tournoi rechargé remplace la liste des matchs
+        self._games = self._controller.games
+        self._pending.clear()
+        self._index_games()
+        self.endResetModel()
+
+    def results_changed(self, game_ids: Iterable[int]):
+        """Rafraîchit uniquement les lignes des matchs dont le résultat a changé"""
+        rows = [self._rows_by_id[game_id] for game_id in game_ids if game_id in self._rows_by_id]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), ACTION))
+
+    # =====================
+    # Lecture
+    # =====================
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._games)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return _HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        game = self._games[row]
+        if role == _DISPLAY_ROLE or role == _EDIT_ROLE:
+            if column == PERIOD:
+                return f"🕒 Période {game.period + 1}" if self._is_period_start(row) else ""
+            if column == TABLE:
+                return f"🪑 Table {row - self._period_starts[game.period] + 1}"
+            if column == TEAM1:
+                return game.team1.name
+            if column == TEAM2:
+                return game.team2.name
+            if column in _SCORE_COLUMNS:
+                return self.scores(row)[column - SCORE1]
+            if column == ACTION:
+                return "✗ Annuler" if game.is_played else "✓ Valider"
+        elif role == _ALIGNMENT_ROLE:
+            return _ALIGNMENTS.get(column, _ALIGN_CENTER)
+        elif role == PlayedRole:
+            return game.is_played
+        elif role == PeriodStartRole:
+            return self._is_period_start(row)
+        return None
+
+    def flags(self, index: QModelIndex):
+        flags = super().flags(index)
+        if index.column() in _SCORE_COLUMNS and not self._games[index.row()].is_played:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def scores(self, row: int) -> List[int]:
+        """Retourne les scores affichés d'une ligne (validés ou en cours de saisie)"""
+        game = self._games[row]
+        if game.is_played:
+            return list(game.scores)
+        return self._pending.get(row, [0, 0])
+
+    def _is_period_start(self, row: int) -> bool:
+        return self._period_starts.get(self._games[row].period) == row
+
+    # =====================
+    # Modification
+    # =====================
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if role != Qt.EditRole or index.column() not in _SCORE_COLUMNS:
+            return False
+        row = index.row()
+        self._pending.setdefault(row, [0, 0])[index.column() - SCORE1] = int(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def toggle(self, row: int):
+        """
+        Valide la ligne avec les scores saisis, ou annule son résultat
+
+        La ligne est rafraîchie par la notification du contrôleur (voir results_changed).
+        """
+        game = self._games[row]
+        if game.is_played:
+            # Les scores annulés restent affichés pour être corrigés
+            self._pending[row] = list(game.scores)
+            self._controller.cancel_match(game.id)
+        else:
+            scores = tuple(self.scores(row))
+            self._pending.pop(row, None)
+            self._controller.validate_match(game.id, scores)
+
+    def validate_all(self, defer_standings: bool = False) -> int:
+        """
+        Valide en un seul appel toutes les lignes non encore validées
+
+        Args:
+            defer_standings: Laisser le recalcul du classement à l'appelant
+                             (voir TournamentController.validate_matches)
+
+        Returns:
+            Le nombre de matchs validés
+        """
+        results = [(game.id, tuple(self.scores(row)))
+                   for row, game in enumerate(self._games) if not game.is_played]
+        self._pending.clear()
+        return len(self._controller.validate_matches(results, defer_standings))
+
+
+class MatchDelegate(QStyledItemDelegate):
+    """Dessine les lignes de matchs et édite les scores sur place"""
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        painter.save()
+        played = index.data(PlayedRole)
+        painter.fillRect(option.rect, PLAYED_BACKGROUND if played else OPEN_BACKGROUND)
+        if index.data(PeriodStartRole):
+            painter.setPen(QPen(PERIOD_SEPARATOR, 2))
+            painter.drawLine(option.rect.topLeft(), option.rect.topRight())
+        painter.restore()
+
+        if index.column() == ACTION:
+            self._paint_button(painter, option.rect, index.data(), played)
+            return
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        if index.column() in _BOLD_COLUMNS:
+            option.font.setBold(True)
+        option.backgroundBrush = _NO_BRUSH
+        super().paint(painter, option, index)
+
+    def _paint_button(self, painter, rect: QRect, text: str, played: bool):
+        painter.save()
+        painter.setRenderHint(_ANTIALIASING)
+        button = rect.adjusted(6, 5, -6, -5)
+        painter.setPen(_NO_PEN)
+        painter.setBrush(CANCEL_COLOR if played else VALIDATE_COLOR)
+        painter.drawRoundedRect(button, 8, 8)
+        painter.setPen(_BUTTON_TEXT)
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        painter.drawText(button, _BUTTON_ALIGNMENT, text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if index.column() == ACTION and event.type() == QEvent.MouseButtonRelease \
+                and event.button() == Qt.LeftButton:
+            model.toggle(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    # =====================
+    # Édition des scores
+    # =====================
+    def createEditor(self, parent, option, index) -> Optional[QSpinBox]:
+        if index.column() not in _SCORE_COLUMNS:
+            return None
+        editor = QSpinBox(parent)
+        editor.setRange(0, MAX_SCORE)
+        editor.setAlignment(Qt.AlignCenter)
+        return editor
+
+    def setEditorData(self, editor: QSpinBox, index: QModelIndex):
+        editor.setValue(int(index.data(Qt.EditRole)))
+
+    def setModelData(self, editor: QSpinBox, model, index: QModelIndex):
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor: QSpinBox, option, index: QModelIndex):
+        editor.setGeometry(option.rect)
@@ -3,19 +3,25 @@ Vue pour afficher les matchs d'un tournoi et saisir les scores
 Version UI améliorée - Lisible et claire
 """
 
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from views.main_window import MainWindow
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox,
-    QPushButton, QScrollArea, QFrame
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QTableView, QHeaderView, QAbstractItemView
 )
 from PySide6.QtCore import Qt, Signal
 
-from models.game import Game
-from views.tournament_views.matches_card import MatchCard
+from controllers.tournament_controller import Change, RESULTS, STANDINGS
+from diagnostics.instrumentation import count
+from views.tournament_views.matches_model import (
+    MatchesTableModel, MatchDelegate, PERIOD, TABLE, SCORE1, SCORE2, TEAM1, TEAM2, ACTION
+)
+
+ROW_HEIGHT = 44
+COLUMN_WIDTHS = {PERIOD: 130, TABLE: 100, SCORE1: 90, SCORE2: 90, ACTION: 120}
 
 # =====================================================
 # MatchesView
@@ -23,14 +29,15 @@ from views.tournament_views.matches_card import MatchCard
 class MatchesView(QWidget):
     """Vue principale affichant les matchs du tournoi"""
     tournament_standings_requested = Signal(bool) # True = tournoi terminé, False = juste afficher le classement
+    back_requested = Signal()
+    # Démarrer (True) ou arrêter le serveur de saisie à distance
+    remote_entry_toggled = Signal(bool)
 
-    def __init__(self, parent: "MainWindow", matches_per_period: int = 4):
+    def __init__(self, parent: "MainWindow"):
         super().__init__(parent)
 
         self.tournament_controller = parent.tournament_controller
-        self.games: List[Game] = self.tournament_controller._tournament_model.games
-        self.matches_per_period = matches_per_period
-        self.match_cards: List[MatchCard] = []
+        self.setProperty("page", True)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(15, 15, 15, 15)
@@ -41,66 +48,40 @@ class MatchesView(QWidget):
         # =====================
         header = QLabel("🏆 Matchs du tournoi")
         header.setAlignment(Qt.AlignCenter)
-        header.setStyleSheet("""
-            font-size: 20px;
-            font-weight: bold;
-            color: white;
-        """)
+        header.setObjectName("matchesHeader")
         main_layout.addWidget(header)
 
-        num_periods = (len(self.games) + matches_per_period - 1) // matches_per_period
-        # =====================
-        # Scroll Area
-        # =====================
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("border: none;")
-
-        matches_container = QWidget()
-        matches_layout = QVBoxLayout(matches_container)
-        matches_layout.setSpacing(15)
+        # Adresse à ouvrir sur les téléphones des capitaines
+        self.remote_label = QLabel()
+        self.remote_label.setAlignment(Qt.AlignCenter)
+        self.remote_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.remote_label.hide()
+        main_layout.addWidget(self.remote_label)
 
         # =====================
-        # Génération périodes
+        # Liste des matchs : un modèle et un délégué, aucun widget par match
         # =====================
-        for period_num in range(num_periods):
-
-            start_idx = period_num * matches_per_period
-            end_idx = min(start_idx + matches_per_period, len(self.games))
-            period_games = self.games[start_idx:end_idx]
-
-            period_frame = QFrame()
-            period_frame.setStyleSheet("""
-                QFrame {
-                    background-color: #252538;
-                    border-radius: 12px;
-                    border: 1px solid #3a3a5a;
-                    padding: 12px;
-                }
-            """)
-
-            period_layout = QVBoxLayout(period_frame)
-            period_layout.setSpacing(10)
-
-            period_title = QLabel(f"🕒 Période {period_num + 1}")
-            period_title.setStyleSheet("""
-                font-size: 14px;
-                font-weight: bold;
-                color: #66ccff;
-            """)
-            period_layout.addWidget(period_title)
-
-            for table_num, game in enumerate(period_games, 1):
-                match_card = MatchCard(game, table_num)
-                match_card.controller_btn.clicked.connect(lambda _, mc=match_card: self._on_controller_match_btn_clicked(mc))
-                self.match_cards.append(match_card)
-                period_layout.addWidget(match_card)
-
-            matches_layout.addWidget(period_frame)
-
-        matches_layout.addStretch()
-        scroll_area.setWidget(matches_container)
-        main_layout.addWidget(scroll_area)
+        self.matches_model = MatchesTableModel(self.tournament_controller, self)
+        self.matches_table = QTableView()
+        self.matches_table.setModel(self.matches_model)
+        self.matches_table.setItemDelegate(MatchDelegate(self.matches_table))
+        self.matches_table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked | QAbstractItemView.AnyKeyPressed
+        )
+        self.matches_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.matches_table.setShowGrid(False)
+        self.matches_table.setWordWrap(False)
+        self.matches_table.verticalHeader().hide()
+        # Hauteur fixe : la vue n'a jamais à mesurer les lignes, même avec des milliers de matchs
+        self.matches_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.matches_table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        header_view = self.matches_table.horizontalHeader()
+        header_view.setSectionResizeMode(QHeaderView.Fixed)
+        for column in (TEAM1, TEAM2):
+            header_view.setSectionResizeMode(column, QHeaderView.Stretch)
+        for column, width in COLUMN_WIDTHS.items():
+            header_view.resizeSection(column, width)
+        main_layout.addWidget(self.matches_table)
 
         # =====================
         # Boutons bas
@@ -117,6 +98,12 @@ class MatchesView(QWidget):
         validate_btn.clicked.connect(self.on_validate_scores)
         buttons_layout.addWidget(validate_btn)
 
+        self.remote_btn = QPushButton("📡 Saisie à distance")
+        self.remote_btn.setMinimumHeight(45)
+        self.remote_btn.setCheckable(True)
+        self.remote_btn.toggled.connect(self.remote_entry_toggled)
+        buttons_layout.addWidget(self.remote_btn)
+
         back_btn = QPushButton("← Retour")
         back_btn.setMinimumHeight(45)
         back_btn.clicked.connect(self.on_back)
@@ -124,101 +111,36 @@ class MatchesView(QWidget):
 
         main_layout.addLayout(buttons_layout)
 
-        # =====================
-        # Style global
-        # =====================
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e2f;
-                color: white;
-                font-size: 13px;
-            }
-
-            QPushButton {
-                background-color: #3a3a5a;
-                border-radius: 8px;
-                font-weight: bold;
-                padding: 8px;
-            }
-
-            QPushButton:hover {
-                background-color: #50507a;
-            }
-
-            QPushButton:pressed {
-                background-color: #2a2a45;
-            }
-        """)
+    def set_remote_address(self, url: str, code: str = ""):
+        """
+        Affiche l'adresse du serveur de saisie à distance (chaîne vide :
+        serveur arrêté) et le code de l'événement à donner aux capitaines
+        """
+        self.remote_btn.blockSignals(True)
+        self.remote_btn.setChecked(bool(url))
+        self.remote_btn.blockSignals(False)
+        self.remote_label.setText(f"Saisie à distance : {url} — code de l'événement : {code}" if url else "")
+        self.remote_label.setVisible(bool(url))
+
+    def apply_changes(self, changes: List[Change]):
+        """Rafraîchit les lignes des résultats modifiés ; relit tout le calendrier sinon"""
+        if all(change.kind in (RESULTS, STANDINGS) for change in changes):
+            self.matches_model.results_changed(
+                game_id for change in changes for game_id in change.game_ids)
+        else:
+            self.matches_model.reload()
 
     # =====================================================
     # Slots UI
     # =====================================================
     def on_validate_scores(self):
-        for match_card in self.match_cards:
-            if not match_card.match_ended:
-                match_card.controller_btn.click()  
-
+        # Le classement est recalculé en arrière-plan avant d'être affiché
+        self.matches_model.validate_all(defer_standings=True)
         self.tournament_standings_requested.emit(True)
     
     def on_view_standings(self):
         self.tournament_standings_requested.emit(False)
 
     def on_back(self):
-        print("Retour")
-
-    def _on_controller_match_btn_clicked(self, mc: MatchCard):
-        if not mc.match_ended:
-            mc.match_ended = True
-            mc.score1_spinbox.setDisabled(True)
-            mc.score2_spinbox.setDisabled(True)
-            mc.setStyleSheet("""
-            #matchCard {
-                background-color: #2a4a2f;   /* vert léger */
-                border-radius: 10px;
-                padding: 12px;
-                border: 2px solid #66cc66;   /* bordure verte */
-                }
-            """)
-            mc.controller_btn.setText("✗ Annuler")
-            mc.controller_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #cc6666;   /* rouge léger */
-                    color: white;
-                    border-radius: 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #bb5555;
-                }
-                QPushButton:pressed {
-                    background-color: #994444;
-                }
-            """)
-            self.tournament_controller.validate_match(mc.game.id, mc.get_scores())
-        else: 
-            mc.match_ended = False
-            mc.score1_spinbox.setDisabled(False)
-            mc.score2_spinbox.setDisabled(False)
-            mc.setStyleSheet("""
-            #matchCard {
-                background-color: #2a2a40;   /* couleur normale */
-                border-radius: 10px;
-                padding: 12px;
-                border: 1px solid #3a3a5a;
-                }
-            """)
-            mc.controller_btn.setText("✓ Valider")
-            mc.controller_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #66cc66;
-                    color: white;
-                    border-radius: 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #55bb55;
-                }
-                QPushButton:pressed {
-                    background-color: #449944;
-                }
-            """)
+        count("views.matches.back")
+        self.back_requested.emit()
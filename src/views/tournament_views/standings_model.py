@@ -0,0 +1,174 @@
+"""
+Modèle et délégué du classement
+
+Une seule ``QTableView`` affiche tout le classement : le modèle garde une copie
+des lignes affichées (nom, points), abonnée au flux du classement
+(controllers.leaderboard), et n'insère ou ne retire que les lignes des
+équipes dont le rang ou les points ont changé ; le délégué dessine chaque
+carte visible (couleur du podium, rang, nom, points). Aucun widget n'est
+créé par équipe.
+
+La vue est une table à hauteur de ligne fixe plutôt qu'un ``QListView`` :
+celui-ci recalcule la disposition de toutes ses lignes à chaque ligne
+modifiée, insérée ou retirée, pas la table.
+"""
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt, QTimer
+from PySide6.QtGui import QPainter, QPen
+from PySide6.QtWidgets import (
+    QAbstractItemView, QHeaderView, QStyledItemDelegate, QStyleOptionViewItem, QTableView
+)
+
+from controllers.leaderboard import LeaderboardFeed, LeaderboardUpdate, Subscription
+from diagnostics.instrumentation import timed
+from views.theme import (
+    CARD_BACKGROUND, CARD_BORDER, PODIUM_COLORS, RANK_COLOR, SCORE_COLOR, TEAM_NAME_COLOR
+)
+
+PODIUM_MEDALS = ("🥇", "🥈", "🥉")
+
+# Rôles propres au modèle, utilisés par le délégué
+RankRole = Qt.UserRole + 1
+PointsRole = Qt.UserRole + 2
+
+# Voir matches_model : les énumérations Qt sont lues une seule fois
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_RANK_ALIGNMENT = Qt.AlignCenter
+_NAME_ALIGNMENT = Qt.AlignLeft | Qt.AlignVCenter
+_SCORE_ALIGNMENT = Qt.AlignRight | Qt.AlignVCenter
+_ANTIALIASING = QPainter.RenderHint.Antialiasing
+
+CARD_HEIGHT = 80
+CARD_SPACING = 12
+
+Row = Tuple[str, int]
+
+
+class StandingsModel(QAbstractListModel):
+    """Lignes du classement : (nom de l'équipe, points), par rang"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Row] = []
+        self._subscription: Optional[Subscription] = None
+
+    def follow(self, feed: LeaderboardFeed):
+        """S'abonne au flux du classement et affiche le classement courant"""
+        self.unfollow()
+        # Réveillé une fois par rafale : toutes les mises à jour reçues
+        # entre-temps sont appliquées au prochain tour de la boucle d'événements
+        self._subscription = feed.subscribe(lambda: QTimer.singleShot(0, self, self.sync))
+        self.sync()
+
+    def unfollow(self):
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+
+    def sync(self):
+        """Applique les mises à jour en attente du flux"""
+        if self._subscription is not None:
+            for update in self._subscription.take():
+                self.apply_update(update)
+
+    @timed("views.standings.apply_update")
+    def apply_update(self, update: LeaderboardUpdate):
+        """Applique une mise à jour du flux (voir controllers.leaderboard pour l'ordre des opérations)"""
+        if update.full:
+            self.beginResetModel()
+            self._rows = [(change.name, change.points) for change in update.changes]
+            self.endResetModel()
+            return
+        root = QModelIndex()
+        rows = self._rows
+        for change in sorted(update.changes, key=lambda change: change.previous, reverse=True):
+            if change.previous:
+                row = change.previous - 1
+                self.beginRemoveRows(root, row, row)
+                del rows[row]
+                self.endRemoveRows()
+        for change in update.changes:
+            if change.rank:
+                row = change.rank - 1
+                self.beginInsertRows(root, row, row)
+                rows.insert(row, (change.name, change.points))
+                self.endInsertRows()
+
+    # =====================
+    # Lecture
+    # =====================
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name, points = self._rows[index.row()]
+        if role == _DISPLAY_ROLE:
+            return name
+        if role == RankRole:
+            return index.row() + 1
+        if role == PointsRole:
+            return points
+        return None
+
+
+class StandingsDelegate(QStyledItemDelegate):
+    """Dessine une carte par rang : médaille et rang, nom de l'équipe, points"""
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), CARD_HEIGHT + CARD_SPACING)
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        rank = index.data(RankRole)
+        background, border = PODIUM_COLORS.get(rank, (CARD_BACKGROUND, CARD_BORDER))
+        card = option.rect.adjusted(10, CARD_SPACING // 2, -10, -CARD_SPACING // 2)
+
+        painter.save()
+        painter.setRenderHint(_ANTIALIASING)
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(background)
+        painter.drawRoundedRect(card, 10, 10)
+
+        content = card.adjusted(12, 0, -12, 0)
+        font = painter.font()
+        font.setBold(True)
+        medal = PODIUM_MEDALS[rank - 1] if rank <= len(PODIUM_MEDALS) else "  "
+        self._draw_text(painter, font, 18, RANK_COLOR,
+                        QRect(content.left(), content.top(), 90, content.height()),
+                        _RANK_ALIGNMENT, f"{medal} #{rank}")
+        score_width = 110
+        self._draw_text(painter, font, 16, SCORE_COLOR,
+                        QRect(content.right() - score_width, content.top(), score_width, content.height()),
+                        _SCORE_ALIGNMENT, f"{index.data(PointsRole)} pts")
+        self._draw_text(painter, font, 15, TEAM_NAME_COLOR,
+                        content.adjusted(110, 0, -score_width - 10, 0),
+                        _NAME_ALIGNMENT, index.data())
+        painter.restore()
+
+    @staticmethod
+    def _draw_text(painter, font, pixel_size: int, color, rect: QRect, alignment, text: str):
+        font.setPixelSize(pixel_size)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(rect, alignment, text)
+
+
+def create_standings_table(model: StandingsModel) -> QTableView:
+    """Table d'une colonne affichant le classement de model, une carte par rang"""
+    table = QTableView()
+    table.setObjectName("standingsList")
+    table.setModel(model)
+    table.setItemDelegate(StandingsDelegate(table))
+    table.setSelectionMode(QAbstractItemView.NoSelection)
+    table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    table.setShowGrid(False)
+    table.horizontalHeader().hide()
+    table.horizontalHeader().setStretchLastSection(True)
+    table.verticalHeader().hide()
+    # Hauteur fixe : la table n'a jamais à mesurer les lignes
+    table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    table.verticalHeader().setDefaultSectionSize(CARD_HEIGHT + CARD_SPACING)
+    return table
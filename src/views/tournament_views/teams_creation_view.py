@@ -6,23 +6,30 @@ Vue minimale pour créer un tournoi :
 Cette vue ne lance pas encore le tournoi, elle collecte uniquement les équipes.
 """
 
-from typing import TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 if TYPE_CHECKING:
-    from main_window import MainWindow
+    from views.main_window import MainWindow
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QListWidget, QListWidgetItem, QMessageBox
+    QPushButton, QListWidget, QListWidgetItem, QMessageBox, QFileDialog
 )
 from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
 
+from controllers.team_import import ImportReport, read_team_rows
+from controllers.tournament_controller import Change, RESET
+
+# Nombre maximum d'erreurs détaillées dans le message d'un import refusé
+MAX_REPORTED_ERRORS = 30
+
 class TeamsCreationView(QWidget):
     """Vue pour créer des équipes de tournoi"""
 
-    def __init__(self, parent: MainWindow): 
+    def __init__(self, parent: "MainWindow"): 
         super().__init__(parent)
         self.tournament_controller = parent.tournament_controller
+        self.workers = parent.workers
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -55,6 +62,11 @@ class TeamsCreationView(QWidget):
         add_btn.clicked.connect(self._add_team)
         form_layout.addWidget(add_btn)
 
+        import_btn = QPushButton("Importer un fichier…")
+        import_btn.setToolTip("Fichier CSV ou XLSX : équipe, joueur 1, joueur 2")
+        import_btn.clicked.connect(self._import_teams)
+        form_layout.addWidget(import_btn)
+
         layout.addLayout(form_layout)
 
         # Liste des équipes ajoutées
@@ -71,15 +83,32 @@ class TeamsCreationView(QWidget):
         clear_btn.clicked.connect(self._clear_teams)
         btn_layout.addWidget(clear_btn)
 
+        # Le calendrier est généré par la fenêtre principale, en arrière-plan
         self.start_btn = QPushButton("Lancer le tournoi")
         self.start_btn.setEnabled(False)
-        self.start_btn.clicked.connect(self._start_tournament)
         btn_layout.addWidget(self.start_btn)
 
         layout.addLayout(btn_layout)
 
+    def reset(self):
+        """Prépare la vue pour un nouveau tournoi"""
+        self.teams_list.clear()
+        self.team_name_edit.clear()
+        self.player1_edit.clear()
+        self.player2_edit.clear()
+        self.start_btn.setEnabled(False)
         self.auto_add_teams()  # TODO : A supprimer c'est juste pour les testes
 
+    def apply_changes(self, changes: List[Change]):
+        # Les inscriptions faites depuis cette vue y sont déjà affichées :
+        # seul un tournoi rechargé ou effacé ailleurs oblige à relire la liste
+        if any(change.kind == RESET for change in changes):
+            self.teams_list.clear()
+            self._add_team_items([
+                (team.name, team.player1.name, team.player2.name)
+                for team in self.tournament_controller.teams
+            ])
+
     def _add_team(self):
         """Ajoute une équipe avec deux joueurs si le formulaire est valide"""
         team_name = self.team_name_edit.text().strip()
@@ -108,21 +137,56 @@ class TeamsCreationView(QWidget):
         self.player2_edit.clear()
         self.team_name_edit.setFocus()
 
+    def _import_teams(self):
+        """Inscrit toutes les équipes d'un fichier CSV ou XLSX"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Importer des équipes", "", "Équipes (*.csv *.xlsx);;Tous les fichiers (*)"
+        )
+        if path:
+            # Le fichier est lu en arrière-plan, les équipes inscrites ensuite en une passe
+            self.workers.submit(
+                "Lecture du fichier…",
+                lambda progress: list(read_team_rows(path)),
+                on_result=lambda rows: self._show_import_report(self.tournament_controller.import_teams(rows)),
+                on_error=lambda error: self._show_import_report(ImportReport(errors=[str(error)])),
+            )
+
+    def _show_import_report(self, report: ImportReport):
+        if not report.ok:
+            shown = report.errors[:MAX_REPORTED_ERRORS]
+            if len(report.errors) > len(shown):
+                shown.append(f"… et {len(report.errors) - len(shown)} autre(s) erreur(s).")
+            QMessageBox.warning(self, "Import impossible", "Aucune équipe n'a été ajoutée :\n\n" + "\n".join(shown))
+            return
+        self._add_team_items(report.added)
+
+    def _add_team_items(self, teams: List[Tuple[str, str, str]]):
+        """Ajoute les équipes à la liste en une seule insertion"""
+        self.teams_list.setUpdatesEnabled(False)
+        self.teams_list.addItems([self._team_item_text(*team) for team in teams])
+        self.teams_list.setUpdatesEnabled(True)
+        self.start_btn.setEnabled(self._check_start_conditions())
+
     def _remove_selected_team(self):
         idx = self.teams_list.currentRow()
         if idx < 0:
             return
-        self.tournament_controller.remove_team(self._get_team_name_from_item(self.teams_list.item(idx)))
+        if not self.tournament_controller.remove_team(self._get_team_name_from_item(self.teams_list.item(idx))):
+            return
         self.teams_list.takeItem(idx)
         self.start_btn.setEnabled(self._check_start_conditions())
 
     def _clear_teams(self):
+        if not self.tournament_controller.remove_all_teams():
+            return
         self.teams_list.clear()
-        self.tournament_controller.remove_all_teams()
         self.start_btn.setEnabled(self._check_start_conditions())
 
     def _create_team_list_item(self, team_name: str, p1: str, p2: str) -> QListWidgetItem:
-        return QListWidgetItem(f"{team_name} — ({p1} / {p2})")
+        return QListWidgetItem(self._team_item_text(team_name, p1, p2))
+
+    def _team_item_text(self, team_name: str, p1: str, p2: str) -> str:
+        return f"{team_name} — ({p1} / {p2})"
     
     def _get_team_name_from_item(self, item: QListWidgetItem) -> str:
         text = item.text()
@@ -130,24 +194,10 @@ class TeamsCreationView(QWidget):
 
     def _check_start_conditions(self) -> bool:
         return self.teams_list.count() >= 2
-    
-    def _start_tournament(self):
-        self.tournament_controller.start_tournament()
-        
-        
-
-
-
-
 
     # TODO : A supprimer c'est juste pour les testes:
     def auto_add_teams(self):
         """Ajoute automatiquement des équipes pour les tests"""
-        for i in range(1, 9):
-            team_name = f"Team {i}"
-            p1 = f"Player{i}A"
-            p2 = f"Player{i}B"
-            self.tournament_controller.add_team(team_name, p1, p2)
-            item = self._create_team_list_item(team_name, p1, p2)
-            self.teams_list.addItem(item)
-        self.start_btn.setEnabled(self._check_start_conditions())
+        rows = ((i, [f"Team {i}", f"Player{i}A", f"Player{i}B"]) for i in range(1, 9))
+        report = self.tournament_controller.import_teams(rows)
+        self._add_team_items(report.added)
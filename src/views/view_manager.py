@@ -0,0 +1,84 @@
+"""
+Cycle de vie des vues de la fenêtre principale
+
+Chaque vue est créée une seule fois, à sa première ouverture, puis
+réutilisée : naviguer entre les écrans ne crée ni ne détruit aucun widget.
+Les vues sont tenues à jour par les notifications du contrôleur (voir
+TournamentController.add_listener) : la vue affichée les reçoit
+immédiatement, les vues masquées les accumulent et ne les appliquent qu'à
+leur prochain affichage.
+
+Une vue gérée peut définir ``apply_changes(changes: List[Change])``.
+"""
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtWidgets import QStackedWidget, QWidget
+
+from controllers.tournament_controller import Change, RESET, TournamentController
+from diagnostics.instrumentation import count, span
+
+ViewFactory = Callable[[], QWidget]
+
+
+class ViewManager:
+    """Crée, met en cache et rafraîchit les vues d'un QStackedWidget"""
+
+    def __init__(self, stacked_widget: QStackedWidget, controller: TournamentController):
+        self._stacked_widget = stacked_widget
+        self._controller = controller
+        self._factories: Dict[str, ViewFactory] = {}
+        self._views: Dict[str, QWidget] = {}
+        # Modifications reçues pendant qu'une vue était masquée
+        self._pending: Dict[str, List[Change]] = {}
+        controller.add_listener(self._on_change)
+
+    def register(self, name: str, factory: ViewFactory):
+        """Déclare une vue ; elle ne sera construite qu'à sa première ouverture"""
+        self._factories[name] = factory
+
+    def get(self, name: str) -> QWidget:
+        """Retourne la vue name, construite au premier appel"""
+        view = self._views.get(name)
+        if view is None:
+            with span(f"views.build.{name}"):
+                view = self._views[name] = self._factories[name]()
+            self._pending[name] = []
+            self._stacked_widget.addWidget(view)
+        return view
+
+    def cached(self, name: str) -> Optional[QWidget]:
+        """Retourne la vue name si elle a déjà été construite"""
+        return self._views.get(name)
+
+    def show(self, name: str) -> QWidget:
+        """Affiche la vue name après lui avoir appliqué les modifications en attente"""
+        view = self.get(name)
+        with span(f"views.show.{name}"):
+            pending, self._pending[name] = self._pending[name], []
+            if pending:
+                count("views.pending_changes", len(pending))
+                self._apply(view, pending)
+            self._stacked_widget.setCurrentWidget(view)
+        return view
+
+    def close(self):
+        """Se désabonne du contrôleur"""
+        self._controller.remove_listener(self._on_change)
+
+    def _on_change(self, change: Change):
+        current = self._stacked_widget.currentWidget()
+        for name, view in self._views.items():
+            if view is current:
+                self._apply(view, [change])
+                continue
+            pending = self._pending[name]
+            # Une réinitialisation rend inutiles les modifications précédentes
+            if change.kind == RESET:
+                pending.clear()
+            pending.append(change)
+
+    @staticmethod
+    def _apply(view: QWidget, changes: List[Change]):
+        apply_changes = getattr(view, "apply_changes", None)
+        if apply_changes is not None:
+            apply_changes(changes)
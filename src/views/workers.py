@@ -0,0 +1,148 @@
+"""
+Exécution des calculs longs hors du thread de l'interface
+
+Une tâche est une fonction ``work(progress)`` exécutée par un QThreadPool ;
+son résultat, son avancement et ses erreurs sont remis par des signaux Qt,
+donc dans le thread de l'interface. Le rappel ``progress(fait, total)`` sert
+aussi de point d'annulation : une fois la tâche annulée, il lève
+TaskCancelled, qui interrompt le calcul.
+
+Les tâches ne modifient jamais le contrôleur : elles calculent sur des
+objets détachés, que le rappel de résultat installe ensuite (voir
+TournamentController.prepare, plan_tournament, compute_standings).
+"""
+import threading
+from typing import Any, Callable, Optional, Set, TYPE_CHECKING
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+if TYPE_CHECKING:
+    # Le pool est créé avec la fenêtre, avant le chargement du contrôleur
+    from controllers.tournament_controller import Progress
+
+Work = Callable[["Progress"], Any]
+
+
+class TaskCancelled(Exception):
+    """Levée par le rappel d'avancement d'une tâche annulée"""
+
+
+class TaskSignals(QObject):
+    """Signaux d'une tâche, reçus dans le thread de l'interface"""
+    progress = Signal(int, int)
+    succeeded = Signal(object)
+    failed = Signal(object)
+    cancelled = Signal()
+    # Émis en dernier, quelle que soit l'issue
+    finished = Signal()
+
+
+class Task(QRunnable):
+    """Une fonction à exécuter dans le pool, annulable"""
+
+    def __init__(self, label: str, work: Work):
+        super().__init__()
+        # Le pool garde la tâche jusqu'à la fin (voir WorkerPool._tasks)
+        self.setAutoDelete(False)
+        self.label = label
+        self.signals = TaskSignals()
+        self._work = work
+        self._cancel_event = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Demande l'arrêt de la tâche, effectif à son prochain point d'avancement"""
+        self._cancel_event.set()
+
+    def _progress(self, done: int, total: int):
+        if self._cancel_event.is_set():
+            raise TaskCancelled
+        self.signals.progress.emit(done, total)
+
+    def run(self):
+        try:
+            if self._cancel_event.is_set():
+                raise TaskCancelled
+            result = self._work(self._progress)
+        except TaskCancelled:
+            self.signals.cancelled.emit()
+        except Exception as error:  # remonté à l'interface par le signal failed
+            self.signals.failed.emit(error)
+        else:
+            if self._cancel_event.is_set():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.succeeded.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+class WorkerPool(QObject):
+    """
+    Pool de tâches en arrière-plan
+
+    Par défaut un seul thread : les tâches s'exécutent dans l'ordre de leur
+    soumission, ce qui garantit qu'un résultat est installé avant que la
+    tâche suivante ne lise l'état du tournoi.
+    """
+    # Une tâche au moins est en attente ou en cours
+    busy_changed = Signal(bool)
+    # (libellé de la tâche, fait, total)
+    progress = Signal(str, int, int)
+
+    def __init__(self, parent: Optional[QObject] = None, max_threads: int = 1):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._tasks: Set[Task] = set()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._tasks)
+
+    def submit(self, label: str, work: Work,
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None) -> Task:
+        """
+        Lance work(progress) en arrière-plan
+
+        Args:
+            label: Le libellé affiché pendant la tâche
+            work: Le calcul ; il ne doit pas modifier le contrôleur ni les widgets
+            on_result: Appelé avec le résultat, dans le thread de l'interface
+            on_error: Appelé avec l'exception levée par work
+
+        Returns:
+            La tâche, pour pouvoir l'annuler
+        """
+        task = Task(label, work)
+        if on_result is not None:
+            task.signals.succeeded.connect(on_result)
+        if on_error is not None:
+            task.signals.failed.connect(on_error)
+        task.signals.progress.connect(lambda done, total: self.progress.emit(label, done, total))
+        task.signals.finished.connect(lambda: self._finished(task))
+        was_busy = self.busy
+        self._tasks.add(task)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        self.progress.emit(label, 0, 0)
+        self._pool.start(task)
+        return task
+
+    def cancel_all(self):
+        """Annule les tâches en attente et demande l'arrêt de celle en cours"""
+        for task in self._tasks:
+            task.cancel()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Attend la fin des tâches ; retourne False si le délai a expiré"""
+        return self._pool.waitForDone(msecs)
+
+    def _finished(self, task: Task):
+        self._tasks.discard(task)
+        if not self._tasks:
+            self.busy_changed.emit(False)